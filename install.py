@@ -12,15 +12,21 @@ Features:
 """
 
 import argparse
-import json
+import functools
 import platform
 import re
-import shutil
-import subprocess
 import sys
 from pathlib import Path
 import os
 import site
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson is optional. If it is not installed the json module is used.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class Installer:
@@ -33,6 +39,8 @@ class Installer:
     DISPLAY_ATTR_FG_GREEN = 32
     DISPLAY_ATTR_FG_RED = 31
     DISPLAY_RESET_ESCAPE_SEQ = "\x1b[0m"
+    INFO_ESCAPE_SEQ = f"\x1b[{DISPLAY_ATTR_FG_GREEN:01d};{DISPLAY_ATTR_BRIGHT:02d}m"
+    ERROR_ESCAPE_SEQ = f"\x1b[{DISPLAY_ATTR_FG_RED:01d};{DISPLAY_ATTR_BRIGHT:02d}m"
 
     INSTALL_ARG = "install"
     UNINSTALL_ARG = "uninstall"
@@ -40,6 +48,10 @@ class Installer:
     SWITCH_ARG = "switch"
     ALL_COMMANDS = (INSTALL_ARG, UNINSTALL_ARG, STATUS_ARG, SWITCH_ARG)
 
+    # The number of characters read from the start of a .bat file when
+    # checking if it is one of our launchers.
+    LAUNCHER_HEAD_CHARS = 512
+
     HELP_ARG_1 = '-h'
     HELP_ARG_2 = '--help'
     HELP_ARGS = (HELP_ARG_1, HELP_ARG_2)
@@ -50,12 +62,12 @@ class Installer:
     @staticmethod
     def GetInfoEscapeSeq():
         """@return the info level ANSI escape sequence."""
-        return "\x1b[{:01d};{:02d}m".format(Installer.DISPLAY_ATTR_FG_GREEN, Installer.DISPLAY_ATTR_BRIGHT)
+        return Installer.INFO_ESCAPE_SEQ
 
     @staticmethod
     def GetErrorEscapeSeq():
         """@return the warning level ANSI escape sequence."""
-        return "\x1b[{:01d};{:02d}m".format(Installer.DISPLAY_ATTR_FG_RED, Installer.DISPLAY_ATTR_BRIGHT)
+        return Installer.ERROR_ESCAPE_SEQ
 
     def __init__(self, handle_cmd_line=True, color=True, use_emojis=True):
         """@brief Constructor
@@ -68,8 +80,32 @@ class Installer:
                                   """
         self._colour = color
         self._use_emojis = use_emojis
+        # Build the message prefixes once rather than on every info/error call.
+        if color and use_emojis:
+            self._info_prefix = 'ℹ️  '
+            self._error_prefix = '❌  '
+        elif color:
+            self._info_prefix = f'{Installer.INFO_ESCAPE_SEQ}INFO{Installer.DISPLAY_RESET_ESCAPE_SEQ}:  '
+            self._error_prefix = f'{Installer.ERROR_ESCAPE_SEQ}ERROR{Installer.DISPLAY_RESET_ESCAPE_SEQ}: '
+        else:
+            self._info_prefix = 'INFO:  '
+            self._error_prefix = 'ERROR: '
+        # Emoji error messages have always been sent to stdout.
+        self._error_to_stderr = not (color and use_emojis)
+        # Read the platform once as it is needed by most install/uninstall steps.
+        self._system = platform.system()
+        # Launchers are created from several threads so serialise console output.
+        self._print_lock = threading.Lock()
+        # Parsed install.json records keyed by version path.
+        self._meta_cache = {}
+        # The launcher folders are used repeatedly so only build their paths once.
+        self._bin_dirs = {}
+        # The 'current' version link path for each install base.
+        self._current_links = {}
         if self.APP_NAME is None or self.CMD_DICT is None:
             raise Exception("BUG: Installer.APP_NAME and Installer.CMD_DICT must be defined in subclass of the Installer class.")
+        # Example: mpy_tool-0.45-py3-none-any.whl → 0.45
+        self._wheel_version_re = re.compile(rf"{re.escape(self.APP_NAME)}-(\d+(?:\.\d+)*)")
 
         if handle_cmd_line:
             self.parse_args()
@@ -78,24 +114,14 @@ class Installer:
     def info(self, text):
         """@brief Present an info level message to the user.
            @param text The line of text to be presented to the user."""
-        if self._colour:
-            if self._use_emojis:
-                print('ℹ️  ' + text)
-            else:
-                print('{}INFO{}:  {}'.format(Installer.GetInfoEscapeSeq(), Installer.DISPLAY_RESET_ESCAPE_SEQ, text))
-        else:
-            print('INFO:  {}'.format(text))
+        with self._print_lock:
+            print(f'{self._info_prefix}{text}')
 
     def error(self, text):
         """@brief Present an error level message to the user.
            @param text The line of text to be presented to the user."""
-        if self._colour:
-            if self._use_emojis:
-                print('❌  ' + text)
-            else:
-                print('{}ERROR{}: {}'.format(Installer.GetErrorEscapeSeq(), Installer.DISPLAY_RESET_ESCAPE_SEQ, text), file=sys.stderr)
-        else:
-            print('ERROR: {}'.format(text), file=sys.stderr)
+        with self._print_lock:
+            print(f'{self._error_prefix}{text}', file=sys.stderr if self._error_to_stderr else sys.stdout)
 
     def parse_args(self):
         # Check to see if the user entered a command
@@ -167,31 +193,37 @@ class Installer:
         sys.exit(1)
 
     def get_bin_dir(self, mode):
-        system = platform.system()
-        if system == "Windows":
-            return (
-                Path.home() / "AppData" / "Local" / "Programs" / self.APP_NAME / "bin"
-                if mode == "user"
-                else Path("C:/Program Files") / self.APP_NAME / "bin"
-            )
-        else:
-            return Path.home() / ".local" / "bin" if mode == "user" else Path("/usr/local/bin")
+        bin_dir = self._bin_dirs.get(mode)
+        if bin_dir is None:
+            system = self._system
+            if system == "Windows":
+                bin_dir = (
+                    Path.home() / "AppData" / "Local" / "Programs" / self.APP_NAME / "bin"
+                    if mode == "user"
+                    else Path("C:/Program Files") / self.APP_NAME / "bin"
+                )
+            else:
+                bin_dir = Path.home() / ".local" / "bin" if mode == "user" else Path("/usr/local/bin")
+            self._bin_dirs[mode] = bin_dir
+        return bin_dir
 
-    def get_desktop_dir(self):
+    @functools.cached_property
+    def desktop_dir(self):
         return Path.home() / ".local" / "share" / "applications"
 
-    def get_macos_app_dir(self):
+    @functools.cached_property
+    def macos_app_dir(self):
         return Path.home() / "Applications"   # this is where your installer puts .app
 
     def all_versions(self, base):
-        return sorted(
-            d.name for d in base.iterdir()
-            if d.is_dir() and d.name != "current"
-        )
+        with os.scandir(base) as it:
+            return sorted(
+                e.name for e in it
+                if e.name != "current" and e.is_dir(follow_symlinks=False)
+            )
 
     def detect_version_from_wheel(self, wheel_path: Path):
-        # Example: mpy_tool-0.45-py3-none-any.whl → 0.45
-        m = re.search(rf"{self.APP_NAME}-(\d+(?:\.\d+)*)", wheel_path.name)
+        m = self._wheel_version_re.search(wheel_path.name)
         if not m:
             self.die(f"Could not auto-detect version from wheel filename '{wheel_path.name}'")
         return m.group(1)
@@ -212,47 +244,94 @@ class Installer:
 
         return requested
 
+    def _link_target_under(self, link, folder):
+        """@brief Check where a symlink points without resolving the full path.
+           @param link The path of the symlink.
+           @param folder The folder to check against.
+           @return True if link is a symlink whose target is inside folder."""
+        try:
+            target = os.readlink(link)
+        except OSError:
+            return False
+        if not os.path.isabs(target):
+            target = os.path.normpath(os.path.join(os.path.dirname(link), target))
+        return target.startswith(str(folder) + os.sep)
+
+    def _fast_rmtree(self, path):
+        """@brief Remove a folder and everything in it, ignoring any errors as
+                  shutil.rmtree(path, ignore_errors=True) does. The type information
+                  from os.scandir() is used so no extra stat is needed per entry.
+                  As with shutil.rmtree a symlink to a folder is not followed.
+           @param path The folder to remove."""
+        if os.path.islink(path):
+            return
+        self._rmtree_entries(path)
+
+    def _rmtree_entries(self, path):
+        """@brief Recursive part of _fast_rmtree().
+           @param path The folder to remove."""
+        try:
+            with os.scandir(path) as it:
+                for e in it:
+                    try:
+                        if e.is_dir(follow_symlinks=False):
+                            self._rmtree_entries(e.path)
+                        else:
+                            os.unlink(e.path)
+                    except OSError:
+                        pass
+            os.rmdir(path)
+        except OSError:
+            pass
+
     def remove_active_launchers(self, base: Path, mode: str):
         """
         Remove all launchers that point into ~/.mpy_tool.
         Works even if install.json is missing.
         """
         bin_dir = self.get_bin_dir(mode)
-        system = platform.system()
+        system = self._system
 
         if not bin_dir.exists():
             return
 
-        for p in bin_dir.iterdir():
-            if system == "Windows" and p.suffix == ".bat":
-                txt = p.read_text(errors="ignore")
-                if str(base) in txt:
-                    p.unlink()
-            else:
-                if p.is_symlink():
-                    try:
-                        resolved = p.resolve()
-                        if resolved.is_relative_to(base):
-                            p.unlink()
-                    except Exception:
-                        pass
+        with os.scandir(bin_dir) as it:
+            for e in it:
+                if system == "Windows" and e.name.endswith(".bat"):
+                    # Our launchers hold the install base path in their first lines
+                    # so there is no need to read the whole file.
+                    with open(e.path, errors="ignore") as f:
+                        head = f.read(Installer.LAUNCHER_HEAD_CHARS)
+                    if str(base) in head:
+                        os.unlink(e.path)
+                else:
+                    if e.is_symlink():
+                        try:
+                            if self._link_target_under(e.path, base):
+                                os.unlink(e.path)
+                        except Exception:
+                            pass
 
     def remove_active_gui_launchers(self, base: Path):
-        system = platform.system()
+        system = self._system
 
         if system == "Linux":
-            d = self.get_desktop_dir()
+            d = self.desktop_dir
             if d.exists():
-                for f in d.glob("*.desktop"):
-                    txt = f.read_text(errors="ignore")
-                    if str(base) in txt:
-                        f.unlink()
+                with os.scandir(d) as it:
+                    for e in it:
+                        if e.name.endswith(".desktop"):
+                            txt = Path(e.path).read_text(errors="ignore")
+                            if str(base) in txt:
+                                os.unlink(e.path)
 
         if system == "Darwin":
-            d = self.get_macos_app_dir()
+            d = self.macos_app_dir
             if d.exists():
-                for app in d.glob("*.app"):
-                    shutil.rmtree(app, ignore_errors=True)
+                with os.scandir(d) as it:
+                    for e in it:
+                        if e.name.endswith(".app"):
+                            self._fast_rmtree(e.path)
 
     def switch_version(self):
         base = Path(self.args.base).resolve()
@@ -277,32 +356,45 @@ class Installer:
         self.info(f"{self.APP_NAME} now using version {version}")
 
     def run_system_cmd(self, args, show_output=True):
+        import subprocess
         self.info(f"CMD: {" ".join(args)}")
         if show_output:
             subprocess.check_call(args)
         else:
             subprocess.check_call(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
-    def create_venv(self, venv_path: Path, python=sys.executable):
+    def create_venv(self, venv_path: Path):
         if not venv_path.exists():
-            args = [python, "-m", "venv", "--system-site-packages", str(venv_path)]
-            self.run_system_cmd(args)
+            import venv
+            # Create the venv in this process rather than starting another python interpreter.
+            self.info(f"Creating virtualenv {venv_path}")
+            builder = venv.EnvBuilder(system_site_packages=True,
+                                      symlinks=self._system != "Windows",
+                                      with_pip=True)
+            builder.create(str(venv_path))
 
     def install_wheel(self, venv_path: Path, wheel: Path):
-        python_exe = venv_path / ("Scripts/python.exe" if platform.system() == "Windows" else "bin/python")
-        args = [str(python_exe), "-m", "pip", "install", "--upgrade", str(wheel)]
-        self.run_system_cmd(args)
+        python_exe = venv_path / ("Scripts/python.exe" if self._system == "Windows" else "bin/python")
+        # Upgrade pip and install the wheel in a single pip invocation.
+        args = [str(python_exe), "-m", "pip", "install", "--upgrade", "--no-compile",
+                "--disable-pip-version-check", "pip", str(wheel)]
+        try:
+            self.run_system_cmd(args)
+
+        except Exception:
+            # The venv may have been created without pip so bootstrap it and retry.
+            self.ensure_pip(venv_path)
+            self.run_system_cmd(args)
 
     def remove_launchers_for_version(self, base, version, mode):
         bin_dir = self.get_bin_dir(mode)
-        desktop_dir = self.get_desktop_dir()
-        mac_app_dir = self.get_macos_app_dir()
+        desktop_dir = self.desktop_dir
+        mac_app_dir = self.macos_app_dir
 
-        meta_file = base / version / "install.json"
-        if not meta_file.exists():
+        meta = self._read_meta(base / version)
+        if meta is None:
             return
 
-        meta = json.loads(meta_file.read_text())
         cmds = meta["commands"]
 
         for cmd in cmds:
@@ -310,8 +402,7 @@ class Installer:
             p = bin_dir / cmd
             if p.exists() or p.is_symlink():
                 try:
-                    target = p.resolve()
-                    if str(base / version) in str(target):
+                    if self._link_target_under(p, base / version):
                         p.unlink()
                 except Exception:
                     pass
@@ -324,7 +415,7 @@ class Installer:
             # macOS .app bundles
             app = mac_app_dir / f"{cmd}.app"
             if app.exists():
-                shutil.rmtree(app, ignore_errors=True)
+                self._fast_rmtree(app)
 
     def remove_windows_launchers(self, mode):
         bin_dir = self.get_bin_dir(mode)
@@ -335,57 +426,93 @@ class Installer:
             if bat.exists():
                 bat.unlink()
 
+    def _get_user_path_map(self):
+        """@brief Get the user PATH entries keyed by their normalised (lower case, no trailing \\) form.
+           @return A tuple containing the current user PATH string and a dict mapping
+                   each normalised entry to the original entry."""
+        current = self.get_user_path()
+        norm_map = {p.lower().rstrip("\\"): p for p in current.split(";") if p}
+        return current, norm_map
+
     def remove_from_user_path(self, dir_to_remove):
         dir_to_remove = str(dir_to_remove).lower().rstrip("\\")
-        current = self.get_user_path()
-        parts = [p for p in current.split(";") if p]
+        current, norm_map = self._get_user_path_map()
+
+        if dir_to_remove not in norm_map:
+            return False   # not present
 
-        new_parts = []
-        for p in parts:
-            if p.lower().rstrip("\\") != dir_to_remove:
-                new_parts.append(p)
+        # Rebuild from the original entries so the order of the PATH is kept.
+        new = ";".join(p for p in current.split(";") if p and p.lower().rstrip("\\") != dir_to_remove)
+        self.set_user_path(new)
+        return True
 
-        new = ";".join(new_parts)
-        if new != current:
-            self.set_user_path(new)
-            return True
-        return False
+    def _json_dumps(self, obj):
+        """@brief Convert an object to indented JSON.
+           @param obj The object to convert.
+           @return The JSON as UTF-8 bytes."""
+        if orjson:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        import json
+        return json.dumps(obj, indent=2).encode()
+
+    def _json_loads(self, data):
+        """@brief Parse JSON.
+           @param data The JSON bytes.
+           @return The parsed object."""
+        if orjson:
+            return orjson.loads(data)
+        import json
+        return json.loads(data)
+
+    def _read_meta(self, version_path: Path):
+        """@brief Read the install.json file for a version. The parsed record is cached
+                  so that it is only read from disk once.
+           @param version_path The folder of the installed version.
+           @return The install record dict or None if the install.json file is missing."""
+        meta = self._meta_cache.get(version_path)
+        if meta is None:
+            f = version_path / "install.json"
+            if not f.exists():
+                return None
+            meta = self._json_loads(f.read_bytes())
+            self._meta_cache[version_path] = meta
+        return meta
 
     def load_install_record(self, version_path: Path):
-        f = version_path / "install.json"
-        if not f.exists():
+        meta = self._read_meta(version_path)
+        if meta is None:
             self.die(f"Missing install.json in {version_path}")
-        return json.loads(f.read_text())
+        return meta
 
     def get_installed_commands(self, version_path: Path):
         """
         Return list of commands belonging to this version.
         Works even if install.json is missing.
         """
-        meta = version_path / "install.json"
-        if meta.exists():
-            try:
-                data = json.loads(meta.read_text())
+        try:
+            data = self._read_meta(version_path)
+            if data is not None:
                 return data.get("commands", [])
-            except Exception:
-                pass
+        except Exception:
+            pass
 
         # Fallback: inspect venv/bin
         venv = version_path / "venv"
-        if platform.system() == "Windows":
+        if self._system == "Windows":
             bin_dir = venv / "Scripts"
             exts = (".exe", ".bat", ".cmd")
         else:
             bin_dir = venv / "bin"
             exts = ("",)
 
+        # Map each expected file name to the command it provides.
+        wanted = {f"{cmd}{ext}": cmd for cmd in self.CMD_DICT for ext in exts}
         cmds = []
         if bin_dir.exists():
-            for p in bin_dir.iterdir():
-                for ext in exts:
-                    if p.name == p.stem + ext:
-                        if p.stem in self.CMD_DICT:
-                            cmds.append(p.stem)
+            with os.scandir(bin_dir) as it:
+                cmds = list(dict.fromkeys(wanted[e.name] for e in it if e.name in wanted))
+        if cmds:
+            return cmds
 
         # Final fallback (very old installs)
         return list(self.CMD_DICT.keys())
@@ -406,25 +533,33 @@ class Installer:
             self.info(f"Version {version} not found")
             return
 
-        system = platform.system()
+        system = self._system
         bin_dir = self.get_bin_dir(mode)
-        mac_app_dir = self.get_macos_app_dir()
+        mac_app_dir = self.macos_app_dir
 
         commands = self.get_installed_commands(version_path)
 
+        # Read the bin folder once. The DirEntry objects already know if each
+        # launcher is a symlink or a regular file.
+        entries = {}
+        if bin_dir.exists():
+            with os.scandir(bin_dir) as it:
+                entries = {e.name: e for e in it}
+
         for cmd in commands:
             # ----- CLI launchers -----
             launcher = bin_dir / cmd
             if system == "Windows" and not launcher.name.endswith(".bat"):
                 launcher = launcher.with_name(launcher.name + ".bat")
-            if launcher.exists() or launcher.is_symlink():
+            entry = entries.get(launcher.name)
+            if entry is not None:
 
                 # If gui is in the cmd name then we would have tried to create a icon launcher when it was installed.
                 if self._is_launcher_required(cmd):
                     # Try running it with the --remove_launcher argument (see p3lib launcher.py)
                     # to remove and launcher created previously.
                     try:
-                        args = [launcher, "--remove_launcher"]
+                        args = [str(launcher), "--remove_launcher"]
                         self.run_system_cmd(args)
 
                     except Exception:
@@ -432,14 +567,14 @@ class Installer:
                         pass
 
                 try:
-                    target = launcher.resolve()
-                    # If this is a link to a file in the venv
-                    if str(version_path) in str(target):
-                        launcher.unlink()
-                        self.info(f"Removed {launcher}")
+                    if entry.is_symlink():
+                        # If this is a link to a file in the venv or to another startup file
+                        if self._link_target_under(entry.path, version_path) or launcher.is_file():
+                            launcher.unlink()
+                            self.info(f"Removed {launcher}")
 
                     # If this is a startup file in the ~/.local folder
-                    elif target.is_file():
+                    elif entry.is_file():
                         launcher.unlink()
                         self.info(f"Removed {launcher}")
 
@@ -459,10 +594,11 @@ class Installer:
             if system == "Darwin":
                 app = mac_app_dir / f"{cmd}.app"
                 if app.exists():
-                    shutil.rmtree(app, ignore_errors=True)
+                    self._fast_rmtree(app)
                     self.info(f"Removed {app}")
 
-        shutil.rmtree(version_path, ignore_errors=True)
+        self._fast_rmtree(version_path)
+        self._meta_cache.pop(version_path, None)
         self.info(f"Removed version {version}")
 
     def uninstall(self):
@@ -505,14 +641,10 @@ class Installer:
         # Ensure string
         dir_to_add = str(dir_to_add)
 
-        current = self.get_user_path()
-
-        parts = [p for p in current.split(";") if p]
-
-        norm = [p.lower().rstrip("\\") for p in parts]
+        current, norm_map = self._get_user_path_map()
         target = dir_to_add.lower().rstrip("\\")
 
-        if target in norm:
+        if target in norm_map:
             return False   # already present
 
         new = current + (";" if current and not current.endswith(";") else "") + dir_to_add
@@ -541,110 +673,145 @@ class Installer:
                 None, "runas", "shutdown", "/r /t 5", None, 1
             )
 
-    def create_launchers(self, base: Path, version: str, venv_path: Path):
-        """
-        Create CLI launchers and Linux .desktop files.
-
-        On Windows: creates .bat files that call the venv-installed console scripts.
-        On Linux/macOS: creates wrapper scripts that either call python -m <module>
-                        or the venv-installed console scripts, with symlinks in bin_dir.
-        """
-
-        system = platform.system()
-        bin_dir = self.get_bin_dir(self.args.mode)
-        if system == "Windows":
-            bin_dir.mkdir(parents=True, exist_ok=True)
+    def _write_exec(self, path: Path, data: str):
+        """@brief Write an executable script file.
+                  On Linux/macOS the executable mode is set on the open file.
+           @param path The file to write.
+           @param data The file contents."""
+        if self._system == "Windows":
+            path.write_text(data)
+        else:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+            try:
+                # The open mode is filtered by the umask and is not applied to an
+                # existing file so set the mode explicitly.
+                os.fchmod(fd, 0o755)
+                os.write(fd, data.encode())
+            finally:
+                os.close(fd)
+
+    def _add_gui_launcher(self, cmd, launcher):
+        """@brief Create a GUI launcher icon for a command if one is required.
+           @param cmd The command as defined in CMD_DICT.
+           @param launcher The path of the launcher created for the command."""
+        # If the command starts a gui
+        if self._is_launcher_required(cmd):
+            # Try running it with the --add_launcher argument (see p3lib launcher.py)
+            # This supports creation of a GUI launcher with an icon on
+            # Linux, Windows and macos platforms.
+            # On Windows and macos an icon is created on the desktop.
+            # On Linux platforms a gnome application launcher is created.
+            try:
+                if launcher.exists():
+                    args = [str(launcher), "--add_launcher"]
+                    self.run_system_cmd(args)
 
-            venv_dir = str(venv_path)
+            except Exception:
+                # Fail silently as cmd may not support the create gui launcher functionality
+                pass
 
-            for cmd, attr_list in self.CMD_DICT.items():
-                module_target = attr_list[0]
-                launcher = bin_dir / f"{cmd}.bat"
-                if module_target:
-                    launcher.write_text(
-                        f"""@echo off
+    def _create_windows_launcher(self, base: Path, bin_dir: Path, venv_dir: str, cmd: str, module_target: str):
+        """@brief Create the .bat launcher for a single command on Windows.
+           @param base The installation base path. This is written to the second line of the
+                       launcher so that remove_active_launchers() only needs to read its start.
+           @param bin_dir The folder to create the launcher in.
+           @param venv_dir The venv folder.
+           @param cmd The command as defined in CMD_DICT.
+           @param module_target The module to run or an empty string."""
+        launcher = bin_dir / f"{cmd}.bat"
+        if module_target:
+            launcher.write_text(
+                f"""@echo off
+rem INSTALL_BASE={base}
 set VENV_DIR={venv_dir}
 call "%VENV_DIR%\\Scripts\\activate.bat"
 python -m {module_target} %*
 """)
 
-                else:
-                    launcher.write_text(
-                        f"""@echo off
+        else:
+            launcher.write_text(
+                f"""@echo off
+rem INSTALL_BASE={base}
 set VENV_DIR={venv_dir}
 call "%VENV_DIR%\\Scripts\\activate.bat"
 python -m {self.APP_NAME}.{cmd} %*
 """)
-                self.info(f"Created {launcher}")
-
-            # Ensure the bin folder is on the system PATH
-            path_changed = self.add_to_user_path(bin_dir)
-
-            if path_changed:
-                self.ask_reboot()
-
-        else:
-            # Linux / macOS
-            bin_dir.mkdir(parents=True, exist_ok=True)
-
-            wrapper_dir = base / version / "launchers"
-            wrapper_dir.mkdir(parents=True, exist_ok=True)
-
+        self.info(f"Created {launcher}")
+        self._add_gui_launcher(cmd, launcher)
+
+    def _create_posix_launcher(self, bin_dir: Path, wrapper_dir: Path, venv_path: Path, cmd: str, module_target: str):
+        """@brief Create the launcher for a single command on Linux/macOS.
+           @param bin_dir The folder to create the launcher in.
+           @param wrapper_dir The folder to create wrapper scripts in.
+           @param venv_path The venv folder.
+           @param cmd The command as defined in CMD_DICT.
+           @param module_target The module to run or an empty string."""
+        if module_target:
+            # Command needs python -m module
             python_exe = venv_path / "bin" / "python"
-
-            for cmd, attr_list in self.CMD_DICT.items():
-                module_target = attr_list[0]
-                if module_target:
-                    # Command needs python -m module
-                    launcher = bin_dir / cmd
-                    contents = f"""#!/bin/sh
+            launcher = bin_dir / cmd
+            contents = f"""#!/bin/sh
 exec "{python_exe}" -m {module_target} "$@"
 """
-                    launcher.write_text(contents)
-                    launcher.chmod(0o755)
-                else:
-                    # Use the venv-installed console script
-                    entrypoint = venv_path / "bin" / cmd
-                    if not entrypoint.exists():
-                        self.die(f"Entrypoint {cmd} not found in venv at {entrypoint}")
+            self._write_exec(launcher, contents)
+        else:
+            # Use the venv-installed console script
+            entrypoint = venv_path / "bin" / cmd
+            if not entrypoint.exists():
+                self.die(f"Entrypoint {cmd} not found in venv at {entrypoint}")
 
-                    wrapper_script = wrapper_dir / f"{cmd}.sh"
-                    wrapper_script.write_text(f"""#!/bin/sh
+            wrapper_script = wrapper_dir / f"{cmd}.sh"
+            self._write_exec(wrapper_script, f"""#!/bin/sh
 exec "{entrypoint}" "$@"
 """)
-                    wrapper_script.chmod(0o755)
 
-                    launcher = bin_dir / cmd
-                    if launcher.exists() or launcher.is_symlink():
-                        launcher.unlink()
-                    launcher.symlink_to(wrapper_script)
+            launcher = bin_dir / cmd
+            if launcher.exists() or launcher.is_symlink():
+                launcher.unlink()
+            launcher.symlink_to(wrapper_script)
+
+        self.info(f"Created {launcher}")
+        self._add_gui_launcher(cmd, launcher)
+
+    def create_launchers(self, base: Path, version: str, venv_path: Path):
+        """
+        Create CLI launchers and Linux .desktop files.
+
+        On Windows: creates .bat files that call the venv-installed console scripts.
+        On Linux/macOS: creates wrapper scripts that either call python -m <module>
+                        or the venv-installed console scripts, with symlinks in bin_dir.
+
+        The launchers for each command are independent so they are created concurrently.
+        """
 
-                self.info(f"Created {launcher}")
+        system = self._system
+        bin_dir = self.get_bin_dir(self.args.mode)
+        bin_dir.mkdir(parents=True, exist_ok=True)
+        cmds = [(cmd, attr_list[0]) for cmd, attr_list in self.CMD_DICT.items()]
+        if system == "Windows":
+            create = functools.partial(self._create_windows_launcher, base, bin_dir, str(venv_path))
+
+        else:
+            # Linux / macOS
+            wrapper_dir = base / version / "launchers"
+            wrapper_dir.mkdir(parents=True, exist_ok=True)
 
             # Optional: create .desktop files for GUI commands
-            desktop_dir = Path.home() / ".local" / "share" / "applications"
+            desktop_dir = self.desktop_dir
             desktop_dir.mkdir(parents=True, exist_ok=True)
 
-        for cmd, attr_list in self.CMD_DICT.items():
-            module_target = attr_list[0]
-            # If the command starts a gui
-            if self._is_launcher_required(cmd):
-                # Try running it with the --add_launcher argument (see p3lib launcher.py)
-                # This supports creation of a GUI launcher with an icon on
-                # Linux, Windows and macos platforms.
-                # On Windows and macos an icon is created on the desktop.
-                # On Linux platforms a gnome application launcher is created.
-                try:
-                    full_cmd = bin_dir / cmd
-                    if system == "Windows" and not full_cmd.name.endswith(".bat"):
-                        full_cmd = full_cmd.with_name(full_cmd.name + ".bat")
-                    if full_cmd.exists():
-                        args = [full_cmd, "--add_launcher"]
-                        self.run_system_cmd(args)
+            create = functools.partial(self._create_posix_launcher, bin_dir, wrapper_dir, venv_path)
 
-                except Exception:
-                    # Fail silently as cmd may not support the create gui launcher functionality
-                    pass
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(cmds)))) as ex:
+            # Consume the results so that any exception is raised here.
+            list(ex.map(lambda c: create(*c), cmds))
+
+        if system == "Windows":
+            # Ensure the bin folder is on the system PATH
+            path_changed = self.add_to_user_path(bin_dir)
+
+            if path_changed:
+                self.ask_reboot()
 
         # Create a file to track ownership of launchers
         meta = {
@@ -652,10 +819,15 @@ exec "{entrypoint}" "$@"
             "commands": list(self.CMD_DICT.keys())
         }
         meta_file = base / version / "install.json"
-        meta_file.write_text(json.dumps(meta, indent=2))
+        meta_file.write_bytes(self._json_dumps(meta))
+        self._meta_cache[base / version] = meta
 
     def current_link(self, base):
-        return base / "current"
+        link = self._current_links.get(base)
+        if link is None:
+            link = base / "current"
+            self._current_links[base] = link
+        return link
 
     def get_current_version(self, base):
         p = self.current_link(base)
@@ -675,7 +847,7 @@ exec "{entrypoint}" "$@"
         p = self.current_link(base)
         target = base / version
 
-        if platform.system() == "Windows":
+        if self._system == "Windows":
             p.write_text(version)
         else:
             if p.exists() or p.is_symlink():
@@ -688,10 +860,10 @@ exec "{entrypoint}" "$@"
         current = self.get_current_version(base)
 
         if self.args.json:
-            print(json.dumps({
+            print(self._json_dumps({
                 "current": current,
                 "installed": versions
-            }, indent=2))
+            }).decode())
             return
 
         if not versions:
@@ -704,23 +876,16 @@ exec "{entrypoint}" "$@"
             self.info(f" {mark} {v}")
 
     def ensure_pip(self, venv_path: Path):
-        python_exe = venv_path / ("Scripts/python.exe" if platform.system() == "Windows" else "bin/python")
-        try:
-            args = [str(python_exe), "-m", "pip", "--version"]
-            self.run_system_cmd(args, show_output=False)
-
-        except Exception:
-            self.info("Installing pip into virtualenv...")
-            args = [str(python_exe), "-m", "ensurepip", "--upgrade"]
-            self.run_system_cmd(args)
-            args = [str(python_exe), "-m", "pip", "install", "--upgrade", "pip", "setuptools", "wheel"]
-            self.run_system_cmd(args)
+        python_exe = venv_path / ("Scripts/python.exe" if self._system == "Windows" else "bin/python")
+        self.info("Installing pip into virtualenv...")
+        args = [str(python_exe), "-m", "ensurepip", "--upgrade"]
+        self.run_system_cmd(args)
 
     def add_to_path(self):
         # 1. Get the correct 'bin' or 'Scripts' directory
         # Linux: ~/.local/bin | Windows: %APPDATA%\Python\Python3x\Scripts
         user_base = site.getuserbase()
-        if platform.system() == "Windows":
+        if self._system == "Windows":
             bin_path = Path(user_base) / "Scripts"
         else:
             bin_path = Path(user_base) / "bin"
@@ -728,7 +893,8 @@ exec "{entrypoint}" "$@"
         bin_str = str(bin_path.absolute())
 
         # --- WINDOWS LOGIC ---
-        if platform.system() == "Windows":
+        if self._system == "Windows":
+            import subprocess
             current_path = os.environ.get("PATH", "")
             if bin_str not in current_path:
                 try:
@@ -772,7 +938,6 @@ exec "{entrypoint}" "$@"
         venv_path = base / version / "venv"
 
         self.create_venv(venv_path)
-        self.ensure_pip(venv_path)
         self.install_wheel(venv_path, wheel_path)
         self.create_launchers(base, version, venv_path)
         self.set_current_version(base, version)
@@ -2,11 +2,15 @@
 # -*- coding: utf-8 -*-
 
 import os
+import re
 import sys
 import argparse
-import copy
+import bisect
+import functools
+import math
 import shutil
 import traceback
+import uuid
 import bcrypt
 import zipfile
 import subprocess
@@ -15,14 +19,15 @@ import tempfile
 import secrets
 import json
 import pickle
+import hashlib
 import numpy as np
 
 from queue import Queue
 from datetime import datetime, timedelta
-from dateutil.relativedelta import relativedelta
 from decimal import Decimal, ROUND_HALF_UP
-import pandas as pd
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
 from p3lib.uio import UIO
 from p3lib.helper import logTraceBack
@@ -33,7 +38,38 @@ from p3lib.helper import get_program_version, get_assets_dir
 
 from nicegui import ui, app
 
-import plotly.graph_objects as go
+
+class KeyCachingCryptFile(CryptFile):
+    """@brief A CryptFile that caches the keys derived from the password. Deriving a key
+              (PBKDF2) is deliberately slow and CryptFile does it on every load and save.
+              Each file holds its own salt so one key can't be shared by all the files, but
+              the key derived when a file is saved is reused when it is next loaded (E.G each
+              time a page reloads the config)."""
+
+    # (password digest, salt) -> key
+    _KEY_CACHE = {}
+    MAX_CACHED_KEYS = 256
+
+    @staticmethod
+    def ClearKeyCache():
+        """@brief Remove all cached keys. Called when the password changes so that keys
+                  derived from the old password are not kept."""
+        KeyCachingCryptFile._KEY_CACHE.clear()
+
+    def _derive_key_from_password(self, salt):
+        """@brief Get the key for the password and salt, deriving it only if not already cached.
+           @param salt The salt bytes stored at the start of the encrypted file.
+           @return The key."""
+        password = self._password if isinstance(self._password, bytes) else str(self._password).encode()
+        # Key the cache on a digest so the plain text password is not held by the cache.
+        cache_key = (hashlib.sha256(password).digest(), bytes(salt))
+        key = KeyCachingCryptFile._KEY_CACHE.get(cache_key)
+        if key is None:
+            key = super()._derive_key_from_password(salt)
+            if len(KeyCachingCryptFile._KEY_CACHE) >= KeyCachingCryptFile.MAX_CACHED_KEYS:
+                KeyCachingCryptFile._KEY_CACHE.clear()
+            KeyCachingCryptFile._KEY_CACHE[cache_key] = key
+        return key
 
 
 class Config(object):
@@ -48,6 +84,27 @@ class Config(object):
     MONTHLY_SPENDING_FILE = "monthly_spending.json"
     PASSWORD_HASH_FILE = "password_hash.txt"
     STORAGE_SECRET_FILE = "storage_secret.txt"
+    # The key holding the unique ID of each bank account and pension dict.
+    UID = "UID"
+
+    @staticmethod
+    def AddMissingUIDs(dict_list):
+        """@brief Give each dict in the list that does not have a unique ID one.
+           @param dict_list A list of bank account or pension dicts.
+           @return True if any UIDs were added."""
+        added = False
+        for _dict in dict_list:
+            if Config.UID not in _dict:
+                _dict[Config.UID] = uuid.uuid4().hex
+                added = True
+        return added
+
+    @staticmethod
+    def GetIndexByUID(dict_list):
+        """@brief Get a dict that maps the unique ID of each dict in the list to its index.
+           @param dict_list A list of bank account or pension dicts.
+           @return The UID -> index dict."""
+        return {_dict.get(Config.UID): index for index, _dict in enumerate(dict_list)}
 
     @staticmethod
     def GetOrCreateStorageSecret(folder):
@@ -67,6 +124,18 @@ class Config(object):
             fd.write(new_secret)
         return new_secret
 
+    @staticmethod
+    @functools.lru_cache(maxsize=2)
+    def GetDefaultConfigFolderPath(example_data=False):
+        """@brief Get the path of the default folder used to store files. The result is cached as
+                  this is needed every time a Config instance is created.
+           @param example_data If True, use example data.
+           @return The default folder path. The folder may not exist."""
+        default_cfg_folder = DotConfigManager.GetDefaultConfigFolder()
+        if example_data:
+            return os.path.join(default_cfg_folder, 'retirement_finances_example_data')
+        return os.path.join(default_cfg_folder, 'retirement_finances')
+
     @staticmethod
     def GetConfigFolder(folder, example_data=False):
         """@brief Get the folder use to store files in.
@@ -80,44 +149,44 @@ class Config(object):
             else:
                 raise Exception(f"{folder} folder not found.")
         else:
-            default_cfg_folder = DotConfigManager.GetDefaultConfigFolder()
-            if example_data:
-                cfg_folder = os.path.join(default_cfg_folder, 'retirement_finances_example_data')
+            cfg_folder = Config.GetDefaultConfigFolderPath(example_data=example_data)
 
-            else:
-                cfg_folder = os.path.join(default_cfg_folder, 'retirement_finances')
-
-        if not os.path.isdir(cfg_folder):
-            os.makedirs(cfg_folder)
+        # Always check as the folder may have been removed since it was last used.
+        os.makedirs(cfg_folder, exist_ok=True)
         return cfg_folder
 
     def set_config_files(self):
-        self._global_configuration_name_file = self._getGlobalConfigurationFile()
-        self._bank_accounts_file = self._getBankAccountListFile()
-        self._pensions_file = self._getPensionsListFile()
-        self._multiple_future_plot_file = self._getMultipleFuturePlotAttrFile()
-        self._selected_retirement_parameters_name_file = self._getSelectedRequirementParametersNameFile()
-        self._multiple_report1_plot_file = self._getMultipleReport1PlotAttrFile()
-        self._selected_report1_parameters_name_file = self._getSelectedReport1ParametersNameFile()
-        self._monthly_spending_file = self._getMonthlySpendingFile()
+        """@brief Build the full path of each config file from the current config folder once
+                  so that the load/save paths don't need to rebuild them."""
+        folder = self._config_folder
+        self._global_configuration_name_file = os.path.join(folder, Config.GLOBAL_CONFIGURATION_FILE)
+        self._bank_accounts_file = os.path.join(folder, Config.BANK_ACCOUNTS_FILE)
+        self._pensions_file = os.path.join(folder, Config.PENSIONS_FILE)
+        self._multiple_future_plot_file = os.path.join(folder, Config.MULTIPLE_FUTURE_PLOT_ATTR_FILE)
+        self._selected_retirement_parameters_name_file = os.path.join(folder, Config.SELECTED_FUTURE_PLOT_NAME_ATTR_FILE)
+        self._multiple_report1_plot_file = os.path.join(folder, Config.MULTIPLE_REPORT1_PLOT_ATTR_FILE)
+        self._selected_report1_parameters_name_file = os.path.join(folder, Config.SELECTED_REPORT1_PLOT_NAME_ATTR_FILE)
+        self._monthly_spending_file = os.path.join(folder, Config.MONTHLY_SPENDING_FILE)
+        self._password_hash_file = os.path.join(folder, Config.PASSWORD_HASH_FILE)
 
     def set_crypt_files(self):
         self.set_config_files()
 
-        self._global_configuration_name_crypt_file = CryptFile(filename=self._global_configuration_name_file, password=self._password)
-        self._bank_account_crypt_file = CryptFile(filename=self._bank_accounts_file, password=self._password)
-        self._pensions_crypt_file = CryptFile(filename=self._pensions_file, password=self._password)
-        self._multiple_future_plot_crypt_file = CryptFile(filename=self._multiple_future_plot_file, password=self._password)
-        self._selected_retirement_parameters_name_crypt_file = CryptFile(filename=self._selected_retirement_parameters_name_file, password=self._password)
-        self._multiple_report1_plot_crypt_file = CryptFile(filename=self._multiple_report1_plot_file, password=self._password)
-        self._selected_report1_parameters_name_crypt_file = CryptFile(filename=self._selected_report1_parameters_name_file, password=self._password)
-        self._monthly_spending_crypt_file = CryptFile(filename=self._monthly_spending_file, password=self._password)
+        self._global_configuration_name_crypt_file = KeyCachingCryptFile(filename=self._global_configuration_name_file, password=self._password)
+        self._bank_account_crypt_file = KeyCachingCryptFile(filename=self._bank_accounts_file, password=self._password)
+        self._pensions_crypt_file = KeyCachingCryptFile(filename=self._pensions_file, password=self._password)
+        self._multiple_future_plot_crypt_file = KeyCachingCryptFile(filename=self._multiple_future_plot_file, password=self._password)
+        self._selected_retirement_parameters_name_crypt_file = KeyCachingCryptFile(filename=self._selected_retirement_parameters_name_file, password=self._password)
+        self._multiple_report1_plot_crypt_file = KeyCachingCryptFile(filename=self._multiple_report1_plot_file, password=self._password)
+        self._selected_report1_parameters_name_crypt_file = KeyCachingCryptFile(filename=self._selected_report1_parameters_name_file, password=self._password)
+        self._monthly_spending_crypt_file = KeyCachingCryptFile(filename=self._monthly_spending_file, password=self._password)
 
     def load_config(self, password):
         """@brief Load the encrypted config.
            @param password The password used to encrypt and decrypt the config files."""
         self._password = password
         self.set_crypt_files()
+        self._preload_crypt_files()
         self.load_global_configuration()
         self._load_bank_accounts()
         self._load_pensions()
@@ -127,8 +196,35 @@ class Config(object):
         self._load_selected_report1_parameters_name_attrs()
         self._load_monthly_spending_dict()
 
+    def _preload_crypt_files(self):
+        """@brief Read and decrypt all the config files concurrently. The _load_* methods then
+                  pick up the results (and report any errors) from the calling thread as nicegui
+                  notifications must not be raised from a worker thread."""
+        crypt_files = (self._global_configuration_name_crypt_file,
+                       self._bank_account_crypt_file,
+                       self._pensions_crypt_file,
+                       self._multiple_future_plot_crypt_file,
+                       self._selected_retirement_parameters_name_crypt_file,
+                       self._multiple_report1_plot_crypt_file,
+                       self._selected_report1_parameters_name_crypt_file,
+                       self._monthly_spending_crypt_file)
+        with ThreadPoolExecutor(max_workers=len(crypt_files)) as executor:
+            futures = [executor.submit(crypt_file.load) for crypt_file in crypt_files]
+        self._preloaded = {crypt_file.get_file(): future for crypt_file, future in zip(crypt_files, futures)}
+
+    def _load_crypt_file(self, crypt_file):
+        """@brief Get the contents of a crypt file, using the result read by _preload_crypt_files() if present.
+           @param crypt_file The CryptFile instance to load.
+           @return The decrypted file contents. Any load error is raised."""
+        future = self._preloaded.pop(crypt_file.get_file(), None)
+        if future is None:
+            return crypt_file.load()
+        return future.result()
+
     def update_password(self, new_password):
         self._password = new_password
+        # Drop the keys derived from the old password.
+        KeyCachingCryptFile.ClearKeyCache()
         saved_config_folder = self._config_folder
         try:
             with tempfile.TemporaryDirectory() as temp_dir:
@@ -151,51 +247,33 @@ class Config(object):
 
         finally:
             self._config_folder = saved_config_folder
+            # Point the cached paths and crypt files back at the config folder.
+            self.set_crypt_files()
 
     def __init__(self, folder, show_load_save_notifications=True, example_data=False):
         self._config_folder = Config.GetConfigFolder(folder, example_data=example_data)
         self._show_load_save_notifications = show_load_save_notifications
+        self._preloaded = {}
+        self._deferred_saves = {}
+        self._pension_description_set = None
         self.set_config_files()
 
-    def _getPasswordHashFile(self):
-        """@return The file used to store the password hash."""
-        return os.path.join(self._config_folder, Config.PASSWORD_HASH_FILE)
-
     def get_config_folder(self):
         """@return the folder used to store config files."""
         return self._config_folder
 
-    def _getBankAccountListFile(self):
-        """@return The file used to store bank account details."""
-        return os.path.join(self._config_folder, Config.BANK_ACCOUNTS_FILE)
-
-    def _getPensionsListFile(self):
-        """@return The file used to store pension details."""
-        return os.path.join(self._config_folder, Config.PENSIONS_FILE)
-
-    def _getMultipleFuturePlotAttrFile(self):
-        """@return The file used to store multiple future plot details."""
-        return os.path.join(self._config_folder, Config.MULTIPLE_FUTURE_PLOT_ATTR_FILE)
-
-    def _getSelectedRequirementParametersNameFile(self):
-        """@return The file used to store the selected future plot name."""
-        return os.path.join(self._config_folder, Config.SELECTED_FUTURE_PLOT_NAME_ATTR_FILE)
-
-    def _getMultipleReport1PlotAttrFile(self):
-        """@return The file used to store multiple report1 plot details."""
-        return os.path.join(self._config_folder, Config.MULTIPLE_REPORT1_PLOT_ATTR_FILE)
+    def defer_save(self, save_method):
+        """@brief Request a save that is performed on the next call to flush_deferred_saves().
+                  Use this where a file may be saved many times in quick succession (E.G on every
+                  key press) so that it is encrypted and written once per burst of changes.
+           @param save_method The Config method that saves the file (E.G self._save_monthly_spending_dict)."""
+        self._deferred_saves[save_method.__name__] = save_method
 
-    def _getSelectedReport1ParametersNameFile(self):
-        """@return The file used to store the selected report1 plot name."""
-        return os.path.join(self._config_folder, Config.SELECTED_REPORT1_PLOT_NAME_ATTR_FILE)
-
-    def _getGlobalConfigurationFile(self):
-        """@return The file used to store global configuration parameters."""
-        return os.path.join(self._config_folder, Config.GLOBAL_CONFIGURATION_FILE)
-
-    def _getMonthlySpendingFile(self):
-        """@return The file used to store monthly spending details."""
-        return os.path.join(self._config_folder, Config.MONTHLY_SPENDING_FILE)
+    def flush_deferred_saves(self):
+        """@brief Perform any saves requested via defer_save()."""
+        while self._deferred_saves:
+            _, save_method = self._deferred_saves.popitem()
+            save_method()
 
     def hash_password(self, password: str) -> str:
         """@brief Create a hash from a password in order to validate a password in a secure manner.
@@ -209,7 +287,7 @@ class Config(object):
         """@brief Get the stored hashed password.
            @return The hashed password or None if no password found."""
         pw_hash = None
-        pw_hash_file = self._getPasswordHashFile()
+        pw_hash_file = self._password_hash_file
         if os.path.isfile(pw_hash_file):
             with open(pw_hash_file, 'r') as fd:
                 pw_hash = fd.read()
@@ -219,7 +297,7 @@ class Config(object):
         """@brief Store the hash of the password to the passwords file.
            @param password The password to store the hash of."""
         hashed_password = self.hash_password(password)
-        pw_hash_file = self._getPasswordHashFile()
+        pw_hash_file = self._password_hash_file
         # Always overwrite so that update_password() can call this safely.
         with open(pw_hash_file, 'w') as fd:
             fd.write(hashed_password)
@@ -230,13 +308,17 @@ class Config(object):
         """@brief Load bank accounts from file."""
         try:
             self._bank_accounts_dict_list = []
-            self._bank_accounts_dict_list = self._bank_account_crypt_file.load()
+            self._bank_accounts_dict_list = self._load_crypt_file(self._bank_account_crypt_file)
             if self._show_load_save_notifications:
                 ui.notify(f'Loaded from {self._bank_account_crypt_file.get_file()}', type='positive', position='bottom', duration=2)
 
         except Exception:
             ui.notify(f'{self._bank_account_crypt_file.get_file()} file not found.', type='negative')
 
+        # Bank accounts created before UIDs were added are given one.
+        if Config.AddMissingUIDs(self._bank_accounts_dict_list):
+            self.save_bank_accounts()
+
     def save_bank_accounts(self):
         """@brief Save the bank accounts dict list persistently."""
         self._bank_account_crypt_file.save(self._bank_accounts_dict_list)
@@ -246,11 +328,14 @@ class Config(object):
     def add_bank_account(self, bank_account_dict):
         """@brief Add bank account.
            @param bank_account_dict A bank account dict."""
+        bank_account_dict.setdefault(Config.UID, uuid.uuid4().hex)
         self._bank_accounts_dict_list.append(bank_account_dict)
         self.save_bank_accounts()
 
     def get_bank_accounts_dict_list(self):
-        """@brief Get the current list of bank accounts."""
+        """@brief Get the current list of bank accounts. This is the list held in memory since
+                  load_config() was called so no file is read. Callers that modify it must call
+                  save_bank_accounts() to persist the change."""
         return self._bank_accounts_dict_list
 
     def remove_bank_account(self, index):
@@ -266,15 +351,22 @@ class Config(object):
         """@brief Load pensions from file."""
         try:
             self._pension_dict_list = []
-            self._pension_dict_list = self._pensions_crypt_file.load()
+            self._pension_dict_list = self._load_crypt_file(self._pensions_crypt_file)
             if self._show_load_save_notifications:
                 ui.notify(f'Loaded from {self._pensions_crypt_file.get_file()}', type='positive', position='bottom', duration=2)
 
         except Exception:
             ui.notify(f'{self._pensions_crypt_file.get_file()} file not found.', type='negative')
 
+        self._pension_description_set = None
+        # Pensions created before UIDs were added are given one.
+        if Config.AddMissingUIDs(self._pension_dict_list):
+            self.save_pensions()
+
     def save_pensions(self):
         """@brief Save the pension dict list persistently."""
+        # The pensions may have changed so the description set must be rebuilt when next required.
+        self._pension_description_set = None
         self._pensions_crypt_file.save(self._pension_dict_list)
         if self._show_load_save_notifications:
             ui.notify(f'Saved {self._pensions_crypt_file.get_file()}', type='positive', position='bottom', duration=2)
@@ -282,13 +374,26 @@ class Config(object):
     def add_pension(self, pension_dict):
         """@brief Add pension.bank account.
            @param pension_dict A pension dict."""
+        pension_dict.setdefault(Config.UID, uuid.uuid4().hex)
         self._pension_dict_list.append(pension_dict)
         self.save_pensions()
 
     def get_pension_dict_list(self):
-        """@brief Get the current list of pensions."""
+        """@brief Get the current list of pensions. This is the list held in memory since
+                  load_config() was called so no file is read. Callers that modify it must call
+                  save_pensions() to persist the change."""
         return self._pension_dict_list
 
+    def get_pension_description_set(self):
+        """@brief Get the descriptions of the current pensions. The set is cached until the
+                  pensions are next loaded or saved.
+           @return A frozenset of pension description strings."""
+        if self._pension_description_set is None:
+            self._pension_description_set = frozenset(pension_dict[PensionGUI.PENSION_DESCRIPTION_LABEL]
+                                                      for pension_dict in self._pension_dict_list
+                                                      if PensionGUI.PENSION_DESCRIPTION_LABEL in pension_dict)
+        return self._pension_description_set
+
     def remove_pension(self, index):
         """@brief Remove a pension from the list of pensions.
            @param index The 0 based index of the pension to remove from the pension list."""
@@ -302,7 +407,7 @@ class Config(object):
         """@brief Load the multiple future plot parameters from file."""
         try:
             self._multiple_future_plot_attr_dict = {}
-            self._multiple_future_plot_attr_dict = self._multiple_future_plot_crypt_file.load()
+            self._multiple_future_plot_attr_dict = self._load_crypt_file(self._multiple_future_plot_crypt_file)
             if self._show_load_save_notifications:
                 ui.notify(f'Loaded from {self._multiple_future_plot_crypt_file.get_file()}', type='positive', position='bottom', duration=2)
 
@@ -327,7 +432,7 @@ class Config(object):
         """@brief Load the selected retirement parameters name parameters from file."""
         try:
             self._selected_retirement_parameters_name_dict = {}
-            self._selected_retirement_parameters_name_dict = self._selected_retirement_parameters_name_crypt_file.load()
+            self._selected_retirement_parameters_name_dict = self._load_crypt_file(self._selected_retirement_parameters_name_crypt_file)
             if self._show_load_save_notifications:
                 ui.notify(f'Loaded from {self._selected_retirement_parameters_name_crypt_file.get_file()}', type='positive', position='bottom', duration=2)
 
@@ -352,7 +457,7 @@ class Config(object):
         """@brief Load the multiple report1 plot parameters from file."""
         try:
             self._multiple_report1_plot_attr_dict = {}
-            self._multiple_report1_plot_attr_dict = self._multiple_report1_plot_crypt_file.load()
+            self._multiple_report1_plot_attr_dict = self._load_crypt_file(self._multiple_report1_plot_crypt_file)
             if self._show_load_save_notifications:
                 ui.notify(f'Loaded from {self._multiple_report1_plot_crypt_file.get_file()}', type='positive', position='bottom', duration=2)
 
@@ -373,7 +478,7 @@ class Config(object):
         """@brief Load the selected report1 parameters name parameters from file."""
         try:
             self._selected_report1_parameters_name_dict = {}
-            self._selected_report1_parameters_name_dict = self._selected_report1_parameters_name_crypt_file.load()
+            self._selected_report1_parameters_name_dict = self._load_crypt_file(self._selected_report1_parameters_name_crypt_file)
             if self._show_load_save_notifications:
                 ui.notify(f'Loaded from {self._selected_report1_parameters_name_crypt_file.get_file()}', type='positive', position='bottom', duration=2)
 
@@ -396,7 +501,7 @@ class Config(object):
         """@brief Load the global configuration parameters from file."""
         try:
             self._global_configuration_dict = {}
-            self._global_configuration_dict = self._global_configuration_name_crypt_file.load()
+            self._global_configuration_dict = self._load_crypt_file(self._global_configuration_name_crypt_file)
             if self._show_load_save_notifications:
                 ui.notify(f'Loaded from {self._global_configuration_name_crypt_file.get_file()}', type='positive', position='bottom', duration=2)
 
@@ -420,7 +525,7 @@ class Config(object):
         """@brief Load the monthly spending dict from a file."""
         try:
             self._monthly_spending_dict = {}
-            self._monthly_spending_dict = self._monthly_spending_crypt_file.load()
+            self._monthly_spending_dict = self._load_crypt_file(self._monthly_spending_crypt_file)
             if self._show_load_save_notifications:
                 ui.notify(f'Loaded from {self._monthly_spending_crypt_file.get_file()}', type='positive', position='bottom', duration=2)
 
@@ -441,6 +546,9 @@ class Config(object):
 class GUIBase(object):
     DATE = "Date"
     GUI_TIMER_SECONDS = 0.1
+    # Subclasses that never send messages to the GUI via _update_gui() set this False so that
+    # they don't run a timer that wakes up every GUI_TIMER_SECONDS for nothing.
+    GUI_TIMER_REQUIRED = True
 
     NOTIFY_TYPE_POSITIVE = 'positive'
     NOTIFY_TYPE_NEGATIVE = 'negative'
@@ -469,6 +577,14 @@ class GUIBase(object):
                               NOTIFY_POSITION_BOTTOM_LEFT,
                               NOTIFY_POSITION_BOTTOM_RIGHT)
 
+    # One or more comma separated decimal numbers (optionally signed and/or with an exponent).
+    _NUMBER_PATTERN = r'\s*[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?\s*'
+    COMMA_SEPARATED_NUMBER_LIST_REGEX = re.compile(f'{_NUMBER_PATTERN}(?:,{_NUMBER_PATTERN})*')
+    # The layout of a dd-mm-yyyy date string. This accepts everything strptime() accepts for
+    # '%d-%m-%Y' (single digit and space padded days/months) so that it can be used to reject
+    # malformed strings before they are parsed.
+    DATE_STRING_REGEX = re.compile(r' ?\d{1,2}-\d{1,2}-\d{4}')
+
     NOTIFY_MSG_TEXT = 1
     NOTIFY_MSG_TYPE = 2
     NOTIFY_MSG_POSITION = 3
@@ -489,17 +605,49 @@ class GUIBase(object):
         date.tooltip("DD-MM-YYYY")
         return date
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def ParseDate(date_str):
+        """@brief Convert a dd-mm-yyyy string to a datetime instance. The result is cached as the same
+                  dates are validated repeatedly.
+           @param date_str The dd-mm-yyyy format string.
+           @return The datetime instance. An exception is raised if the date is invalid."""
+        return datetime.strptime(date_str, '%d-%m-%Y')
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def ParseRateList(rate_list_str):
+        """@brief Convert a comma separated list of rates to a tuple of floats. The result is cached as
+                  the same rate list is read for every month of a prediction.
+           @param rate_list_str The comma separated rates string.
+           @return A tuple of float rates. An exception is raised if a rate is not a number."""
+        return tuple(float(rate) for rate in rate_list_str.split(','))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def IsValidDateString(date_str):
+        """@brief Determine if a string is a valid dd-mm-yyyy date. The result is cached (including
+                  for invalid strings, which ParseDate() can't cache) as the same strings are
+                  validated each time the user saves.
+           @param date_str The dd-mm-yyyy format string.
+           @return True if date is valid."""
+        # Reject strings that can't be a date without the cost of parsing them.
+        if GUIBase.DATE_STRING_REGEX.fullmatch(date_str) is None:
+            return False
+        try:
+            GUIBase.ParseDate(date_str)
+            return True
+        except ValueError:
+            return False
+
     @staticmethod
     def CheckValidDateString(date_str, field_name=None):
-        """@brief Check for a valid date string. An exception is thrown if the date is invalid.
+        """@brief Check for a valid date string. The user is notified if the date is invalid.
            @param date_str The dd-mm-yyyy format string.
            @param field_name The optional name of the field being checked.
            @return True if date is valid."""
-        valid = False
-        try:
-            datetime.strptime(date_str, '%d-%m-%Y')
-            valid = True
-        except Exception:
+        valid = isinstance(date_str, str) and GUIBase.IsValidDateString(date_str)
+        if not valid:
             msg = f"The date '{date_str}' is not a valid date string (dd-mm-yyyy)"
             if field_name:
                 msg = f"The '{field_name}' = '{date_str}' is not a valid date string (dd-mm-yyyy)"
@@ -515,17 +663,16 @@ class GUIBase(object):
         if number is None:
             number = 0
         # Handle strings
-        if isinstance(number, str):
+        elif isinstance(number, str):
             number = float(number)
-        valid = False
-        if number > 0.0:
-            valid = True
-        else:
-            msg = f"The number entered ({number}) must be greater than zero."
-            if field_name:
-                msg = f"The '{field_name}' = ({number}) must be greater than zero."
-            ui.notify(msg, type='negative')
-        return valid
+        if number > 0:
+            return True
+
+        msg = f"The number entered ({number}) must be greater than zero."
+        if field_name:
+            msg = f"The '{field_name}' = ({number}) must be greater than zero."
+        ui.notify(msg, type='negative')
+        return False
 
     @staticmethod
     def CheckZeroOrGreater(number, field_name=None):
@@ -554,13 +701,8 @@ class GUIBase(object):
            @param comma_separated_number_str The string to check.
            @param field_name The optional name of the field being checked.
            @return True if the string is a valid comma separated list of numbers."""
-        valid = False
-        try:
-            elems = comma_separated_number_str.split(',')
-            for elem in elems:
-                float(elem)
-            valid = True
-        except ValueError:
+        valid = GUIBase.COMMA_SEPARATED_NUMBER_LIST_REGEX.fullmatch(comma_separated_number_str) is not None
+        if not valid:
             msg = f"'{comma_separated_number_str}' is not a valid comma separated number list."
             if field_name:
                 msg = f"The '{field_name}' = '{comma_separated_number_str}' is not a valid comma separated number list."
@@ -577,10 +719,22 @@ class GUIBase(object):
            @param value The string to check.
            @param field_name The optional name of the field being checked.
            @return True if the value is valid in either format."""
-        if PertDistribution.is_pert_string(value):
+        if GUIBase.IsValidRateString(value):
             return True
+        # Report why the value is invalid.
         return GUIBase.CheckCommaSeparatedNumberList(value, field_name=field_name)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def IsValidRateString(value):
+        """@brief Determine if a rate field value is a PERT specification or a comma separated number list.
+                  The result is cached as the same rate fields are validated each time the user saves
+                  or runs a prediction, even if only one of them has changed.
+           @param value The string to check.
+           @return True if the value is valid in either format."""
+        return PertDistribution.is_pert_string(value) or \
+            GUIBase.COMMA_SEPARATED_NUMBER_LIST_REGEX.fullmatch(value) is not None
+
     @staticmethod
     def CheckDuplicateDate(table, date_str):
         """@brief check that the dateStr is not already present in the table.
@@ -598,9 +752,41 @@ class GUIBase(object):
 
         return valid
 
+    @staticmethod
+    def CopyPlotAttrDict(plot_attr_dict):
+        """@brief Get a copy of a plot attributes dict that shares no mutable data with the original.
+                  The values are strings, numbers, bools, lists or tables (lists of rows), so
+                  copying each list and any row in it is all that is needed and is much quicker
+                  than a generic deep copy. The rows are copied as they may be edited in place.
+           @param plot_attr_dict The dict to copy.
+           @return The copy."""
+        return {key: [list(item) if isinstance(item, (list, tuple)) else item for item in value]
+                if isinstance(value, list) else value
+                for key, value in plot_attr_dict.items()}
+
+    @staticmethod
+    def RemoveSelectedRows(table, selected_dict_list):
+        """@brief Remove the rows selected in a GUI table from a table.
+           @param table A table in which the first column is the date (string format) in the form DD-MM-YYYY.
+           @param selected_dict_list The list of selected GUI table row dicts.
+           @return A new table without the rows whose date was selected."""
+        del_dates = {selected_dict[GUIBase.DATE] for selected_dict in selected_dict_list if GUIBase.DATE in selected_dict}
+        return [row for row in table if row[0] not in del_dates]
+
+    @staticmethod
+    def GetRowIndexDict(table):
+        """@brief Get a dict that maps the date in each row of a table to the indexes of the rows with that date.
+           @param table A table in which the first column is the date (string format) in the form DD-MM-YYYY.
+           @return A dict. Keys = date strings, values = lists of row indexes in ascending order."""
+        row_index_dict = defaultdict(list)
+        for index, row in enumerate(table):
+            row_index_dict[row[0]].append(index)
+        return dict(row_index_dict)
+
     def __init__(self):
         """@brief Constructor"""
-        ui.timer(interval=GUIBase.GUI_TIMER_SECONDS, callback=self.gui_timer_callback)
+        if self.GUI_TIMER_REQUIRED:
+            ui.timer(interval=GUIBase.GUI_TIMER_SECONDS, callback=self.gui_timer_callback)
         self._to_gui_queue = Queue()
 
     def gui_timer_callback(self):
@@ -726,6 +912,16 @@ class Finances(GUIBase):
 
     TOP_LEVEL_MODULE_NAME = "retirement_finances"
 
+    # This class doesn't send messages to the GUI via _update_gui().
+    GUI_TIMER_REQUIRED = False
+
+    # The period at which saves deferred via Config.defer_save() are written.
+    DEFERRED_SAVE_SECONDS = 0.5
+    # The number of timestamped backup folders to keep.
+    MAX_BACKUPS = 30
+    # Don't create a startup backup if the newest backup is younger than this.
+    MIN_STARTUP_BACKUP_INTERVAL_SECONDS = 300
+
     @staticmethod
     def GetExampleFolder(folder):
         """@brief Get the folder to be used for example data."""
@@ -744,6 +940,10 @@ class Finances(GUIBase):
         self._entered_password = None
         self._selected_bank_account_index = None
         self._selected_pension_index = None
+        # UID -> index in the bank accounts and pensions lists
+        self._bank_index_by_uid = {}
+        self._pension_index_by_uid = {}
+        self._last_pension_row_count = None
 
         if example_data:
             self._folder = Finances.GetExampleFolder(folder)
@@ -771,14 +971,16 @@ class Finances(GUIBase):
         if pid_str is None:
             pid = os.getpid()
             FinancesPIDEnvArgs().set(f"{pid}")
-            self._backup_data_files(self._config.get_config_folder())
+            self._backup_data_files(self._config.get_config_folder(),
+                                    min_interval_seconds=Finances.MIN_STARTUP_BACKUP_INTERVAL_SECONDS)
 
         else:
             stored_pid = int(pid_str)
             current_pid = os.getpid()
             if stored_pid != current_pid:
                 FinancesPIDEnvArgs().set(f"{current_pid}")
-                self._backup_data_files(self._config.get_config_folder())
+                self._backup_data_files(self._config.get_config_folder(),
+                                        min_interval_seconds=Finances.MIN_STARTUP_BACKUP_INTERVAL_SECONDS)
 
     def getBankAccountGUI(self):
         return self._bankAccountGUI
@@ -895,6 +1097,9 @@ class Finances(GUIBase):
             self._config.load_config(self._password)
             self._load_global_config()
             self._init_top_level()
+            # Save changes deferred via Config.defer_save() periodically and when the browser disconnects.
+            ui.timer(Finances.DEFERRED_SAVE_SECONDS, self._config.flush_deferred_saves)
+            ui.context.client.on_disconnect(self._config.flush_deferred_saves)
             self._show_bank_account_list()
             self._show_pension_list()
             self._show_monthly_spending_list()
@@ -1013,9 +1218,8 @@ class Finances(GUIBase):
                     tabObjList.append(tabObj)
 
             with ui.tab_panels(self._tabs, value=tabObjList[0]).classes('w-full') as self._tab_panels:
-                for tabObj in tabObjList:
+                for tabIndex, tabObj in enumerate(tabObjList):
                     with ui.tab_panel(tabObj):
-                        tabIndex = tabObjList.index(tabObj)
                         tabMethodInitList[tabIndex]()
 
             selected_tab = FinancesEnvArgs().get()
@@ -1034,43 +1238,61 @@ class Finances(GUIBase):
         self._pension_owner_list.append(self._global_configuration_dict[Finances.MY_NAME_FIELD])
         self._pension_owner_list.append(self._global_configuration_dict[Finances.PARTNER_NAME_FIELD])
 
-    def _backup_data_files(self, data_folder):
+    def _backup_data_files(self, data_folder, min_interval_seconds=0):
         """@brief Backup files in the data folder.
-           @param data_folder The folder containing the data files created by this tool."""
-        MAX_BACKUPS = 30
+           @param data_folder The folder containing the data files created by this tool.
+           @param min_interval_seconds If the newest backup is younger than this then no backup is made."""
         if os.path.isdir(data_folder):
             backup_folder = os.path.join(data_folder, 'backup')
             if not os.path.isdir(backup_folder):
                 os.makedirs(backup_folder)
+
+            if min_interval_seconds > 0:
+                backup_names = sorted(os.listdir(backup_folder))
+                if backup_names:
+                    newest_backup = os.path.join(backup_folder, backup_names[-1])
+                    if datetime.now().timestamp() - os.path.getmtime(newest_backup) < min_interval_seconds:
+                        self._uio.info(f"Skipped backup as {newest_backup} is less than {min_interval_seconds} seconds old.")
+                        return
+
             timestamp_str = datetime.now().strftime("%Y-%m-%d-%H_%M_%S")
             this_backup_folder = os.path.join(backup_folder, timestamp_str)
-            if not os.path.isdir(this_backup_folder):
-                os.makedirs(this_backup_folder)
-            # Copy the data files to the backup folder
-            items = os.listdir(data_folder)
-            file_list = [item for item in items if os.path.isfile(os.path.join(data_folder, item))]
-            for _file in file_list:
-                src_file = os.path.join(data_folder, _file)
-                dest_file = os.path.join(this_backup_folder, _file)
-                shutil.copy(src_file, dest_file)
-            self._uio.info(f"Backed up {data_folder} to {this_backup_folder}")
-
-            # Prune old backups, keeping only the most recent MAX_BACKUPS
-            existing_backups = sorted([
-                os.path.join(backup_folder, d)
-                for d in os.listdir(backup_folder)
-                if os.path.isdir(os.path.join(backup_folder, d))
-            ])
-            while len(existing_backups) > MAX_BACKUPS:
-                oldest = existing_backups.pop(0)
-                shutil.rmtree(oldest)
-                self._uio.info(f"Removed old backup: {oldest}")
+            # Copy the data files to the backup folder. copyfile() lets the kernel copy the
+            # data (sendfile) rather than reading/writing it through python. Hard links are not
+            # used as the config files may be rewritten in place which would alter the backup.
+            # scandir() entries know whether they are files without a stat() per entry.
+            with os.scandir(data_folder) as entries:
+                file_list = [entry for entry in entries if entry.is_file()]
+            if file_list:
+                if not os.path.isdir(this_backup_folder):
+                    os.makedirs(this_backup_folder)
+                for entry in file_list:
+                    shutil.copyfile(entry.path, os.path.join(this_backup_folder, entry.name))
+                self._uio.info(f"Backed up {data_folder} to {this_backup_folder}")
+
+            # Prune old backups in the background so that startup is not held up.
+            self._start_background_thread(self._prune_backups, args=(backup_folder,))
 
         else:
             raise Exception(f"{data_folder} data folder not found.")
 
+    def _prune_backups(self, backup_folder):
+        """@brief Remove old backups, keeping only the most recent Finances.MAX_BACKUPS.
+           @param backup_folder The folder holding the timestamped backup folders."""
+        # The timestamped folder names sort into date order.
+        existing_backups = sorted([
+            os.path.join(backup_folder, d)
+            for d in os.listdir(backup_folder)
+            if os.path.isdir(os.path.join(backup_folder, d))
+        ])
+        for oldest in existing_backups[:-Finances.MAX_BACKUPS]:
+            shutil.rmtree(oldest)
+            self._uio.info(f"Removed old backup: {oldest}")
+
     def _init_dialogs(self):
         """@brief Create the dialogs used by the app."""
+        # The table dialog is only created if the user asks to see the totals.
+        self._table_dialog = None
         self._init_dialog2()
         self._init_dialog3()
         self._init_update_password_dialog()
@@ -1089,7 +1311,7 @@ class Finances(GUIBase):
                        ]
             self._bank_acount_table = ui.table(columns=columns,
                                                rows=[],
-                                               row_key=BankAccountGUI.ACCOUNT_NAME_LABEL,
+                                               row_key=Config.UID,
                                                selection='single').style('text-align: left;')
             self._bank_acount_table.on('row-dblclick', self._on_bank_acount_table_double_click)
 
@@ -1119,25 +1341,12 @@ class Finances(GUIBase):
         """@brief called when the user double clicks on a bank account balance row."""
         # We can't use the selected table row index to determine the bank account because some
         # rows are not displayed and so the index of the displayed table would not match the index of
-        # the configured accounts.
-        # Therefore we match all the selected table row columns to a bank account.
+        # the configured accounts. Therefore we use the UID of the row.
         row_data = e.args[1]
         bank_account_dict_list = self._config.get_bank_accounts_dict_list()
-        owner = row_data[BankAccountGUI.ACCOUNT_OWNER]
-        bank_name = row_data[BankAccountGUI.BANK]
-        account_name = row_data[BankAccountGUI.ACCOUNT_NAME_LABEL]
-        balance = row_data[BankAccountGUI.BALANCE]
-        for bank_account_dict in bank_account_dict_list:
-            if owner == bank_account_dict[BankAccountGUI.ACCOUNT_OWNER] and \
-               bank_name == bank_account_dict[BankAccountGUI.ACCOUNT_BANK_NAME_LABEL] and \
-               account_name == bank_account_dict[BankAccountGUI.ACCOUNT_NAME_LABEL]:
-                balance_table = bank_account_dict[BankAccountGUI.TABLE]
-                if balance_table and len(balance_table) > 0:
-                    _balance = balance_table[-1][1]
-                else:
-                    _balance = 0
-                if float(balance) == float(_balance):
-                    self._update_bank_account(False, bank_account_dict)
+        index = self._get_index_by_uid(bank_account_dict_list, self._bank_index_by_uid, row_data.get(Config.UID))
+        if index >= 0:
+            self._update_bank_account(False, bank_account_dict_list[index])
 
     def _init_dialog2(self):
         """@brief Create a dialog presented to the user to check that they wish to delete a bank account."""
@@ -1166,16 +1375,17 @@ class Finances(GUIBase):
         """@brief Show a table of the configured bank accounts.
            @param show_only_active_accounts If True don't show inactive accounts."""
         if self._bank_acount_table:
-            self._bank_acount_table.rows.clear()
-            self._bank_acount_table.update()
+            rows = []
             bank_accounts_dict_list = self._config.get_bank_accounts_dict_list()
+            self._bank_index_by_uid = Config.GetIndexByUID(bank_accounts_dict_list)
             total = 0
-            for bank_account_dict in bank_accounts_dict_list:
-                owner = bank_account_dict[BankAccountGUI.ACCOUNT_OWNER]
-                bank = bank_account_dict[BankAccountGUI.ACCOUNT_BANK_NAME_LABEL]
-                account_name = bank_account_dict[BankAccountGUI.ACCOUNT_NAME_LABEL]
-                active_account = bank_account_dict[BankAccountGUI.ACCOUNT_ACTIVE]
-                balanceTable = bank_account_dict[BankAccountGUI.TABLE]
+            get_fields = itemgetter(Config.UID,
+                                    BankAccountGUI.ACCOUNT_OWNER,
+                                    BankAccountGUI.ACCOUNT_BANK_NAME_LABEL,
+                                    BankAccountGUI.ACCOUNT_NAME_LABEL,
+                                    BankAccountGUI.ACCOUNT_ACTIVE,
+                                    BankAccountGUI.TABLE)
+            for uid, owner, bank, account_name, active_account, balanceTable in map(get_fields, bank_accounts_dict_list):
                 balance = 0
                 if active_account:
                     balance = 0
@@ -1190,15 +1400,19 @@ class Finances(GUIBase):
                 if show_only_positive_balance_accounts and balance <= 0.0:
                     show_account = False
                 if show_account:
-                    self._bank_acount_table.add_row({BankAccountGUI.ACCOUNT_OWNER: owner,
-                                                     BankAccountGUI.BANK: bank,
-                                                     BankAccountGUI.ACCOUNT_NAME_LABEL: account_name,
-                                                     BankAccountGUI.BALANCE: f"{balance:.2f}"})
+                    rows.append({Config.UID: uid,
+                                 BankAccountGUI.ACCOUNT_OWNER: owner,
+                                 BankAccountGUI.BANK: bank,
+                                 BankAccountGUI.ACCOUNT_NAME_LABEL: account_name,
+                                 BankAccountGUI.BALANCE: f"{balance:.2f}"})
             # Add last empty row to show the totals
-            self._bank_acount_table.add_row({BankAccountGUI.ACCOUNT_OWNER: "",
-                                             BankAccountGUI.BANK: "",
-                                             BankAccountGUI.ACCOUNT_NAME_LABEL: "Total",
-                                             BankAccountGUI.BALANCE: f"{total:.2f}"})
+            rows.append({Config.UID: "",
+                         BankAccountGUI.ACCOUNT_OWNER: "",
+                         BankAccountGUI.BANK: "",
+                         BankAccountGUI.ACCOUNT_NAME_LABEL: "Total",
+                         BankAccountGUI.BALANCE: f"{total:.2f}"})
+            # Replace all the rows with a single update rather than an update per row.
+            self._bank_acount_table.rows = rows
             self._bank_acount_table.run_method(
                 'scrollTo', len(self._bank_acount_table.rows)-1)
 
@@ -1216,9 +1430,9 @@ class Finances(GUIBase):
         if len(selected_dict) > 0:
             selected_dict = selected_dict[0]
             if selected_dict:
-                bank_name = selected_dict[BankAccountGUI.BANK]
-                account_name = selected_dict[BankAccountGUI.ACCOUNT_NAME_LABEL]
-                selected_index = self._get_bank_account_index_by_name(bank_name, account_name)
+                selected_index = self._get_index_by_uid(self._config.get_bank_accounts_dict_list(),
+                                                        self._bank_index_by_uid,
+                                                        selected_dict.get(Config.UID))
 
         if selected_index is None and \
            self._selected_bank_account_index is not None and \
@@ -1227,25 +1441,19 @@ class Finances(GUIBase):
 
         return selected_index
 
-    def _get_bank_account_index_by_name(self, bank_name, account_name):
-        """@brief Get a bank account index in the list of bank accounts.
-           @param _bank The name of the bank.
-           @param _account_name The name of the bank account.
+    def _get_index_by_uid(self, dict_list, index_by_uid, uid):
+        """@brief Get the index of a bank account or pension from its UID.
+           @param dict_list The list of bank account or pension dicts.
+           @param index_by_uid The UID -> index dict built when the table was displayed. This is
+                               rebuilt in place if the list has changed since.
+           @param uid The UID of the bank account or pension.
            @return The index (0,1,2 etc) if found or -1 if not found."""
-        selected_index = -1
-        index = 0
-        found = False
-        for bank_account_dict in self._config.get_bank_accounts_dict_list():
-            _bank = bank_account_dict[BankAccountGUI.ACCOUNT_BANK_NAME_LABEL]
-            _account_name = bank_account_dict[BankAccountGUI.ACCOUNT_NAME_LABEL]
-            if _bank == bank_name and \
-                    _account_name == account_name:
-                found = True
-                break
-            index = index + 1
-        if found:
-            selected_index = index
-        return selected_index
+        index = index_by_uid.get(uid, -1)
+        if index < 0 or index >= len(dict_list) or dict_list[index].get(Config.UID) != uid:
+            index_by_uid.clear()
+            index_by_uid.update(Config.GetIndexByUID(dict_list))
+            index = index_by_uid.get(uid, -1)
+        return index
 
     def _get_selected_bank_account_dict(self):
         """@brief Get the selected bank account dict.
@@ -1290,18 +1498,14 @@ class Finances(GUIBase):
         """@brief edit bank account details.
            @param add If True then add to the list of available bank accounts.
            @param bank_account_dict A dict holding the bank account details."""
-        if isinstance(bank_account_dict, dict):
-            # Don't save the tab as the bank account is the first and this is the default displayed tab.
-            self._bankAccountGUI.set_args(add,
-                                          bank_account_dict,
-                                          self._savings_owner_list,
-                                          self._password,
-                                          self._folder)
-            # This will open the new page in the same browser window
-            ui.run_javascript("window.open('/bank_accounts_page', '_parent')")
-
-        else:
-            ui.notify("Select a bank account to view.")
+        # Don't save the tab as the bank account is the first and this is the default displayed tab.
+        self._bankAccountGUI.set_args(add,
+                                      bank_account_dict,
+                                      self._savings_owner_list,
+                                      self._password,
+                                      self._folder)
+        # This will open the new page in the same browser window
+        ui.run_javascript("window.open('/bank_accounts_page', '_parent')")
 
     # methods associated with pensions
 
@@ -1316,9 +1520,11 @@ class Finances(GUIBase):
                        ]
             self._pension_table = ui.table(columns=columns,
                                            rows=[],
-                                           row_key='Description',
+                                           row_key=Config.UID,
                                            selection='single').classes('h-96').props('virtual-scroll')
             self._pension_table.on('row-dblclick', self._on_pensions_table_double_click)
+            # A new table has not been scrolled yet.
+            self._last_pension_row_count = None
             self._show_pension_list()
 
         with ui.row():
@@ -1331,20 +1537,12 @@ class Finances(GUIBase):
 
     def _on_pensions_table_double_click(self, e):
         """@brief called when the user double clicks on a bank account balance row."""
-        pension_index = -1
         row_data = e.args[1]
-        rows = self._pension_table.rows
-        try:
-            pension_index = next(i for i, row in enumerate(rows) if row == row_data)
-        except StopIteration:
-            pass
-
+        pension_dict_list = self._config.get_pension_dict_list()
+        pension_index = self._get_index_by_uid(pension_dict_list, self._pension_index_by_uid, row_data.get(Config.UID))
         if pension_index >= 0:
             self._selected_pension_index = pension_index
-            pension_dict_list = self._config.get_pension_dict_list()
-            pension_dict = pension_dict_list[pension_index]
-            if pension_dict:
-                self._update_pension(False, pension_dict)
+            self._update_pension(False, pension_dict_list[pension_index])
 
     def _init_dialog3(self):
         """@brief Create a dialog presented to the user to check that they wish to delete a pension."""
@@ -1394,15 +1592,17 @@ class Finances(GUIBase):
     def _show_pension_list(self):
         """@brief Show a table of the configured pensions."""
         if self._pension_table:
-            self._pension_table.rows.clear()
-            self._pension_table.update()
+            rows = []
             pension_dict_list = self._config.get_pension_dict_list()
+            self._pension_index_by_uid = Config.GetIndexByUID(pension_dict_list)
             total = 0
+            get_fields = itemgetter(Config.UID,
+                                    PensionGUI.PENSION_PROVIDER_LABEL,
+                                    PensionGUI.PENSION_DESCRIPTION_LABEL,
+                                    PensionGUI.PENSION_OWNER_LABEL,
+                                    PensionGUI.STATE_PENSION)
             for pension_dict in pension_dict_list:
-                provider = pension_dict[PensionGUI.PENSION_PROVIDER_LABEL]
-                description = pension_dict[PensionGUI.PENSION_DESCRIPTION_LABEL]
-                owner = pension_dict[PensionGUI.PENSION_OWNER_LABEL]
-                statePension = pension_dict[PensionGUI.STATE_PENSION]
+                uid, provider, description, owner, statePension = get_fields(pension_dict)
                 value = ""
                 if not statePension:
                     value = 0
@@ -1414,19 +1614,25 @@ class Finances(GUIBase):
                             value = lastRow[1]
                             total += value
 
-                self._pension_table.add_row({PensionGUI.PENSION_PROVIDER_LABEL: provider,
-                                             PensionGUI.PENSION_DESCRIPTION_LABEL: description,
-                                             PensionGUI.PENSION_OWNER_LABEL: owner,
-                                             PensionGUI.VALUE: value})
+                rows.append({Config.UID: uid,
+                             PensionGUI.PENSION_PROVIDER_LABEL: provider,
+                             PensionGUI.PENSION_DESCRIPTION_LABEL: description,
+                             PensionGUI.PENSION_OWNER_LABEL: owner,
+                             PensionGUI.VALUE: value})
 
             # Add last empty row to show the totals
-            self._pension_table.add_row({PensionGUI.PENSION_PROVIDER_LABEL: "",
-                                         PensionGUI.PENSION_DESCRIPTION_LABEL: "",
-                                         PensionGUI.PENSION_OWNER_LABEL: "Total",
-                                         PensionGUI.VALUE: f"{total:.2f}"})
-
-            self._pension_table.run_method(
-                'scrollTo', len(self._bank_acount_table.rows)-1)
+            rows.append({Config.UID: "",
+                         PensionGUI.PENSION_PROVIDER_LABEL: "",
+                         PensionGUI.PENSION_DESCRIPTION_LABEL: "",
+                         PensionGUI.PENSION_OWNER_LABEL: "Total",
+                         PensionGUI.VALUE: f"{total:.2f}"})
+            # Replace all the rows with a single update rather than an update per row.
+            self._pension_table.rows = rows
+
+            # Only scroll to the totals row if the number of rows has changed.
+            if len(rows) != self._last_pension_row_count:
+                self._pension_table.run_method('scrollTo', len(rows)-1)
+                self._last_pension_row_count = len(rows)
 
     def _delete_pension(self):
         """@brief Delete the pension."""
@@ -1442,9 +1648,9 @@ class Finances(GUIBase):
         if len(selected_dict) > 0:
             selected_dict = selected_dict[0]
             if selected_dict:
-                provider = selected_dict['Provider']
-                description = selected_dict['Description']
-                selected_index = self._get_selected_pension_index_by_provider_and_description(provider, description)
+                selected_index = self._get_index_by_uid(self._config.get_pension_dict_list(),
+                                                        self._pension_index_by_uid,
+                                                        selected_dict.get(Config.UID))
 
         if selected_index is None and \
            self._selected_pension_index is not None and \
@@ -1453,26 +1659,6 @@ class Finances(GUIBase):
 
         return selected_index
 
-    def _get_selected_pension_index_by_provider_and_description(self, provider, description):
-        """@brief Get a pension index in the list of pensions.
-           @param provider The name of the pension provider.
-           @param description The description of the pension.
-           @return The index (0,1,2 etc) if found or -1 if not found."""
-        selected_index = -1
-        index = 0
-        found = False
-        for pension_dict in self._config.get_pension_dict_list():
-            _provider = pension_dict[PensionGUI.PENSION_PROVIDER_LABEL]
-            _description = pension_dict[PensionGUI.PENSION_DESCRIPTION_LABEL]
-            if _provider == provider and _description == description:
-                found = True
-                break
-
-            index = index + 1
-        if found:
-            selected_index = index
-        return selected_index
-
     def _get_selected_pension_dict(self):
         """@brief Get the selected pension dict.
            @return The selected pension dict or None if no pension is selected."""
@@ -1504,43 +1690,36 @@ class Finances(GUIBase):
         """@brief edit pension details.
            @param add If True then add to the list of available pensions.
            @param pension_dict A dict holding the pension details."""
-        if isinstance(pension_dict, dict):
-            # Save tab int env so that it can be restored on return to the page
-            FinancesEnvArgs().set(self._tabs.value)
-            self._pensionsGUI.set_args(add,
-                                       pension_dict,
-                                       self._pension_owner_list,
-                                       self._password,
-                                       self._folder,
-                                       self._get_selected_pension_index())
-            # This will open the new page in the same browser window
-            ui.run_javascript("window.open('/pensions_page', '_parent')")
-
-        else:
-            ui.notify("Select a bank account to view.")
-
-    def _init_table_dialog(self, table):
+        # Save tab int env so that it can be restored on return to the page
+        FinancesEnvArgs().set(self._tabs.value)
+        self._pensionsGUI.set_args(add,
+                                   pension_dict,
+                                   self._pension_owner_list,
+                                   self._password,
+                                   self._folder,
+                                   self._get_selected_pension_index())
+        # This will open the new page in the same browser window
+        ui.run_javascript("window.open('/pensions_page', '_parent')")
+
+    def _init_table_dialog(self):
+        """@brief Create the dialog used to display a table. This is created when first needed."""
         with ui.dialog() as self._table_dialog, ui.card():
-            columns = []
-            index = 0
-            for _ in table:
-                row = {'name': f'c{index}', 'label': '', 'field': f'c{index}'}
-                columns.append(row)
-                index = index + 1
-            self._table_dialog_table = ui.table(columns=columns, rows=[])
-
-            for row in table:
-                row_dict = {}
-                column_index = 0
-                for value in row:
-                    key = f'c{column_index}'
-                    row_dict[key] = value
-                    column_index = column_index + 1
-                self._table_dialog_table.add_row(row_dict)
+            self._table_dialog_table = ui.table(columns=[], rows=[])
 
             with ui.row():
                 ui.button('OK', on_click=self._table_dialog_ok_button_selected)
 
+    def _show_table_dialog(self, table):
+        """@brief Show a table in a dialog.
+           @param table A list of rows. Each row is a list of values."""
+        if self._table_dialog is None:
+            self._init_table_dialog()
+        # One column for each value in the widest row.
+        column_count = max(map(len, table), default=0)
+        self._table_dialog_table.columns = [{'name': f'c{index}', 'label': '', 'field': f'c{index}'} for index in range(column_count)]
+        self._table_dialog_table.rows = [{f'c{index}': value for index, value in enumerate(row)} for row in table]
+        self._table_dialog.open()
+
     def _table_dialog_ok_button_selected(self):
         self._table_dialog.close()
 
@@ -1605,7 +1784,7 @@ class Finances(GUIBase):
         monthly_spending_dict = self._get_monthly_spending_dict()
         if Finances.MONTHLY_SPENDING_NOTES in monthly_spending_dict:
             monthly_spending_dict[Finances.MONTHLY_SPENDING_NOTES] = self._information_field.value + event.args.get('key')
-            self._config._save_monthly_spending_dict()
+            self._config.defer_save(self._config._save_monthly_spending_dict)
 
     def _add_monthly_spending(self):
         """@brief Add to the monthly spending table."""
@@ -1656,27 +1835,18 @@ class Finances(GUIBase):
     def _show_monthly_spending_list(self):
         """@brief Display the monthly spending list."""
         if self._monthly_spend_table:
-            self._monthly_spend_table.rows.clear()
-            self._monthly_spend_table.update()
             monthly_spending_dict = self._get_monthly_spending_dict()
-            if Finances.MONTHLY_SPENDING_TABLE in monthly_spending_dict:
-                monthly_spending_table = monthly_spending_dict[Finances.MONTHLY_SPENDING_TABLE]
-                for row in monthly_spending_table:
-                    if len(row) >= 2:
-                        _date = row[0]
-                        _amount = row[1]
-                        self._monthly_spend_table.add_row({Finances.MONTHLY_SPEND_DATE: _date,
-                                                           Finances.MONTHLY_SPEND_AMOUNT: _amount})
+            monthly_spending_table = monthly_spending_dict.get(Finances.MONTHLY_SPENDING_TABLE, [])
+            # Assign all the rows at once so that a single update is sent to the browser.
+            self._monthly_spend_table.rows = [{Finances.MONTHLY_SPEND_DATE: row[0],
+                                               Finances.MONTHLY_SPEND_AMOUNT: row[1]} for row in monthly_spending_table if len(row) >= 2]
             self._monthly_spend_table.run_method('scrollTo', len(self._monthly_spend_table.rows)-1)
 
     def _get_monthly_spending_dict(self):
         """@brief Get the dict that holds the monthly spending."""
         monthly_spending_dict = self._config.get_monthly_spending_dict()
-        if Finances.MONTHLY_SPENDING_TABLE not in monthly_spending_dict:
-            monthly_spending_dict[Finances.MONTHLY_SPENDING_TABLE] = []
-
-        if Finances.MONTHLY_SPENDING_NOTES not in monthly_spending_dict:
-            monthly_spending_dict[Finances.MONTHLY_SPENDING_NOTES] = ""
+        monthly_spending_dict.setdefault(Finances.MONTHLY_SPENDING_TABLE, [])
+        monthly_spending_dict.setdefault(Finances.MONTHLY_SPENDING_NOTES, "")
 
         return monthly_spending_dict
 
@@ -1838,14 +2008,9 @@ class Finances(GUIBase):
     def _ensure_default_global_config_keys(self):
         self._config.load_global_configuration()
         global_configuration_dict = self._config.get_global_configuration_dict()
-        if Finances.MY_NAME_FIELD not in global_configuration_dict:
-            global_configuration_dict[Finances.MY_NAME_FIELD] = ""
-
-        if Finances.PARTNER_NAME_FIELD not in global_configuration_dict:
-            global_configuration_dict[Finances.PARTNER_NAME_FIELD] = ""
-
-        if Finances.MC_SIMULATIONS_FIELD not in global_configuration_dict:
-            global_configuration_dict[Finances.MC_SIMULATIONS_FIELD] = Finances.DEFAULT_MC_SIMULATIONS
+        global_configuration_dict.setdefault(Finances.MY_NAME_FIELD, "")
+        global_configuration_dict.setdefault(Finances.PARTNER_NAME_FIELD, "")
+        global_configuration_dict.setdefault(Finances.MC_SIMULATIONS_FIELD, Finances.DEFAULT_MC_SIMULATIONS)
 
         return global_configuration_dict
 
@@ -1868,40 +2033,28 @@ class Finances(GUIBase):
         bank_accounts_dict_list = self._config.get_bank_accounts_dict_list()
         pension_dict_list = self._config.get_pension_dict_list()
 
+        # Group the latest balance of each account by owner. math.fsum() is used for
+        # the totals as it does not accumulate rounding errors as += does.
         savings_totals_dict = {}
         for bank_accounts_dict in bank_accounts_dict_list:
-            owner = bank_accounts_dict[BankAccountGUI.ACCOUNT_OWNER]
-            if owner not in savings_totals_dict:
-                savings_totals_dict[owner] = []
-
-            active = bank_accounts_dict[BankAccountGUI.ACCOUNT_ACTIVE]
+            amount_list = savings_totals_dict.setdefault(bank_accounts_dict[BankAccountGUI.ACCOUNT_OWNER], [])
             # Only include active accounts.
-            if active:
-                last_row = bank_accounts_dict[BankAccountGUI.TABLE][-1]
-                amount = float(last_row[1])
-                savings_totals_dict[owner].append(amount)
+            if bank_accounts_dict[BankAccountGUI.ACCOUNT_ACTIVE]:
+                amount_list.append(float(bank_accounts_dict[BankAccountGUI.TABLE][-1][1]))
 
         pensions_totals_dict = {}
         for pension_dict in pension_dict_list:
-            owner = pension_dict[PensionGUI.PENSION_OWNER_LABEL]
-            if owner not in pensions_totals_dict:
-                pensions_totals_dict[owner] = []
-
+            value_list = pensions_totals_dict.setdefault(pension_dict[PensionGUI.PENSION_OWNER_LABEL], [])
             # We can't sum values of state pensions. If not a state pension assume a
             # personal pension fund.
             if not pension_dict[PensionGUI.STATE_PENSION]:
-                last_row = pension_dict[PensionGUI.PENSION_TABLE][-1]
-                value = float(last_row[1])
-                pensions_totals_dict[owner].append(value)
+                value_list.append(float(pension_dict[PensionGUI.PENSION_TABLE][-1][1]))
 
         table_rows = [['Savings', '']]
-        savings_total = 0
-        for owner in savings_totals_dict:
+        for owner, amount_list in savings_totals_dict.items():
             if owner:
-                owner_total = sum(savings_totals_dict[owner])
-                row = (owner, f'£{owner_total:0.2f}')
-                table_rows.append(row)
-                savings_total += owner_total
+                table_rows.append((owner, f'£{math.fsum(amount_list):0.2f}'))
+        savings_total = math.fsum(amount for owner, amount_list in savings_totals_dict.items() if owner for amount in amount_list)
 
         row = ('Total', f'£{savings_total:0.2f}')
         table_rows.append(row)
@@ -1910,12 +2063,9 @@ class Finances(GUIBase):
         table_rows.append(row)
 
         table_rows.append(['Pensions', ''])
-        pensions_total = 0
-        for owner in pensions_totals_dict:
-            owner_total = sum(pensions_totals_dict[owner])
-            row = (owner, f'£{owner_total:0.2f}')
-            table_rows.append(row)
-            pensions_total += owner_total
+        for owner, value_list in pensions_totals_dict.items():
+            table_rows.append((owner, f'£{math.fsum(value_list):0.2f}'))
+        pensions_total = math.fsum(value for value_list in pensions_totals_dict.values() for value in value_list)
 
         row = ('Total', f'£{pensions_total:0.2f}')
         table_rows.append(row)
@@ -1927,8 +2077,7 @@ class Finances(GUIBase):
         row = ('Grand Total', f'£{grand_total:0.2f}')
         table_rows.append(row)
 
-        self._init_table_dialog(table_rows)
-        self._table_dialog.open()
+        self._show_table_dialog(table_rows)
 
     def _report2(self):
         """@brief Plot the financial future based on given parameters."""
@@ -1995,6 +2144,21 @@ class BankAccountGUI(GUIBase):
     TABLE = "table"
     BALANCE = 'Balance (£)'
     BANK = 'Bank'
+    # The columns of the balance table. These are the same every time the page is displayed.
+    TABLE_COLUMNS = [{'name': GUIBase.DATE, 'label': GUIBase.DATE, 'field': GUIBase.DATE},
+                     {'name': BALANCE, 'label': BALANCE, 'field': BALANCE}]
+    # The values of any bank account keys that are missing. The table is not included
+    # here because each bank account must have its own list.
+    DEFAULT_BANK_ACCOUNT_VALUES = {ACCOUNT_ACTIVE: True,
+                                   ACCOUNT_BANK_NAME_LABEL: "",
+                                   ACCOUNT_NAME_LABEL: "",
+                                   ACCOUNT_SORT_CODE: "",
+                                   ACCOUNT_NUMBER: "",
+                                   ACCOUNT_OWNER: "",
+                                   ACCOUNT_INTEREST_RATE: 0.0,
+                                   ACCOUNT_INTEREST_RATE_TYPE: "Fixed",
+                                   ACCOUNT_OPEN_DATE: "",
+                                   ACCOUNT_NOTES: ""}
 
     def __init__(self):
         """@brief Parameterless constructor."""
@@ -2003,7 +2167,8 @@ class BankAccountGUI(GUIBase):
         self._config = None
         self._owner_list = None
         self._selected_row_index = -1
-        self._bank_account_field_list = []
+        self._bank_account_field_dict = {}
+        self._row_index = {}
 
     def set_args(self, add, bank_account_dict, owner_list, config_password, config_folder):
         """
@@ -2025,38 +2190,9 @@ class BankAccountGUI(GUIBase):
 
     def _ensure_default_bank_account_keys(self, bank_account_dict):
         """@brief Ensure the bank account dict has the required keys."""
-        if BankAccountGUI.ACCOUNT_ACTIVE not in bank_account_dict:
-            bank_account_dict[BankAccountGUI.ACCOUNT_ACTIVE] = True
-
-        if BankAccountGUI.ACCOUNT_BANK_NAME_LABEL not in bank_account_dict:
-            bank_account_dict[BankAccountGUI.ACCOUNT_BANK_NAME_LABEL] = ""
-
-        if BankAccountGUI.ACCOUNT_NAME_LABEL not in bank_account_dict:
-            bank_account_dict[BankAccountGUI.ACCOUNT_NAME_LABEL] = ""
-
-        if BankAccountGUI.ACCOUNT_SORT_CODE not in bank_account_dict:
-            bank_account_dict[BankAccountGUI.ACCOUNT_SORT_CODE] = ""
-
-        if BankAccountGUI.ACCOUNT_NUMBER not in bank_account_dict:
-            bank_account_dict[BankAccountGUI.ACCOUNT_NUMBER] = ""
-
-        if BankAccountGUI.ACCOUNT_OWNER not in bank_account_dict:
-            bank_account_dict[BankAccountGUI.ACCOUNT_OWNER] = ""
-
-        if BankAccountGUI.ACCOUNT_INTEREST_RATE not in bank_account_dict:
-            bank_account_dict[BankAccountGUI.ACCOUNT_INTEREST_RATE] = 0.0
-
-        if BankAccountGUI.ACCOUNT_INTEREST_RATE_TYPE not in bank_account_dict:
-            bank_account_dict[BankAccountGUI.ACCOUNT_INTEREST_RATE_TYPE] = "Fixed"
-
-        if BankAccountGUI.ACCOUNT_OPEN_DATE not in bank_account_dict:
-            bank_account_dict[BankAccountGUI.ACCOUNT_OPEN_DATE] = ""
-
-        if BankAccountGUI.ACCOUNT_NOTES not in bank_account_dict:
-            bank_account_dict[BankAccountGUI.ACCOUNT_NOTES] = ""
-
-        if BankAccountGUI.TABLE not in bank_account_dict:
-            bank_account_dict[BankAccountGUI.TABLE] = []
+        for key, value in BankAccountGUI.DEFAULT_BANK_ACCOUNT_VALUES.items():
+            bank_account_dict.setdefault(key, value)
+        bank_account_dict.setdefault(BankAccountGUI.TABLE, [])
 
         return bank_account_dict
 
@@ -2077,7 +2213,8 @@ class BankAccountGUI(GUIBase):
                               show_load_save_notifications=False)
         self._config.load_config(self._config_password)
 
-        self._init_add_row_dialog()
+        # The add row dialog is created when first needed.
+        self._add_row_dialog = None
         ui.label("Savings Account").style('font-size: 32px; font-weight: bold;')
         with ui.row():
             bank_active_checkbox = ui.checkbox(
@@ -2111,11 +2248,7 @@ class BankAccountGUI(GUIBase):
 
         with ui.card().style("height: 300px; overflow-y: auto;"):
             with ui.row():
-                columns = [{'name': BankAccountGUI.DATE, 'label': BankAccountGUI.DATE, 'field': BankAccountGUI.DATE},
-                           {'name': BankAccountGUI.BALANCE, 'label': BankAccountGUI.BALANCE,
-                               'field': BankAccountGUI.BALANCE},
-                           ]
-                self._bank_acount_table = ui.table(columns=columns,
+                self._bank_acount_table = ui.table(columns=BankAccountGUI.TABLE_COLUMNS,
                                                    rows=[],
                                                    row_key=BankAccountGUI.DATE,
                                                    selection='single')
@@ -2133,28 +2266,28 @@ class BankAccountGUI(GUIBase):
             ui.button("Save", on_click=self._save_button_selected).tooltip("Save the account details.")
             ui.button("Back", on_click=lambda: ui.navigate.back()).tooltip("Go back to previous window.")
 
-        # Keep a list of fields so that their values can be updated later.
-        self._bank_account_field_list.append(bank_account_bank_name_field)
-        self._bank_account_field_list.append(bank_account_name_field)
-        self._bank_account_field_list.append(bank_account_sort_code_field)
-        self._bank_account_field_list.append(bank_account_number_field)
-        self._bank_account_field_list.append(bank_account_owner_select)
-        self._bank_account_field_list.append(bank_account_open_date_field)
-        self._bank_account_field_list.append(bank_account_interest_rate_field)
-        self._bank_account_field_list.append(bank_account_interest_type_field)
-        self._bank_account_field_list.append(bank_active_checkbox)
-        self._bank_account_field_list.append(bank_notes_field)
-        self._bank_account_field_list.append(self._bank_acount_table)
+        # Keep the field for each bank account key so that their values can be updated later.
+        self._bank_account_field_dict = {BankAccountGUI.ACCOUNT_BANK_NAME_LABEL: bank_account_bank_name_field,
+                                         BankAccountGUI.ACCOUNT_NAME_LABEL: bank_account_name_field,
+                                         BankAccountGUI.ACCOUNT_SORT_CODE: bank_account_sort_code_field,
+                                         BankAccountGUI.ACCOUNT_NUMBER: bank_account_number_field,
+                                         BankAccountGUI.ACCOUNT_OWNER: bank_account_owner_select,
+                                         BankAccountGUI.ACCOUNT_OPEN_DATE: bank_account_open_date_field,
+                                         BankAccountGUI.ACCOUNT_INTEREST_RATE: bank_account_interest_rate_field,
+                                         BankAccountGUI.ACCOUNT_INTEREST_RATE_TYPE: bank_account_interest_type_field,
+                                         BankAccountGUI.ACCOUNT_ACTIVE: bank_active_checkbox,
+                                         BankAccountGUI.ACCOUNT_NOTES: bank_notes_field}
 
         self._update_gui_from_bank_account()
 
     def _bank_acount_table_rowclick(self, event):
-        self._table_rowclick(self._bank_account_field_list[-1], event)
+        self._table_rowclick(self._bank_acount_table, event)
 
     def _on_bank_acount_table_double_click(self, e):
         """@brief called when the user double clicks on a bank account balance row."""
         row_dict = e.args[1]
         try:
+            self._create_add_row_dialog()
             self._date_input_field.value = row_dict[BankAccountGUI.DATE]
             self._amount_field.value = row_dict[BankAccountGUI.BALANCE]
             # Can't edit the date when editing
@@ -2172,10 +2305,16 @@ class BankAccountGUI(GUIBase):
     def _add_table_row(self, row):
         rows = self._bank_account_dict[BankAccountGUI.TABLE]
         rows.append(row)
-        # Sort table in ascending date order
-        sorted_rows = sorted(rows, key=lambda row: datetime.strptime(row[0], "%d-%m-%Y"))
-        self._bank_account_dict[BankAccountGUI.TABLE] = sorted_rows
-        self._display_table_rows(self._bank_acount_table)
+        # Sort table in ascending date order. Sort in place rather than building a copy of the table.
+        rows.sort(key=lambda row: datetime.strptime(row[0], "%d-%m-%Y"))
+        self._row_index = BankAccountGUI.GetRowIndexDict(rows)
+        # The sort is stable so the new row is the last row with its date.
+        self._insert_table_row_ui(self._row_index[row[0]][-1], row)
+
+    def _create_add_row_dialog(self):
+        """@brief Create the add row dialog if it has not yet been created."""
+        if self._add_row_dialog is None:
+            self._init_add_row_dialog()
 
     def _init_add_row_dialog(self):
         """@brief Create a dialog presented to the user to check that they wish to add a bank account."""
@@ -2196,23 +2335,34 @@ class BankAccountGUI(GUIBase):
            BankAccountGUI.CheckDuplicateDate(self._bank_account_dict[BankAccountGUI.TABLE], self._date_input_field.value):
             row = (self._date_input_field.value, self._amount_field.value)
             self._add_table_row(row)
-            self._display_table_rows(self._bank_acount_table)
 
     def _display_table_rows(self, bank_acount_table):
-        """@brief Show a table of the configured bank accounts."""
-        bank_acount_table.rows.clear()
-        bank_acount_table.update()
+        """@brief Show a table of the configured bank accounts.
+                  This redraws every row and so is only used when the page is loaded."""
         table = self._bank_account_dict[BankAccountGUI.TABLE]
-        for row in table:
-            bank_acount_table.add_row({BankAccountGUI.DATE: row[0], BankAccountGUI.BALANCE: row[1]})
-        bank_acount_table.update()
+        bank_acount_table.rows = [{BankAccountGUI.DATE: row[0], BankAccountGUI.BALANCE: row[1]} for row in table]
+        self._row_index = BankAccountGUI.GetRowIndexDict(table)
         bank_acount_table.run_method('scrollTo', len(table)-1)
 
+    def _insert_table_row_ui(self, index, row):
+        """@brief Insert a single row into the displayed table rather than redrawing every row.
+           @param index The index of the row in the table.
+           @param row The (date, balance) row to insert."""
+        self._bank_acount_table.rows.insert(index, {BankAccountGUI.DATE: row[0], BankAccountGUI.BALANCE: row[1]})
+        self._bank_acount_table.update()
+        self._bank_acount_table.run_method('scrollTo', index)
+
+    def _remove_table_row_ui(self, date):
+        """@brief Remove a single row from the displayed table rather than redrawing every row.
+           @param date The date of the row to remove."""
+        self._bank_acount_table.remove_row({BankAccountGUI.DATE: date})
+
     def _add_row_dialog_cancel_button_press(self):
         self._add_row_dialog.close()
 
     def _add_button_handler(self):
         """@brief Handle add button selection events."""
+        self._create_add_row_dialog()
         self._date_input_field.enable()
         self._date_input_field.value = ""
         self._amount_field.value = ""
@@ -2224,15 +2374,15 @@ class BankAccountGUI(GUIBase):
         selected_dict = self._bank_acount_table.selected
         if selected_dict and BankAccountGUI.DATE in selected_dict[0]:
             del_date = selected_dict[0][BankAccountGUI.DATE]
-            table = self._bank_account_dict[BankAccountGUI.TABLE]
-            new_table = []
-            for row in table:
-                date = row[0]
-                if date != del_date:
-                    new_table.append(row)
-            self._bank_account_dict[BankAccountGUI.TABLE] = new_table
+            # Remove every row with the selected date.
+            indexes = self._row_index.pop(del_date, None)
+            if indexes:
+                table = self._bank_account_dict[BankAccountGUI.TABLE]
+                for index in reversed(indexes):
+                    del table[index]
+                self._row_index = BankAccountGUI.GetRowIndexDict(table)
+                self._remove_table_row_ui(del_date)
 
-        self._display_table_rows(self._bank_acount_table)
         bank_account_list = self._config.get_bank_accounts_dict_list()
         # We're editing a bank account so update the bank account
         selected_bank_account_index = self._get_selected_bank_account_index(bank_account_list)
@@ -2242,48 +2392,24 @@ class BankAccountGUI(GUIBase):
 
     def _update_gui_from_bank_account(self):
         """@brief Update the contents of fields from the bank account entered."""
-        for input_field in self._bank_account_field_list:
-            if isinstance(input_field, ui.number):
-                input_field.set_value(self._bank_account_dict[BankAccountGUI.ACCOUNT_INTEREST_RATE])
-
-            elif isinstance(input_field, ui.select):
-                found_field = False
-                properties = input_field.props
-                if 'label' in properties:
-                    label = input_field.props['label']
-                    if label == BankAccountGUI.ACCOUNT_OWNER:
-                        input_field.set_value(self._bank_account_dict[BankAccountGUI.ACCOUNT_OWNER])
-                        found_field = True
-
-                # If not found we assume this is the interest rate type field as this is the only other ui.select
-                # field in the bank account GUI.
-                if not found_field:
-                    input_field.set_value(self._bank_account_dict[BankAccountGUI.ACCOUNT_INTEREST_RATE_TYPE])
-
-            elif isinstance(input_field, ui.checkbox):
-                input_field.value = self._bank_account_dict[BankAccountGUI.ACCOUNT_ACTIVE]
-
-            elif isinstance(input_field, ui.table):
-                self._display_table_rows(input_field)
-
-            else:
-                props = input_field._props
-                key = props['label']
-                input_field.set_value(self._bank_account_dict[key])
+        for key, input_field in self._bank_account_field_dict.items():
+            input_field.set_value(self._bank_account_dict[key])
+        self._display_table_rows(self._bank_acount_table)
 
     def _update_bank_account_from_gui(self):
         """@brief Update the bank account dict. from the GUI fields.
            @return True if enough fields have been filled in to make the bank account valid."""
         valid = False
         # Do some checks on the values entered.
-        if len(self._bank_account_field_list[0].value) == 0:
+        open_date_field = self._bank_account_field_dict[BankAccountGUI.ACCOUNT_OPEN_DATE]
+        if len(self._bank_account_field_dict[BankAccountGUI.ACCOUNT_BANK_NAME_LABEL].value) == 0:
             ui.notify("Bank/Building society name must be entered.")
 
-        elif len(self._bank_account_field_list[1].value) == 0:
+        elif len(self._bank_account_field_dict[BankAccountGUI.ACCOUNT_NAME_LABEL].value) == 0:
             ui.notify("Account name must be entered.")
 
-        elif BankAccountGUI.CheckValidDateString(self._bank_account_field_list[5].value,
-                                                 field_name=self._bank_account_field_list[5].props['label']):
+        elif BankAccountGUI.CheckValidDateString(open_date_field.value,
+                                                 field_name=open_date_field.props['label']):
             # Locate the account in the stored config BEFORE overwriting the dict with the
             # edited GUI values. _get_selected_bank_account_index() matches on fields that
             # include the editable Notes field, so it must run while the dict still holds the
@@ -2296,16 +2422,8 @@ class BankAccountGUI(GUIBase):
                 selected_bank_account_index = self._get_selected_bank_account_index(bank_account_list)
 
             # The table rows were updated previously
-            self._bank_account_dict[BankAccountGUI.ACCOUNT_BANK_NAME_LABEL] = self._bank_account_field_list[0].value
-            self._bank_account_dict[BankAccountGUI.ACCOUNT_NAME_LABEL] = self._bank_account_field_list[1].value
-            self._bank_account_dict[BankAccountGUI.ACCOUNT_SORT_CODE] = self._bank_account_field_list[2].value
-            self._bank_account_dict[BankAccountGUI.ACCOUNT_NUMBER] = self._bank_account_field_list[3].value
-            self._bank_account_dict[BankAccountGUI.ACCOUNT_OWNER] = self._bank_account_field_list[4].value
-            self._bank_account_dict[BankAccountGUI.ACCOUNT_OPEN_DATE] = self._bank_account_field_list[5].value
-            self._bank_account_dict[BankAccountGUI.ACCOUNT_INTEREST_RATE] = self._bank_account_field_list[6].value
-            self._bank_account_dict[BankAccountGUI.ACCOUNT_INTEREST_RATE_TYPE] = self._bank_account_field_list[7].value
-            self._bank_account_dict[BankAccountGUI.ACCOUNT_ACTIVE] = self._bank_account_field_list[8].value
-            self._bank_account_dict[BankAccountGUI.ACCOUNT_NOTES] = self._bank_account_field_list[9].value
+            for key, input_field in self._bank_account_field_dict.items():
+                self._bank_account_dict[key] = input_field.value
 
             if self._add:
                 self._config.add_bank_account(self._bank_account_dict)
@@ -2363,10 +2481,20 @@ class PensionGUI(GUIBase):
     PENSION_TABLE = "table"
     PENSION_OWNER = "Owner"
     VALUE = "Value (£)"
+    # The columns of the pension value table. These are the same every time the page is displayed.
+    TABLE_COLUMNS = [{'name': GUIBase.DATE, 'label': GUIBase.DATE, 'field': GUIBase.DATE},
+                     {'name': AMOUNT, 'label': AMOUNT, 'field': AMOUNT}]
+    # The values of any pension keys that are missing. The table is not included
+    # here because each pension must have its own list.
+    DEFAULT_PENSION_VALUES = {STATE_PENSION: False,
+                              PENSION_PROVIDER_LABEL: "",
+                              PENSION_DESCRIPTION_LABEL: "",
+                              PENSION_OWNER_LABEL: "",
+                              STATE_PENSION_START_DATE: ""}
 
     def __init__(self):
         """@brief Parameterless constructor."""
-        pass
+        self._row_index = {}
 
     def set_args(self, add, pension_dict, owner_list, config_password, config_folder, selected_pension_index):
         """
@@ -2390,23 +2518,9 @@ class PensionGUI(GUIBase):
 
     def _ensure_default_pension_keys(self, pension_dict):
         """@brief Ensure the pension dict has the required keys."""
-        if PensionGUI.STATE_PENSION not in pension_dict:
-            pension_dict[PensionGUI.STATE_PENSION] = False
-
-        if PensionGUI.PENSION_PROVIDER_LABEL not in pension_dict:
-            pension_dict[PensionGUI.PENSION_PROVIDER_LABEL] = ""
-
-        if PensionGUI.PENSION_DESCRIPTION_LABEL not in pension_dict:
-            pension_dict[PensionGUI.PENSION_DESCRIPTION_LABEL] = ""
-
-        if PensionGUI.PENSION_OWNER_LABEL not in pension_dict:
-            pension_dict[PensionGUI.PENSION_OWNER_LABEL] = ""
-
-        if PensionGUI.STATE_PENSION_START_DATE not in pension_dict:
-            pension_dict[PensionGUI.STATE_PENSION_START_DATE] = ""
-
-        if PensionGUI.PENSION_TABLE not in pension_dict:
-            pension_dict[PensionGUI.PENSION_TABLE] = []
+        for key, value in PensionGUI.DEFAULT_PENSION_VALUES.items():
+            pension_dict.setdefault(key, value)
+        pension_dict.setdefault(PensionGUI.PENSION_TABLE, [])
 
         return pension_dict
 
@@ -2426,7 +2540,8 @@ class PensionGUI(GUIBase):
                               show_load_save_notifications=False)
         self._config.load_config(self._config_password)
 
-        self._init_add_row_dialog()
+        # The add row dialog is created when first needed.
+        self._add_row_dialog = None
         ui.label("Pension").style('font-size: 32px; font-weight: bold;')
         self._state_pension_checkbox = ui.checkbox(PensionGUI.STATE_PENSION, value=False).on(
             'click', self._state_pension_checkbox_callback).tooltip("This should be checked if this is a state pension. If not then this should be unchecked.")
@@ -2442,11 +2557,7 @@ class PensionGUI(GUIBase):
 
         with ui.card().style("height: 300px; overflow-y: auto;").tooltip("If a state pension the amount should be the yearly expected state pension. If not a state pension, then the amount should be the pension fund value."):
             with ui.row():
-                columns = [{'name': PensionGUI.DATE, 'label': PensionGUI.DATE, 'field': PensionGUI.DATE},
-                           {'name': PensionGUI.AMOUNT, 'label': PensionGUI.AMOUNT,
-                               'field': PensionGUI.AMOUNT},
-                           ]
-                self._pension_table = ui.table(columns=columns,
+                self._pension_table = ui.table(columns=PensionGUI.TABLE_COLUMNS,
                                                rows=[],
                                                row_key=PensionGUI.DATE,
                                                selection='single')
@@ -2470,6 +2581,7 @@ class PensionGUI(GUIBase):
         """@brief called when the user double clicks on a bank account balance row."""
         row_dict = e.args[1]
         try:
+            self._create_add_row_dialog()
             self._date_input_field.value = row_dict[PensionGUI.DATE]
             self._amount_field.value = row_dict[PensionGUI.AMOUNT]
             # Can't edit the date when editing
@@ -2498,14 +2610,25 @@ class PensionGUI(GUIBase):
                 self._provider_field.enabled = True
 
     def _display_table_rows(self):
-        """@brief Show a table of the configured bank accounts."""
-        self._pension_table.rows.clear()
-        self._pension_table.update()
+        """@brief Show a table of the pension values.
+                  This redraws every row and so is only used when the page is loaded."""
         table = self._pension_dict[PensionGUI.PENSION_TABLE]
-        for row in table:
-            self._pension_table.add_row({PensionGUI.DATE: row[0], PensionGUI.AMOUNT: row[1]})
+        self._pension_table.rows = [{PensionGUI.DATE: row[0], PensionGUI.AMOUNT: row[1]} for row in table]
+        self._row_index = PensionGUI.GetRowIndexDict(table)
+        self._pension_table.run_method('scrollTo', len(table)-1)
+
+    def _insert_table_row_ui(self, index, row):
+        """@brief Insert a single row into the displayed table rather than redrawing every row.
+           @param index The index of the row in the table.
+           @param row The (date, amount) row to insert."""
+        self._pension_table.rows.insert(index, {PensionGUI.DATE: row[0], PensionGUI.AMOUNT: row[1]})
         self._pension_table.update()
-        self._pension_table.run_method('scrollTo', len(self._pension_table.rows)-1)
+        self._pension_table.run_method('scrollTo', index)
+
+    def _create_add_row_dialog(self):
+        """@brief Create the add row dialog if it has not yet been created."""
+        if self._add_row_dialog is None:
+            self._init_add_row_dialog()
 
     def _init_add_row_dialog(self):
         """@brief Create a dialog presented to the user to check that they wish to add a pension value."""
@@ -2518,6 +2641,7 @@ class PensionGUI(GUIBase):
                     "Cancel", on_click=self._add_row_dialog_cancel_button_press)
 
     def _add_button_handler(self):
+        self._create_add_row_dialog()
         self._date_input_field.enable()
         self._add_row_dialog.open()
         self._date_input_field.run_method('focus')
@@ -2526,27 +2650,32 @@ class PensionGUI(GUIBase):
         selected_dict = self._pension_table.selected
         if selected_dict and PensionGUI.DATE in selected_dict[0]:
             del_date = selected_dict[0][PensionGUI.DATE]
-            table = self._pension_dict[PensionGUI.PENSION_TABLE]
-            new_table = []
-            for row in table:
-                date = row[0]
-                if date != del_date:
-                    new_table.append(row)
-            self._pension_dict[PensionGUI.PENSION_TABLE] = new_table
-        self._display_table_rows()
+            # Remove every row with the selected date.
+            indexes = self._row_index.pop(del_date, None)
+            if indexes:
+                table = self._pension_dict[PensionGUI.PENSION_TABLE]
+                for index in reversed(indexes):
+                    del table[index]
+                self._row_index = PensionGUI.GetRowIndexDict(table)
+                self._remove_table_row_ui(del_date)
         self._config.save_pensions()
 
+    def _remove_table_row_ui(self, date):
+        """@brief Remove a single row from the displayed table rather than redrawing every row.
+           @param date The date of the row to remove."""
+        self._pension_table.remove_row({PensionGUI.DATE: date})
+
     def _save_button_handler(self):
         self._update_pension_from_gui()
 
     def _add_table_row(self, row):
-        if PensionGUI.PENSION_TABLE not in self._pension_dict:
-            self._pension_dict[PensionGUI.PENSION_TABLE] = []
-        rows = self._pension_dict[PensionGUI.PENSION_TABLE]
+        rows = self._pension_dict.setdefault(PensionGUI.PENSION_TABLE, [])
         rows.append(row)
-        # Sort table in ascending date order
-        sorted_rows = sorted(rows, key=lambda row: datetime.strptime(row[0], "%d-%m-%Y"))
-        self._pension_dict[PensionGUI.PENSION_TABLE] = sorted_rows
+        # Sort table in ascending date order. Sort in place rather than building a copy of the table.
+        rows.sort(key=lambda row: datetime.strptime(row[0], "%d-%m-%Y"))
+        self._row_index = PensionGUI.GetRowIndexDict(rows)
+        # The sort is stable so the new row is the last row with its date.
+        self._insert_table_row_ui(self._row_index[row[0]][-1], row)
 
     def _add_row_dialog_ok_button_press(self):
         self._add_row_dialog.close()
@@ -2557,7 +2686,6 @@ class PensionGUI(GUIBase):
            PensionGUI.CheckDuplicateDate(self._pension_dict[PensionGUI.PENSION_TABLE], self._date_input_field.value):
             row = (self._date_input_field.value, self._amount_field.value)
             self._add_table_row(row)
-            self._display_table_rows()
 
     def _add_row_dialog_cancel_button_press(self):
         self._add_row_dialog.close()
@@ -2577,13 +2705,8 @@ class PensionGUI(GUIBase):
            @return True if required fields have been entered."""
         valid = False
         duplicate_description = False
-        if self._add:
-            pension_dict_list = self._config.get_pension_dict_list()
-            for pension_dict in pension_dict_list:
-                if PensionGUI.PENSION_DESCRIPTION_LABEL in pension_dict:
-                    _descrip = pension_dict[PensionGUI.PENSION_DESCRIPTION_LABEL]
-                    if _descrip == self._description_field.value:
-                        duplicate_description = True
+        if self._add and self._description_field.value in self._config.get_pension_description_set():
+            duplicate_description = True
 
         self._state_pension_checkbox_callback()
 
@@ -2782,6 +2905,24 @@ class FuturePlotGUI(GUIBase):
     RETIREMENT_PREDICTION_SETTINGS_NAME = "Retirement prediction settings name"
     DEFAULT = "Default"
 
+    # The values of any plot attribute keys that are missing.
+    DEFAULT_PLOT_ATTR_VALUES = {MY_DATE_OF_BIRTH: "",
+                                MY_MAX_AGE: DEFAULT_MALE_MAX_AGE,
+                                PARTNER_DATE_OF_BIRTH: "",
+                                PARTNER_MAX_AGE: DEFAULT_MALE_MAX_AGE + 4,
+                                SAVINGS_INTEREST_RATE_LIST: DEFAULT_RATE_LIST,
+                                PENSION_GROWTH_RATE_LIST: DEFAULT_RATE_LIST,
+                                MONTHLY_AMOUNT_FROM_OTHER_SOURCES: DEFAULT_MONTHLY_AMOUNT_FROM_OTHER_SOURCES,
+                                MONTHLY_INCOME: DEFAULT_MONTHLY_INCOME,
+                                YEARLY_INCREASE_IN_INCOME: DEFAULT_YEARLY_INCREASE_IN_INCOME,
+                                STATE_PENSION_YEARLY_INCREASE_LIST: DEFAULT_STATE_PENSION_YEARLY_INCREASE,
+                                REPORT_START_DATE: "",
+                                PENSION_DRAWDOWN_START_DATE: "",
+                                ENABLE_PENSION_DRAWDOWN_START_DATE: False}
+    # The plot attribute keys that hold a table. Each gets its own empty list if missing.
+    PLOT_ATTR_TABLE_KEYS = (SAVINGS_WITHDRAWAL_TABLE,
+                            PENSION_WITHDRAWAL_TABLE)
+
     YEARLY = 'Yearly'
     MONTHLY = 'Monthly'
 
@@ -2796,14 +2937,22 @@ class FuturePlotGUI(GUIBase):
                   for every month up to and including the stop_datetime.
            @param start_datetime The start datetime for the first datetime instance.
            @param stop_datetime The datetime instance for the last datetime."""
-        current_date = start_datetime
-        current_date = current_date.replace(
-            day=1, hour=0, minute=0, second=0, microsecond=0)
-        date_list = []
-        while current_date <= stop_datetime:
-            date_list.append(current_date)
-            current_date += relativedelta(months=+1)
-        return date_list
+        first_date = start_datetime.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        # Use integer month arithmetic rather than adding a relativedelta each month.
+        # The first of the stop month is never after stop_datetime so it is always included.
+        month_count = (stop_datetime.year - first_date.year) * 12 + stop_datetime.month - first_date.month + 1
+        first_month_index = first_date.month - 1
+        return [first_date.replace(year=first_date.year + (first_month_index + index) // 12,
+                                   month=(first_month_index + index) % 12 + 1) for index in range(month_count)]
+
+    @staticmethod
+    def GetYearIndexList(datetime_list):
+        """@brief Get the year index (0 = first year, 1 = next year and so on) of each month in a
+                  monthly datetime list as returned by GetDateTimeList().
+           @param datetime_list The monthly datetime list.
+           @return A list holding the year index of each month."""
+        first_year = datetime_list[0].year
+        return [_datetime.year - first_year for _datetime in datetime_list]
 
     @staticmethod
     def Datetime2String(_datetime):
@@ -2813,7 +2962,7 @@ class FuturePlotGUI(GUIBase):
     def GetDate(date_str):
         """@brief convert a string to a datetime instance.
            @param date_str The string to be converted into a date."""
-        return datetime.strptime(date_str, '%d-%m-%Y')
+        return GUIBase.ParseDate(date_str)
 
     @staticmethod
     def Table2Dict(table):
@@ -2863,73 +3012,32 @@ class FuturePlotGUI(GUIBase):
         if selected_name in multiple_future_plot_attrs_dict:
             plot_attr_dict = multiple_future_plot_attrs_dict[selected_name]
 
-        if FuturePlotGUI.MY_DATE_OF_BIRTH not in plot_attr_dict:
-            plot_attr_dict[FuturePlotGUI.MY_DATE_OF_BIRTH] = ""
-
-        if FuturePlotGUI.MY_MAX_AGE not in plot_attr_dict:
-            plot_attr_dict[FuturePlotGUI.MY_MAX_AGE] = FuturePlotGUI.DEFAULT_MALE_MAX_AGE
-
-        if FuturePlotGUI.PARTNER_DATE_OF_BIRTH not in plot_attr_dict:
-            plot_attr_dict[FuturePlotGUI.PARTNER_DATE_OF_BIRTH] = ""
-
-        if FuturePlotGUI.PARTNER_MAX_AGE not in plot_attr_dict:
-            plot_attr_dict[FuturePlotGUI.PARTNER_MAX_AGE] = FuturePlotGUI.DEFAULT_MALE_MAX_AGE + 4
-
-        if FuturePlotGUI.SAVINGS_INTEREST_RATE_LIST not in plot_attr_dict:
-            plot_attr_dict[FuturePlotGUI.SAVINGS_INTEREST_RATE_LIST] = FuturePlotGUI.DEFAULT_RATE_LIST
-
-        if FuturePlotGUI.PENSION_GROWTH_RATE_LIST not in plot_attr_dict:
-            plot_attr_dict[FuturePlotGUI.PENSION_GROWTH_RATE_LIST] = FuturePlotGUI.DEFAULT_RATE_LIST
-
-        if FuturePlotGUI.MONTHLY_AMOUNT_FROM_OTHER_SOURCES not in plot_attr_dict:
-            plot_attr_dict[FuturePlotGUI.MONTHLY_AMOUNT_FROM_OTHER_SOURCES] = FuturePlotGUI.DEFAULT_MONTHLY_AMOUNT_FROM_OTHER_SOURCES
-
-        if FuturePlotGUI.MONTHLY_INCOME not in plot_attr_dict:
-            plot_attr_dict[FuturePlotGUI.MONTHLY_INCOME] = FuturePlotGUI.DEFAULT_MONTHLY_INCOME
-
-        if FuturePlotGUI.YEARLY_INCREASE_IN_INCOME not in plot_attr_dict:
-            plot_attr_dict[FuturePlotGUI.YEARLY_INCREASE_IN_INCOME] = FuturePlotGUI.DEFAULT_YEARLY_INCREASE_IN_INCOME
-
-        if FuturePlotGUI.STATE_PENSION_YEARLY_INCREASE_LIST not in plot_attr_dict:
-            plot_attr_dict[FuturePlotGUI.STATE_PENSION_YEARLY_INCREASE_LIST] = FuturePlotGUI.DEFAULT_STATE_PENSION_YEARLY_INCREASE
-
-        if FuturePlotGUI.REPORT_START_DATE not in plot_attr_dict:
-            plot_attr_dict[FuturePlotGUI.REPORT_START_DATE] = ""
-
-        if FuturePlotGUI.PENSION_DRAWDOWN_START_DATE not in plot_attr_dict:
-            plot_attr_dict[FuturePlotGUI.PENSION_DRAWDOWN_START_DATE] = ""
-
-        if FuturePlotGUI.ENABLE_PENSION_DRAWDOWN_START_DATE not in plot_attr_dict:
-            plot_attr_dict[FuturePlotGUI.ENABLE_PENSION_DRAWDOWN_START_DATE] = False
-
-        if FuturePlotGUI.SAVINGS_WITHDRAWAL_TABLE not in plot_attr_dict:
-            plot_attr_dict[FuturePlotGUI.SAVINGS_WITHDRAWAL_TABLE] = []
-
-        if FuturePlotGUI.PENSION_WITHDRAWAL_TABLE not in plot_attr_dict:
-            plot_attr_dict[FuturePlotGUI.PENSION_WITHDRAWAL_TABLE] = []
+        for key, value in FuturePlotGUI.DEFAULT_PLOT_ATTR_VALUES.items():
+            plot_attr_dict.setdefault(key, value)
+        for key in FuturePlotGUI.PLOT_ATTR_TABLE_KEYS:
+            plot_attr_dict.setdefault(key, [])
 
         return plot_attr_dict
 
-    def _get_param_value(self, param_name):
+    def _get_plot_attr_dict(self):
+        """@brief Get the parameters dict of the selected settings name.
+           @return The dict holding the parameters of the selected settings."""
         selected_name = self._get_selected_retirement_predictions_settings_name()
-        multiple_future_plot_attrs_dict = self._config.get_multiple_future_plot_attrs_dict()
-        plot_attr_dict = multiple_future_plot_attrs_dict[selected_name]
+        return self._config.get_multiple_future_plot_attrs_dict()[selected_name]
+
+    def _get_param_value(self, param_name):
+        plot_attr_dict = self._get_plot_attr_dict()
         if param_name not in plot_attr_dict:
             raise Exception(f"{param_name} not found in plot_attr_dict={plot_attr_dict}")
         return plot_attr_dict[param_name]
 
     def _set_param_value(self, param_name, value):
-        selected_name = self._get_selected_retirement_predictions_settings_name()
-        multiple_future_plot_attrs_dict = self._config.get_multiple_future_plot_attrs_dict()
-        plot_attr_dict = multiple_future_plot_attrs_dict[selected_name]
-        plot_attr_dict[param_name] = value
+        self._get_plot_attr_dict()[param_name] = value
 
     def _get_selected_retirement_predictions_settings_name(self):
         """@brief Get the name of the selected retirement predictions settings."""
         selected_retirement_parameters_name_dict = self._config.get_selected_retirement_parameters_name_dict()
-        if FuturePlotGUI.RETIREMENT_PREDICTION_SETTINGS_NAME not in selected_retirement_parameters_name_dict:
-            selected_retirement_parameters_name_dict[FuturePlotGUI.RETIREMENT_PREDICTION_SETTINGS_NAME] = FuturePlotGUI.DEFAULT
-        return selected_retirement_parameters_name_dict[FuturePlotGUI.RETIREMENT_PREDICTION_SETTINGS_NAME]
+        return selected_retirement_parameters_name_dict.setdefault(FuturePlotGUI.RETIREMENT_PREDICTION_SETTINGS_NAME, FuturePlotGUI.DEFAULT)
 
     def _set_selected_retirement_predictions_settings_name(self, name):
         """@brief Set the name of the selected retirement prediction settings.
@@ -2960,6 +3068,8 @@ class FuturePlotGUI(GUIBase):
         self._last_pp_year = None
         self._report_start_date = None
         self._withdrawal_edit_table = None
+        # Set when a parameter field changes so that _update_dict_from_gui() knows to revalidate them.
+        self._gui_dirty = True
 
         self._ensure_keys_present()
         self._init_add_row_dialog()
@@ -3029,6 +3139,21 @@ class FuturePlotGUI(GUIBase):
                     self._state_pension_growth_rate_list_field = ui.input(label=FuturePlotGUI.STATE_PENSION_YEARLY_INCREASE_LIST).style(
                         'width: 500px;').tooltip(tt_text)
 
+        for field in (self._my_dob_field,
+                      self._my_max_age_field,
+                      self._partner_dob_field,
+                      self._partner_max_age_field,
+                      self._start_date_field,
+                      self._enable_pension_drawdown_start_date,
+                      self._pension_drawdown_start_date_field,
+                      self._monthly_income_field,
+                      self._monthly_amount_from_other_sources_field,
+                      self._yearly_increase_in_income_field,
+                      self._savings_interest_rates_field,
+                      self._pension_growth_rate_list_field,
+                      self._state_pension_growth_rate_list_field):
+            field.on_value_change(self._set_gui_dirty)
+
         with ui.row():
             columns = [{'name': FuturePlotGUI.DATE, 'label': FuturePlotGUI.DATE, 'field': FuturePlotGUI.DATE},
                        {'name': FuturePlotGUI.AMOUNT, 'label': FuturePlotGUI.AMOUNT, 'field': FuturePlotGUI.AMOUNT}]
@@ -3070,8 +3195,6 @@ class FuturePlotGUI(GUIBase):
                         ui.button('Edit', on_click=lambda: self._edit_pension_withdrawal()).tooltip(
                             'Edit a pension withdrawal in the table.')
 
-            self._update_gui_tables()
-
         with ui.row():
             with ui.card():
                 ui.label("Save/Load the above retirement prediction parameter set.")
@@ -3187,7 +3310,7 @@ class FuturePlotGUI(GUIBase):
             if selected_name != new_name:
                 multiple_future_plot_attrs_dict = self._config.get_multiple_future_plot_attrs_dict()
                 plot_attr_dict = multiple_future_plot_attrs_dict[selected_name]
-                multiple_future_plot_attrs_dict[new_name] = copy.deepcopy(plot_attr_dict)
+                multiple_future_plot_attrs_dict[new_name] = FuturePlotGUI.CopyPlotAttrDict(plot_attr_dict)
             self._config.save_multiple_future_plot_attrs()
             # Clear the new name field
             self._new_settings_name_input.value = ""
@@ -3196,8 +3319,7 @@ class FuturePlotGUI(GUIBase):
     def _load_settings(self, selected_settings_name):
         """@brief Load the prediction parameters.
            @param selected_settings_name The name of the settings to load."""
-        name_list = self._get_settings_name_list()
-        if selected_settings_name in name_list:
+        if selected_settings_name in self._config.get_multiple_future_plot_attrs_dict():
             self._update_gui_from_dict()
 
     def _delete(self):
@@ -3285,11 +3407,13 @@ class FuturePlotGUI(GUIBase):
         """@brief Show a table of the configured bank accounts.
            @param gui_table The GUI table element.
            @param table_data The table date. Each row has two elements (DATE and AMOUNT)."""
-        gui_table.rows.clear()
-        gui_table.update()
-        for row in table_data:
-            gui_table.add_row({FuturePlotGUI.DATE: row[0], FuturePlotGUI.AMOUNT: row[1], FuturePlotGUI.INFO: row[2]})
-        gui_table.run_method('scrollTo', len(gui_table.rows)-1)
+        rows = [{FuturePlotGUI.DATE: row[0], FuturePlotGUI.AMOUNT: row[1], FuturePlotGUI.INFO: row[2]} for row in table_data]
+        # All the tables are redrawn when any one of them changes. Only send the tables
+        # that have changed to the browser, assigning all the rows at once so that a
+        # single update is sent.
+        if rows != gui_table.rows:
+            gui_table.rows = rows
+            gui_table.run_method('scrollTo', len(rows)-1)
 
     def _add_savings_withdrawal(self):
         """@brief Called when the add a savings withdrawal button is selected."""
@@ -3300,19 +3424,10 @@ class FuturePlotGUI(GUIBase):
     def _del_savings_withdrawal(self):
         """@brief Called when the delete a savings withdrawal button is selected."""
         selected_dict_list = self._savings_withdrawals_table.selected
-        if selected_dict_list and len(selected_dict_list) > 0:
-            for selected_dict in selected_dict_list:
-                if FuturePlotGUI.DATE in selected_dict:
-                    del_date = selected_dict[FuturePlotGUI.DATE]
-                    table = self._get_param_value(FuturePlotGUI.SAVINGS_WITHDRAWAL_TABLE)
-                    new_table = []
-                    for row in table:
-                        date = row[0]
-                        if date != del_date:
-                            new_table.append(row)
-                    self._set_param_value(FuturePlotGUI.SAVINGS_WITHDRAWAL_TABLE, new_table)
+        if selected_dict_list:
+            table = self._get_param_value(FuturePlotGUI.SAVINGS_WITHDRAWAL_TABLE)
+            self._set_param_value(FuturePlotGUI.SAVINGS_WITHDRAWAL_TABLE, FuturePlotGUI.RemoveSelectedRows(table, selected_dict_list))
         self._update_gui_tables()
-        self._config.get_multiple_future_plot_attrs_dict()[FuturePlotGUI.SAVINGS_WITHDRAWAL_TABLE] = new_table
 
     def _edit_savings_withdrawal(self):
         self._edit_withdrawal_table(self._savings_withdrawals_table, FuturePlotGUI.SAVINGS_WITHDRAWAL_TABLE)
@@ -3326,19 +3441,10 @@ class FuturePlotGUI(GUIBase):
     def _del_pension_withdrawal(self):
         """@brief Called when the delete a pension withdrawal button is selected."""
         selected_dict_list = self._pension_withdrawals_table.selected
-        if selected_dict_list and len(selected_dict_list) > 0:
-            for selected_dict in selected_dict_list:
-                if FuturePlotGUI.DATE in selected_dict:
-                    del_date = selected_dict[FuturePlotGUI.DATE]
-                    table = self._get_param_value(FuturePlotGUI.PENSION_WITHDRAWAL_TABLE)
-                    new_table = []
-                    for row in table:
-                        date = row[0]
-                        if date != del_date:
-                            new_table.append(row)
-                    self._set_param_value(FuturePlotGUI.PENSION_WITHDRAWAL_TABLE, new_table)
+        if selected_dict_list:
+            table = self._get_param_value(FuturePlotGUI.PENSION_WITHDRAWAL_TABLE)
+            self._set_param_value(FuturePlotGUI.PENSION_WITHDRAWAL_TABLE, FuturePlotGUI.RemoveSelectedRows(table, selected_dict_list))
         self._update_gui_tables()
-        self._config.get_multiple_future_plot_attrs_dict()[FuturePlotGUI.PENSION_WITHDRAWAL_TABLE] = new_table
 
     def _edit_pension_withdrawal(self):
         self._edit_withdrawal_table(self._pension_withdrawals_table, FuturePlotGUI.PENSION_WITHDRAWAL_TABLE)
@@ -3400,6 +3506,7 @@ class FuturePlotGUI(GUIBase):
         self._edit_amount_field.run_method('focus')
 
     def _add_row_dialog_ok_button_press(self):
+        from dateutil.relativedelta import relativedelta
         if FuturePlotGUI.CheckValidDateString(self._date_input_field.value,
                                               field_name=self._date_input_field.props['label']) and \
            FuturePlotGUI.CheckGreaterThanZero(self._repeat_count_field.value,
@@ -3415,43 +3522,38 @@ class FuturePlotGUI(GUIBase):
             if self._repeat_field.value == FuturePlotGUI.MONTHLY:
                 monthly = True
 
+            if self._button_selected == FuturePlotGUI.ADD_SAVINGS_WITHDRAWAL_BUTTON:
+                rows = self._get_param_value(FuturePlotGUI.SAVINGS_WITHDRAWAL_TABLE)
+
+            elif self._button_selected == FuturePlotGUI.ADD_PENSION_WITHDRAWAL_BUTTON:
+                rows = self._get_param_value(FuturePlotGUI.PENSION_WITHDRAWAL_TABLE)
+
+            else:
+                raise Exception("BUG: Neither the add savings or add pensions button was selected.")
+
             occurrence_count = self._repeat_count_field.value
-            the_date = self._date_input_field.value
+            # Parse the start date once and step the datetime on rather than parsing and
+            # formatting a date string for every occurrence.
+            the_datetime = GUIBase.ParseDate(self._date_input_field.value)
             info_str = self._info_field.value
+            # Collect the dates already in the table so each new date is checked with a set lookup.
+            table_dates = {row[0] for row in rows}
             for _ in range(0, int(occurrence_count)):
-                row = (the_date, self._amount_field.value, info_str)
-                if self._button_selected == FuturePlotGUI.ADD_SAVINGS_WITHDRAWAL_BUTTON:
-                    rows = self._get_param_value(FuturePlotGUI.SAVINGS_WITHDRAWAL_TABLE)
-                    if self._check_date_in_table(the_date, rows):
-                        ui.notify(f"{the_date} is already in the table.", type='negative')
-                        break
-
-                    else:
-                        rows.append(row)
-                        # Sort table in ascending date order
-                        sorted_rows = sorted(rows, key=lambda row: datetime.strptime(row[0], "%d-%m-%Y"))
-                        self._set_param_value(FuturePlotGUI.SAVINGS_WITHDRAWAL_TABLE, sorted_rows)
-
-                elif self._button_selected == FuturePlotGUI.ADD_PENSION_WITHDRAWAL_BUTTON:
-                    rows = self._get_param_value(FuturePlotGUI.PENSION_WITHDRAWAL_TABLE)
-                    if self._check_date_in_table(the_date, rows):
-                        ui.notify(f"{the_date} is already in the table.", type='negative')
-                        break
+                the_date = the_datetime.strftime('%d-%m-%Y')
+                if the_date in table_dates:
+                    ui.notify(f"{the_date} is already in the table.", type='negative')
+                    break
 
-                    else:
-                        rows.append(row)
-                        # Sort table in ascending date order
-                        sorted_rows = sorted(rows, key=lambda row: datetime.strptime(row[0], "%d-%m-%Y"))
-                        self._set_param_value(FuturePlotGUI.PENSION_WITHDRAWAL_TABLE, sorted_rows)
-
-                else:
-                    raise Exception("BUG: Neither the add savings or add pensions button was selected.")
+                rows.append((the_date, self._amount_field.value, info_str))
+                table_dates.add(the_date)
 
                 if yearly:
-                    the_date = self._get_next_date_str(the_date, 12)
+                    the_datetime += relativedelta(months=+12)
                 if monthly:
-                    the_date = self._get_next_date_str(the_date, 1)
+                    the_datetime += relativedelta(months=+1)
 
+            # Sort table in ascending date order once all the rows have been added.
+            rows.sort(key=lambda row: datetime.strptime(row[0], "%d-%m-%Y"))
             self._update_gui_tables()
 
     def _edit_row_dialog_ok_button_press(self):
@@ -3470,8 +3572,8 @@ class FuturePlotGUI(GUIBase):
                 raise Exception("{self._withdrawal_edit_table} is an unknown withdrawal table.")
 
             new_rows = []
+            date_entered = FuturePlotGUI.GetDate(self._edit_date_input_field.value)
             for row in table:
-                date_entered = FuturePlotGUI.GetDate(self._edit_date_input_field.value)
                 table_date_str = row[0]
                 table_date = FuturePlotGUI.GetDate(table_date_str)
                 if date_entered == table_date:
@@ -3488,19 +3590,6 @@ class FuturePlotGUI(GUIBase):
 
             self._update_gui_tables()
 
-    def _check_date_in_table(self, _date, table):
-        """@brief Check if a date is in a table. Col 0 = date.
-           @return True if it is."""
-        return any(row[0] == _date for row in table)
-
-    def _get_next_date_str(self, start_date_str, months):
-        """@brief Get the start date + the number of months.
-           @param start_date_str The from date string as dd-mm-yyyy.
-           @param months The number of months to add to the start date."""
-        start_date = datetime.strptime(start_date_str, '%d-%m-%Y')
-        next_date = start_date + relativedelta(months=+months)
-        return next_date.strftime('%d-%m-%Y')
-
     def _add_row_dialog_cancel_button_press(self):
         self._add_row_dialog.close()
 
@@ -3510,20 +3599,21 @@ class FuturePlotGUI(GUIBase):
     def _get_max_date(self):
         """@brief Get the maximum date we need to plan for.
            @return a datetime instance of the max year."""
+        # This only revalidates the fields if they have changed since they were last stored.
         self._update_dict_from_gui()
-        my_max_date = self._get_my_max_date()
-        max_date = my_max_date
-
+        max_date = self._get_my_max_date()
+        # The partner max date is None if no partner details were entered.
         partner_max_date = self._get_partner_max_date()
-        if partner_max_date is not None and partner_max_date > my_max_date:
-            max_date = partner_max_date
+        if partner_max_date is not None:
+            max_date = max(max_date, partner_max_date)
 
         return max_date
 
     def _get_my_max_date(self):
         """@return The maximum date I (for trhe purposes of this report) hope to be alive."""
+        from dateutil.relativedelta import relativedelta
         my_dob_str = self._get_param_value(FuturePlotGUI.MY_DATE_OF_BIRTH)
-        my_dob = datetime.strptime(my_dob_str, '%d-%m-%Y')
+        my_dob = GUIBase.ParseDate(my_dob_str)
         my_max_age = int(self._get_param_value(FuturePlotGUI.MY_MAX_AGE))
         my_max_date = my_dob + relativedelta(years=my_max_age)
         return my_max_date
@@ -3533,7 +3623,7 @@ class FuturePlotGUI(GUIBase):
            @param current_date The date of interest.
            @return My age in years."""
         my_dob_str = self._get_param_value(FuturePlotGUI.MY_DATE_OF_BIRTH)
-        my_dob = datetime.strptime(my_dob_str, '%d-%m-%Y')
+        my_dob = GUIBase.ParseDate(my_dob_str)
         timedelta = current_date - my_dob
         age_years = timedelta.days / 364.25
         return age_years
@@ -3541,17 +3631,25 @@ class FuturePlotGUI(GUIBase):
     def _get_partner_max_date(self):
         """@return The maximum date my partner (for the purposes of this report) hopes to be alive or None
                    if no partner details entered into the retirement prediction form."""
+        from dateutil.relativedelta import relativedelta
         partner_max_date = None
         partner_dob_str = self._get_param_value(FuturePlotGUI.PARTNER_DATE_OF_BIRTH)
         if partner_dob_str and len(partner_dob_str) > 0:
-            partner_dob = datetime.strptime(partner_dob_str, '%d-%m-%Y')
+            partner_dob = GUIBase.ParseDate(partner_dob_str)
             partner_max_age = int(self._get_param_value(FuturePlotGUI.PARTNER_MAX_AGE))
             partner_max_date = partner_dob + relativedelta(years=partner_max_age)
         return partner_max_date
 
+    def _set_gui_dirty(self):
+        """@brief Called when a parameter field changes."""
+        self._gui_dirty = True
+
     def _update_dict_from_gui(self):
         """@brief update the dict from the details entered into the GUI.
            @return True if all entries are valid."""
+        # Nothing has changed since the fields were last validated and stored in the dict.
+        if not self._gui_dirty:
+            return True
         valid = False
         if FuturePlotGUI.CheckValidDateString(self._start_date_field.value,
                                               field_name=self._start_date_field.props['label']):
@@ -3579,38 +3677,41 @@ class FuturePlotGUI(GUIBase):
                                               field_name=self._pension_growth_rate_list_field.props['label']) and \
                 BankAccountGUI.CheckRateField(self._state_pension_growth_rate_list_field.value,
                                               field_name=self._state_pension_growth_rate_list_field.props['label']):
-                self._set_param_value(FuturePlotGUI.MY_DATE_OF_BIRTH, self._my_dob_field.value)
-                self._set_param_value(FuturePlotGUI.MY_MAX_AGE, self._my_max_age_field.value)
-                self._set_param_value(FuturePlotGUI.PARTNER_DATE_OF_BIRTH, self._partner_dob_field.value)
-                self._set_param_value(FuturePlotGUI.PARTNER_MAX_AGE, self._partner_max_age_field.value)
-                self._set_param_value(FuturePlotGUI.SAVINGS_INTEREST_RATE_LIST, self._savings_interest_rates_field.value)
-                self._set_param_value(FuturePlotGUI.PENSION_GROWTH_RATE_LIST, self._pension_growth_rate_list_field.value)
-                self._set_param_value(FuturePlotGUI.STATE_PENSION_YEARLY_INCREASE_LIST, self._state_pension_growth_rate_list_field.value)
-                self._set_param_value(FuturePlotGUI.MONTHLY_AMOUNT_FROM_OTHER_SOURCES, self._monthly_amount_from_other_sources_field.value)
-                self._set_param_value(FuturePlotGUI.MONTHLY_INCOME, self._monthly_income_field.value)
-                self._set_param_value(FuturePlotGUI.YEARLY_INCREASE_IN_INCOME, self._yearly_increase_in_income_field.value)
-                self._set_param_value(FuturePlotGUI.REPORT_START_DATE, self._start_date_field.value)
-                self._set_param_value(FuturePlotGUI.PENSION_DRAWDOWN_START_DATE, self._pension_drawdown_start_date_field.value)
-                self._set_param_value(FuturePlotGUI.ENABLE_PENSION_DRAWDOWN_START_DATE, self._enable_pension_drawdown_start_date.value)
+                plot_attr_dict = self._get_plot_attr_dict()
+                plot_attr_dict[FuturePlotGUI.MY_DATE_OF_BIRTH] = self._my_dob_field.value
+                plot_attr_dict[FuturePlotGUI.MY_MAX_AGE] = self._my_max_age_field.value
+                plot_attr_dict[FuturePlotGUI.PARTNER_DATE_OF_BIRTH] = self._partner_dob_field.value
+                plot_attr_dict[FuturePlotGUI.PARTNER_MAX_AGE] = self._partner_max_age_field.value
+                plot_attr_dict[FuturePlotGUI.SAVINGS_INTEREST_RATE_LIST] = self._savings_interest_rates_field.value
+                plot_attr_dict[FuturePlotGUI.PENSION_GROWTH_RATE_LIST] = self._pension_growth_rate_list_field.value
+                plot_attr_dict[FuturePlotGUI.STATE_PENSION_YEARLY_INCREASE_LIST] = self._state_pension_growth_rate_list_field.value
+                plot_attr_dict[FuturePlotGUI.MONTHLY_AMOUNT_FROM_OTHER_SOURCES] = self._monthly_amount_from_other_sources_field.value
+                plot_attr_dict[FuturePlotGUI.MONTHLY_INCOME] = self._monthly_income_field.value
+                plot_attr_dict[FuturePlotGUI.YEARLY_INCREASE_IN_INCOME] = self._yearly_increase_in_income_field.value
+                plot_attr_dict[FuturePlotGUI.REPORT_START_DATE] = self._start_date_field.value
+                plot_attr_dict[FuturePlotGUI.PENSION_DRAWDOWN_START_DATE] = self._pension_drawdown_start_date_field.value
+                plot_attr_dict[FuturePlotGUI.ENABLE_PENSION_DRAWDOWN_START_DATE] = self._enable_pension_drawdown_start_date.value
                 valid = True
+                self._gui_dirty = False
 
         return valid
 
     def _update_gui_from_dict(self):
         """@brief Load config from persistent storage and display in GUI."""
-        self._my_dob_field.value = self._get_param_value(FuturePlotGUI.MY_DATE_OF_BIRTH)
-        self._my_max_age_field.value = self._get_param_value(FuturePlotGUI.MY_MAX_AGE)
-        self._partner_dob_field.value = self._get_param_value(FuturePlotGUI.PARTNER_DATE_OF_BIRTH)
-        self._partner_max_age_field.value = self._get_param_value(FuturePlotGUI.PARTNER_MAX_AGE)
-        self._savings_interest_rates_field.value = self._get_param_value(FuturePlotGUI.SAVINGS_INTEREST_RATE_LIST)
-        self._pension_growth_rate_list_field.value = self._get_param_value(FuturePlotGUI.PENSION_GROWTH_RATE_LIST)
-        self._state_pension_growth_rate_list_field.value = self._get_param_value(FuturePlotGUI.STATE_PENSION_YEARLY_INCREASE_LIST)
-        self._monthly_amount_from_other_sources_field.value = self._get_param_value(FuturePlotGUI.MONTHLY_AMOUNT_FROM_OTHER_SOURCES)
-        self._monthly_income_field.value = self._get_param_value(FuturePlotGUI.MONTHLY_INCOME)
-        self._yearly_increase_in_income_field.value = self._get_param_value(FuturePlotGUI.YEARLY_INCREASE_IN_INCOME)
-        self._start_date_field.value = self._get_param_value(FuturePlotGUI.REPORT_START_DATE)
-        self._pension_drawdown_start_date_field.value = self._get_param_value(FuturePlotGUI.PENSION_DRAWDOWN_START_DATE)
-        self._enable_pension_drawdown_start_date.value = self._get_param_value(FuturePlotGUI.ENABLE_PENSION_DRAWDOWN_START_DATE)
+        plot_attr_dict = self._get_plot_attr_dict()
+        self._my_dob_field.value = plot_attr_dict[FuturePlotGUI.MY_DATE_OF_BIRTH]
+        self._my_max_age_field.value = plot_attr_dict[FuturePlotGUI.MY_MAX_AGE]
+        self._partner_dob_field.value = plot_attr_dict[FuturePlotGUI.PARTNER_DATE_OF_BIRTH]
+        self._partner_max_age_field.value = plot_attr_dict[FuturePlotGUI.PARTNER_MAX_AGE]
+        self._savings_interest_rates_field.value = plot_attr_dict[FuturePlotGUI.SAVINGS_INTEREST_RATE_LIST]
+        self._pension_growth_rate_list_field.value = plot_attr_dict[FuturePlotGUI.PENSION_GROWTH_RATE_LIST]
+        self._state_pension_growth_rate_list_field.value = plot_attr_dict[FuturePlotGUI.STATE_PENSION_YEARLY_INCREASE_LIST]
+        self._monthly_amount_from_other_sources_field.value = plot_attr_dict[FuturePlotGUI.MONTHLY_AMOUNT_FROM_OTHER_SOURCES]
+        self._monthly_income_field.value = plot_attr_dict[FuturePlotGUI.MONTHLY_INCOME]
+        self._yearly_increase_in_income_field.value = plot_attr_dict[FuturePlotGUI.YEARLY_INCREASE_IN_INCOME]
+        self._start_date_field.value = plot_attr_dict[FuturePlotGUI.REPORT_START_DATE]
+        self._pension_drawdown_start_date_field.value = plot_attr_dict[FuturePlotGUI.PENSION_DRAWDOWN_START_DATE]
+        self._enable_pension_drawdown_start_date.value = plot_attr_dict[FuturePlotGUI.ENABLE_PENSION_DRAWDOWN_START_DATE]
         if self._enable_pension_drawdown_start_date.value:
             self._pension_drawdown_start_date_field.enable()
         else:
@@ -3621,26 +3722,17 @@ class FuturePlotGUI(GUIBase):
         """@brief Convert a table of rows = <date str>,<value str> to a table of rows = <datetime>,<float>
             @param date_value_table A list of tuples where each tuple contains a date string and a value string.
             @return A list of tuples where each tuple contains a datetime object and a float value."""
-        converted_table = []
-        # date_value_table may have two columns or three (added a notes field)
-        # but we're only interested in the first two here.
-        for row in date_value_table:
-            date_str = row[0]
-            value_str = row[1]
-            info_str = ""
-            if len(row) > 2:
-                info_str = row[2]
-            date_obj = datetime.strptime(date_str, '%d-%m-%Y')
-            value_float = float(value_str)
-            converted_table.append((date_obj, value_float, info_str))
-        return converted_table
+        # date_value_table may have two columns or three (added a notes field).
+        # The same table dates are converted on every calculation so use the cached parser.
+        return [(GUIBase.ParseDate(row[0]), float(row[1]), row[2] if len(row) > 2 else "")
+                for row in date_value_table]
 
     def _show_progress(self):
         self._calc(overlay_real_performance=True)
 
     def _get_report_start_date(self):
         """@return The date entered as the report start date."""
-        return datetime.strptime(self._get_param_value(FuturePlotGUI.REPORT_START_DATE), '%d-%m-%Y')
+        return GUIBase.ParseDate(self._get_param_value(FuturePlotGUI.REPORT_START_DATE))
 
     def _calc(self, overlay_real_performance=False):
         """@brief Perform calculation. This took ages to get right. I used the household_finances spreadsheet to validate the numbers it produces.
@@ -3671,7 +3763,7 @@ class FuturePlotGUI(GUIBase):
             pp_table = self._get_personal_pension_table()
             drawdown_enabled = self._get_param_value(FuturePlotGUI.ENABLE_PENSION_DRAWDOWN_START_DATE)
             if drawdown_enabled:
-                pension_drawdown_start_date = datetime.strptime(self._get_param_value(FuturePlotGUI.PENSION_DRAWDOWN_START_DATE), '%d-%m-%Y')
+                pension_drawdown_start_date = GUIBase.ParseDate(self._get_param_value(FuturePlotGUI.PENSION_DRAWDOWN_START_DATE))
             else:
                 pension_drawdown_start_date = None
             predicted_state_pension_table = self._get_predicted_state_pension(datetime_list, report_start_date)
@@ -3680,6 +3772,9 @@ class FuturePlotGUI(GUIBase):
                 raise Exception('No state pension defined in the pension list.')
             monthly_from_other_sources = float(self._get_param_value(FuturePlotGUI.MONTHLY_AMOUNT_FROM_OTHER_SOURCES))
             lump_sum_savings_withdrawals_table = self._convert_table(self._get_param_value(FuturePlotGUI.SAVINGS_WITHDRAWAL_TABLE))
+            # Sum the lump sum withdrawals by month so that each month is a single lookup.
+            savings_withdrawals_by_month = self._get_withdrawals_by_month(lump_sum_savings_withdrawals_table)
+            pension_withdrawals_by_month = self._get_withdrawals_by_month(lump_sum_pension_withdrawals_table)
 
             # Get the initial value of our personal pension
             personal_pension_value = self._get_initial_value(pp_table, report_start_date)
@@ -3696,11 +3791,12 @@ class FuturePlotGUI(GUIBase):
             year_index = 0
             total = savings_amount + personal_pension_value
             predicted_income_this_month = monthly_budget_table[0][1]
-            state_pension_this_month = self._get_state_pension_this_month(first_date, predicted_state_pension_table)
             tax_free_pension_event = False
             money_ran_out = False
             # We assume our spending matches our income for the first month.
             spending_this_month = predicted_income_this_month
+            # The first date is skipped below as no time has passed.
+            tax_free_pension_date = self._get_tax_free_pension_date(datetime_list[1:])
 
             # Add initial state
             plot_table.append((first_date,
@@ -3714,9 +3810,17 @@ class FuturePlotGUI(GUIBase):
                                total_pension_withdrawal,
                                spending_this_month))
 
+            # Get each year's savings interest and pension growth rates once rather than every month.
+            n_years = datetime_list[-1].year - first_date.year + 1
+            savings_rate_list = self._get_param_value(FuturePlotGUI.SAVINGS_INTEREST_RATE_LIST)
+            savings_rates = self._get_yearly_rates(savings_rate_list, n_years)
+            pension_rate_list = self._get_param_value(FuturePlotGUI.PENSION_GROWTH_RATE_LIST)
+            pension_rates = self._get_yearly_rates(pension_rate_list, n_years)
+
             # Assume that the account existed in the month prior to the report start date.
             # Therefore add the savings accrued during this month.
-            increase_this_month = self._get_savings_increase_this_month(savings_amount, 0)
+            savings_rate = savings_rates[0] if savings_rates is not None else self._get_yearly_rate(savings_rate_list, 0)
+            increase_this_month = self._get_savings_increase_this_month(savings_amount, savings_rate)
             # We assume savings interest accrues monthly but is added yearly. Therefore add to a list for use later.
             monthly_savings_interest_list.append(increase_this_month)
 
@@ -3757,11 +3861,7 @@ class FuturePlotGUI(GUIBase):
                 remaining_income_this_month = max(0.0, remaining_income_this_month)
 
                 # If we chose to draw a lump sum from savings
-                savings_amount_before = savings_amount
-                new_savings_amount = self._get_value_drop(this_date,
-                                                          savings_amount,
-                                                          lump_sum_savings_withdrawals_table)
-                lump_sum_savings_withdrawal = savings_amount_before - new_savings_amount
+                lump_sum_savings_withdrawal = savings_withdrawals_by_month.get((this_date.year, this_date.month), 0.0)
 
                 # Previously we used the lump sum savings withdrawal to reduce the required income.
                 # However the savings withdrawal table should be used by the user to define savings withdrawals
@@ -3772,11 +3872,7 @@ class FuturePlotGUI(GUIBase):
                 #    remaining_income_this_month = remaining_income_this_month - lump_sum_savings_withdrawal
 
                 # If we want to draw lump sum/s from our pension.
-                previous_personal_pension_value = personal_pension_value
-                new_personal_pension_value = self._get_value_drop(this_date,
-                                                                  personal_pension_value,
-                                                                  lump_sum_pension_withdrawals_table)
-                lump_sum_pension_withdrawal = previous_personal_pension_value - new_personal_pension_value
+                lump_sum_pension_withdrawal = pension_withdrawals_by_month.get((this_date.year, this_date.month), 0.0)
                 if lump_sum_pension_withdrawal > 0:
                     # Note that this may result in more than the monthly budget.
                     remaining_income_this_month = remaining_income_this_month - lump_sum_pension_withdrawal
@@ -3805,13 +3901,15 @@ class FuturePlotGUI(GUIBase):
 
                 savings_amount = savings_amount - total_savings_withdrawal
                 # Calc the increase/decrease on savings this month given the predicted interest rate.
-                increase_this_month = self._get_savings_increase_this_month(savings_amount, year_index)
+                savings_rate = savings_rates[year_index] if savings_rates is not None else self._get_yearly_rate(savings_rate_list, year_index)
+                increase_this_month = self._get_savings_increase_this_month(savings_amount, savings_rate)
                 # We assume savings interest accrues monthly but is added yearly. Therefore add to a list for use later.
                 monthly_savings_interest_list.append(increase_this_month)
 
                 personal_pension_value = personal_pension_value - total_pension_withdrawal
                 # Calc increase/decrease of pension this month due to growth/decline. We assume this acru's monthly
-                personal_pension_increase = self._get_pension_increase_this_month(personal_pension_value, year_index)
+                pension_rate = pension_rates[year_index] if pension_rates is not None else self._get_yearly_rate(pension_rate_list, year_index)
+                personal_pension_increase = self._get_pension_increase_this_month(personal_pension_value, pension_rate)
                 personal_pension_value = personal_pension_value + personal_pension_increase
 
                 # If we have no pension left but expect to withdraw from it
@@ -3857,7 +3955,7 @@ class FuturePlotGUI(GUIBase):
                 # If an event has yet to occur that gives pension tax free
                 if not tax_free_pension_event:
                     # Check to see if the prediction details my death before 75
-                    if self._dead_before_75(this_date):
+                    if this_date == tax_free_pension_date:
                         # Transfer all pension funds to savings tax free
                         savings_amount = savings_amount + personal_pension_value
                         personal_pension_value = 0
@@ -3890,9 +3988,8 @@ class FuturePlotGUI(GUIBase):
 
             final_year = self._get_final_year()
             if overlay_real_performance:
-                pp_table = self._get_personal_pension_table()
-                savings_table = self._get_savings_table()
-                total_table = self._get_total_table()
+                # Build the three tables from one read of the accounts.
+                pp_table, savings_table, total_table = self._get_account_tables()
                 monthly_spending_table = self._get_monthly_spending_table()
                 # These tables hold values entered by the users that are real values, not predicted.
                 reality_tables = [pp_table, savings_table, total_table, monthly_spending_table]
@@ -3920,6 +4017,8 @@ class FuturePlotGUI(GUIBase):
                                lump_sum_pension_withdrawals_table,
                                predicted_state_pension_table,
                                monthly_from_other_sources,
+                               initial_personal_pension_value,
+                               initial_savings_amount,
                                savings_rate_list,
                                pension_rate_list,
                                income_increase_rate_list):
@@ -3933,20 +4032,21 @@ class FuturePlotGUI(GUIBase):
            @param lump_sum_pension_withdrawals_table  Converted lump-sum pension withdrawal table.
            @param predicted_state_pension_table       State pension projection.
            @param monthly_from_other_sources          Fixed monthly income from other sources.
+           @param initial_personal_pension_value      Total personal pension value at the report start date.
+           @param initial_savings_amount              Total savings at the report start date.
            @param savings_rate_list      List of yearly savings interest rates (one per year).
            @param pension_rate_list      List of yearly pension growth rates (one per year).
            @param income_increase_rate_list  List of yearly income increase rates (one per year).
            @return (total_wealth_series, money_ran_out)
                    total_wealth_series — list of (date, total_wealth) tuples, one per month.
                    money_ran_out       — bool, True if wealth hit zero during the projection."""
-        pp_table = self._get_personal_pension_table()
-        personal_pension_value = self._get_initial_value(pp_table, report_start_date)
-        savings_amount = self._get_savings_total(report_start_date)
+        personal_pension_value = initial_personal_pension_value
+        savings_amount = initial_savings_amount
 
         drawdown_enabled = self._get_param_value(FuturePlotGUI.ENABLE_PENSION_DRAWDOWN_START_DATE)
         if drawdown_enabled:
-            pension_drawdown_start_date = datetime.strptime(
-                self._get_param_value(FuturePlotGUI.PENSION_DRAWDOWN_START_DATE), '%d-%m-%Y')
+            pension_drawdown_start_date = GUIBase.ParseDate(
+                self._get_param_value(FuturePlotGUI.PENSION_DRAWDOWN_START_DATE))
         else:
             pension_drawdown_start_date = None
 
@@ -3957,6 +4057,11 @@ class FuturePlotGUI(GUIBase):
         tax_free_pension_event = False
         money_ran_out = False
         total_wealth_series = []
+        # The first date is skipped below as no time has passed.
+        tax_free_pension_date = self._get_tax_free_pension_date(datetime_list[1:])
+        # Sum the lump sum withdrawals by month so that each month is a single lookup.
+        savings_withdrawals_by_month = self._get_withdrawals_by_month(lump_sum_savings_withdrawals_table)
+        pension_withdrawals_by_month = self._get_withdrawals_by_month(lump_sum_pension_withdrawals_table)
 
         # Helper to get a rate for a given year from a pre-sampled list
         def get_rate(rate_list, idx):
@@ -3965,10 +4070,14 @@ class FuturePlotGUI(GUIBase):
             # Fallback to existing string-based helper for deterministic comma lists
             return self._get_yearly_rate(rate_list, idx)
 
+        # Convert each year's rates to the monthly growth factors once, so that each month of the
+        # loop below only needs a multiply.
+        n_years = datetime_list[-1].year - first_date.year + 1
+        savings_monthly_factors = [(1 + get_rate(savings_rate_list, idx) / 100) ** (1 / 12) - 1 for idx in range(n_years)]
+        pension_monthly_factors = [self._get_pension_monthly_growth_factor(get_rate(pension_rate_list, idx)) for idx in range(n_years)]
+
         # Seed the first month's savings interest
-        savings_rate = get_rate(savings_rate_list, 0)
-        monthly_savings_interest_list.append(
-            savings_amount * ((1 + savings_rate / 100) ** (1 / 12) - 1))
+        monthly_savings_interest_list.append(savings_amount * savings_monthly_factors[0])
 
         for row in monthly_budget_table:
             this_date = row[0]
@@ -3993,14 +4102,10 @@ class FuturePlotGUI(GUIBase):
             # Lump-sum savings withdrawal — record the amount but don't update
             # savings_amount yet; it is deducted once below via total_savings_withdrawal,
             # matching the pattern used in _calc.
-            new_savings = self._get_value_drop(
-                this_date, savings_amount, lump_sum_savings_withdrawals_table)
-            lump_sum_savings_withdrawal = savings_amount - new_savings
+            lump_sum_savings_withdrawal = savings_withdrawals_by_month.get((this_date.year, this_date.month), 0.0)
 
             # Lump-sum pension withdrawal — same pattern: record, don't apply yet.
-            new_pension = self._get_value_drop(
-                this_date, personal_pension_value, lump_sum_pension_withdrawals_table)
-            lump_sum_pension_withdrawal = personal_pension_value - new_pension
+            lump_sum_pension_withdrawal = pension_withdrawals_by_month.get((this_date.year, this_date.month), 0.0)
             if lump_sum_pension_withdrawal > 0:
                 remaining_income = max(0.0, remaining_income - lump_sum_pension_withdrawal)
 
@@ -4021,15 +4126,11 @@ class FuturePlotGUI(GUIBase):
 
             savings_amount -= total_savings_withdrawal
             # Savings interest accrues monthly, credited yearly
-            savings_rate = get_rate(savings_rate_list, year_index)
-            monthly_savings_interest_list.append(
-                savings_amount * ((1 + savings_rate / 100) ** (1 / 12) - 1))
+            monthly_savings_interest_list.append(savings_amount * savings_monthly_factors[year_index])
 
             personal_pension_value -= total_pension_withdrawal
             # Pension grows daily-compounded monthly
-            pension_rate = get_rate(pension_rate_list, year_index)
-            personal_pension_value += self._get_pension_increase_this_month_for_rate(
-                personal_pension_value, pension_rate)
+            personal_pension_value += personal_pension_value * pension_monthly_factors[year_index]
 
             # Fallback: if pension depleted, try savings
             if personal_pension_value <= 0 and total_pension_withdrawal > 0:
@@ -4050,7 +4151,7 @@ class FuturePlotGUI(GUIBase):
                     money_ran_out = True
 
             # Pre-75 death: pension passes tax-free to savings
-            if not tax_free_pension_event and self._dead_before_75(this_date):
+            if not tax_free_pension_event and this_date == tax_free_pension_date:
                 savings_amount += personal_pension_value
                 personal_pension_value = 0
                 pension_drawdown_start_date = None
@@ -4064,16 +4165,15 @@ class FuturePlotGUI(GUIBase):
 
         return total_wealth_series, money_ran_out
 
-    def _get_pension_increase_this_month_for_rate(self, pension_value, yearly_rate_pct):
-        """@brief Compute one month of daily-compounded pension growth for a given rate.
-           @param pension_value   Current pension value.
+    def _get_pension_monthly_growth_factor(self, yearly_rate_pct):
+        """@brief Get the fraction by which a pension grows in one month (daily compounded) for a given rate.
            @param yearly_rate_pct Annual growth rate as a percentage (e.g. 5.0 for 5%).
-           @return The increase amount for this month."""
+           @return The increase this month is the pension value multiplied by this factor."""
         annual_rate = yearly_rate_pct / 100.0
         days_in_year = 365.25
         days_in_month = days_in_year / 12
         growth_factor = (1 + annual_rate / days_in_year) ** days_in_month
-        return pension_value * (growth_factor - 1)
+        return growth_factor - 1
 
     # Key used to pass Monte Carlo results back from the worker thread to the GUI thread
     MC_RESULT_KEY = 'MC_RESULT'
@@ -4184,6 +4284,11 @@ class FuturePlotGUI(GUIBase):
                 self._get_param_value(FuturePlotGUI.SAVINGS_WITHDRAWAL_TABLE))
             lump_sum_pension_withdrawals_table = self._convert_table(
                 self._get_param_value(FuturePlotGUI.PENSION_WITHDRAWAL_TABLE))
+            # The account values at the start date are the same for every simulation
+            # so read them once here rather than in each simulation.
+            pp_table = self._get_personal_pension_table()
+            initial_personal_pension_value = self._get_initial_value(pp_table, report_start_date)
+            initial_savings_amount = self._get_savings_total(report_start_date)
             settings_name = self._settings_name_select.value
 
             global_cfg = self._config.get_global_configuration_dict()
@@ -4205,6 +4310,8 @@ class FuturePlotGUI(GUIBase):
                       lump_sum_savings_withdrawals_table,
                       lump_sum_pension_withdrawals_table,
                       monthly_from_other_sources,
+                      initial_personal_pension_value,
+                      initial_savings_amount,
                       savings_spec,
                       pension_spec,
                       income_spec,
@@ -4225,6 +4332,8 @@ class FuturePlotGUI(GUIBase):
                                 lump_sum_savings_withdrawals_table,
                                 lump_sum_pension_withdrawals_table,
                                 monthly_from_other_sources,
+                                initial_personal_pension_value,
+                                initial_savings_amount,
                                 savings_spec,
                                 pension_spec,
                                 income_spec,
@@ -4242,6 +4351,8 @@ class FuturePlotGUI(GUIBase):
             runs_out_count = 0
             series = None
             report_every = max(1, n_simulations // 10)  # report at every 10% milestone
+            # The year of each month is the same for every simulation so find it once.
+            year_index_list = FuturePlotGUI.GetYearIndexList(datetime_list)
 
             # For state pension scaling: the base table was built using the PERT mode rate.
             # We pre-compute the mode rate so we can calculate a ratio for each simulation.
@@ -4271,7 +4382,7 @@ class FuturePlotGUI(GUIBase):
 
                 if income_spec.is_stochastic:
                     monthly_budget_table = self._get_monthly_budget_table_for_rates(
-                        datetime_list, i_rates)
+                        datetime_list, i_rates, year_index_list)
                 else:
                     if sim_idx == 0:
                         monthly_budget_table = self._get_monthly_budget_table(datetime_list)
@@ -4284,6 +4395,8 @@ class FuturePlotGUI(GUIBase):
                     lump_sum_pension_withdrawals_table,
                     sim_state_pension_table,
                     monthly_from_other_sources,
+                    initial_personal_pension_value,
+                    initial_savings_amount,
                     s_rates,
                     p_rates,
                     i_rates)
@@ -4387,26 +4500,22 @@ class FuturePlotGUI(GUIBase):
 
         return scaled
 
-    def _get_monthly_budget_table_for_rates(self, datetime_list, income_rate_list):
+    def _get_monthly_budget_table_for_rates(self, datetime_list, income_rate_list, year_index_list):
         """@brief Build the monthly budget table using a supplied per-year income-increase rate list.
                   Used by Monte Carlo when the income-increase spec is stochastic.
            @param datetime_list     Monthly datetime list.
            @param income_rate_list  List of yearly increase rates (one per year).
+           @param year_index_list   The year index of each month as returned by GetYearIndexList().
            @return The budget table (list of [datetime, monthly_income] rows)."""
-        future_table = []
-        last_datetime = datetime_list[0]
+        # The income only changes when the year rolls over so calculate it once per year.
         monthly_income = float(self._get_param_value(FuturePlotGUI.MONTHLY_INCOME))
-        year_index = 0
-        for this_datetime in datetime_list:
-            if this_datetime.year == last_datetime.year:
-                future_table.append([this_datetime, monthly_income])
-            else:
-                rate = float(income_rate_list[min(year_index, len(income_rate_list) - 1)])
-                monthly_income = monthly_income * (1 + rate / 100)
-                future_table.append([this_datetime, monthly_income])
-                last_datetime = this_datetime
-                year_index += 1
-        return future_table
+        yearly_income_list = [monthly_income]
+        for year_index in range(year_index_list[-1]):
+            rate = float(income_rate_list[min(year_index, len(income_rate_list) - 1)])
+            monthly_income = monthly_income * (1 + rate / 100)
+            yearly_income_list.append(monthly_income)
+        return [[this_datetime, yearly_income_list[year_index]]
+                for this_datetime, year_index in zip(datetime_list, year_index_list)]
 
     def get_mc_plot_gui(self):
         """@return The MonteCarloPlotGUI instance."""
@@ -4418,7 +4527,7 @@ class FuturePlotGUI(GUIBase):
         # Ensure the monthly spending table does not include dates before the report start date.
         output_table = []
         for row in monthly_spending_table:
-            row_date = datetime.strptime(row[0], '%d-%m-%Y')
+            row_date = GUIBase.ParseDate(row[0])
             if row_date >= self._report_start_date:
                 output_table.append(row)
         return output_table
@@ -4448,23 +4557,29 @@ class FuturePlotGUI(GUIBase):
             died_before_75 = True
         return died_before_75
 
-    def _get_value_drop(self, this_date, value, withdrawals_table):
-        """@brief Determine how much a value drops given the withdrawal table amounts.
-                  The withdrawals_table contains dates and amounts on each row. If a date falls
-                  within the next month (from this_date) then the amount is deducted from the value.
-           @param this_date The date to check for.
-           @param value The current value.
+    def _get_tax_free_pension_date(self, datetime_list):
+        """@brief Get the date at which the pension passes tax free to savings because of death before 75.
+                  _dead_before_75() can only become True at the first date after death (age only
+                  increases after that), so only that date is checked rather than every month.
+           @param datetime_list A list of monthly datetime instances in ascending order.
+           @return The first date in datetime_list for which _dead_before_75() is True or None."""
+        death_date = self._get_my_max_date()
+        for this_date in datetime_list:
+            if this_date > death_date:
+                if self._dead_before_75(this_date):
+                    return this_date
+                break
+        return None
+
+    def _get_withdrawals_by_month(self, withdrawals_table):
+        """@brief Get the total amount withdrawn in each month of a withdrawals table.
            @param withdrawals_table The table (date, amount on each row) that details each value drop.
-           @return The new or unchanged value."""
+           @return A dict. Keys = (year, month) tuples, values = the total amount withdrawn in that month."""
+        withdrawals_by_month = defaultdict(float)
         for row in withdrawals_table:
             _date = row[0]
-            amount = row[1]
-            if self.is_this_month(_date, this_date):
-                value -= amount
-        return value
-
-    def is_this_month(self, this_date, date_to_check):
-        return (this_date.year == date_to_check.year and this_date.month == date_to_check.month)
+            withdrawals_by_month[(_date.year, _date.month)] += row[1]
+        return withdrawals_by_month
 
     def _do_plot(self,
                  name,
@@ -4531,14 +4646,12 @@ class FuturePlotGUI(GUIBase):
         yearly_rate = self._get_yearly_rate(yearly_rate_list, year_index)
         return savings_amount*(1 + (yearly_rate/100))
 
-    def _get_savings_increase_this_month(self, savings_amount, year_index):
+    def _get_savings_increase_this_month(self, savings_amount, yearly_rate):
         """@brief Get the increase in the savings this month using the predicted interest rate.
                   Uses monthly compounding consistent with pension growth calculations.
            @param savings_amount The current value of our savings.
-           @param year_index An index from the start of the report to this year. Used to determine the predicted interest rate.
+           @param yearly_rate The predicted interest rate (%) this year.
            @return As per the brief."""
-        yearly_rate_list = self._get_param_value(FuturePlotGUI.SAVINGS_INTEREST_RATE_LIST)
-        yearly_rate = self._get_yearly_rate(yearly_rate_list, year_index)
         annual_rate = yearly_rate / 100
         # Use monthly compounding: monthly_rate = (1 + annual_rate)^(1/12) - 1
         monthly_increase = savings_amount * ((1 + annual_rate) ** (1 / 12) - 1)
@@ -4561,18 +4674,26 @@ class FuturePlotGUI(GUIBase):
         interest_earned = new_balance - principal
         return new_balance, interest_earned
 
-    def _get_pension_increase_this_month(self, personal_pension_value, year_index):
+    def _get_pension_increase_this_month(self, personal_pension_value, yearly_rate):
         """@brief Get the increase in the pension this month using the predicted growth rate.
                   This assumes that growth compounds daily.
            @param personal_pension_value The current value of our pensions.
-           @param year_index An index from the start of the report to this year. Used to determine the predicted interest rate.
+           @param yearly_rate The predicted growth rate (%) this year.
            @return The increase in the pension value."""
-        yearly_rate_list = self._get_param_value(FuturePlotGUI.PENSION_GROWTH_RATE_LIST)
-        yearly_rate = self._get_yearly_rate(yearly_rate_list, year_index)
         yearly_rate = yearly_rate / 100
         monthly_increase = Report1GUI.GetMonthlyGrowth(personal_pension_value, yearly_rate)
         return monthly_increase
 
+    def _get_yearly_rates(self, rate_list, n_years):
+        """@brief Get the rate for each year of a prediction so that the rate list is not re-read every month.
+           @param rate_list As per _get_yearly_rate().
+           @param n_years The number of years in the prediction.
+           @return A list of n_years rates or None if rate_list is a PERT string. These must be passed
+                   to _get_yearly_rate() each time as a fresh sample is drawn on each call."""
+        if isinstance(rate_list, str) and PertDistribution.is_pert_string(rate_list):
+            return None
+        return [self._get_yearly_rate(rate_list, year_index) for year_index in range(n_years)]
+
     def _get_compound_growth_table(self, initial_value, growth_rate_list, datetime_list):
         """@brief Get a table that details the compound growth of a value. We assume that
                   growth is added yearly.
@@ -4598,12 +4719,16 @@ class FuturePlotGUI(GUIBase):
             compound_growth_table.append((_date, value))
         return compound_growth_table
 
-    def _get_personal_pension_table(self):
-        """@return A table that contains the total amounts in all our personal pension
+    def _get_personal_pension_table(self, pp_table=None):
+        """@param pp_table The amalgamated table of all personal pensions if already built.
+                           If None it is built from the pension accounts.
+           @return A table that contains the total amounts in all our personal pension
                    accounts over time. This is not predicted but comprises the total of all
                    pensions."""
-        pp_dfl = self._get_personal_pension_pd_dfl()
-        pp_table = self._get_amalgamated_table(pp_dfl)
+        import pandas as pd
+        if pp_table is None:
+            pp_dfl = self._get_personal_pension_pd_dfl()
+            pp_table = self._get_amalgamated_table(pp_dfl)
         pp_table = FuturePlotGUI.ClipTable(pp_table, self._report_start_date)
         # The pp_table holds the data for all personal pensions. The first date
         # may not be the report start date but as far as we're aware first amount is the
@@ -4619,24 +4744,52 @@ class FuturePlotGUI(GUIBase):
 
         return pp_table
 
-    def _get_savings_table(self):
-        """@param start_date The start date. Dates before this are ignored.
+    def _get_savings_table(self, savings_table=None):
+        """@param savings_table The amalgamated table of all savings accounts if already built.
+                                If None it is built from the savings accounts.
            @return A table that contains the total amounts in all our savings accounts
                    over time. This is not predicted but comprises the total of all
                    savings accounts."""
-        savings_dfl = self._get_savings_pd_dfl()
-        savings_table = self._get_amalgamated_table(savings_dfl)
+        if savings_table is None:
+            savings_dfl = self._get_savings_pd_dfl()
+            savings_table = self._get_amalgamated_table(savings_dfl)
         return FuturePlotGUI.ClipTable(savings_table, self._report_start_date)
 
-    def _get_total_table(self):
-        """@return A table that contains the total amounts in our personal
+    def _get_total_table(self, pp_table=None, savings_table=None):
+        """@param pp_table The amalgamated table of all personal pensions if already built.
+           @param savings_table The amalgamated table of all savings accounts if already built.
+                                If either table is None the total is built from all the accounts.
+           @return A table that contains the total amounts in our personal
                    pension and saviings over time. This is not predicted but
                    comprises the total of all personal pension and savings accounts."""
-        pp_dfl = self._get_personal_pension_pd_dfl()
-        savings_dfl = self._get_savings_pd_dfl()
-        total_table = self._get_amalgamated_table(pp_dfl+savings_dfl)
+        if pp_table is None or savings_table is None:
+            pp_dfl = self._get_personal_pension_pd_dfl()
+            savings_dfl = self._get_savings_pd_dfl()
+            total_table = self._get_amalgamated_table(pp_dfl+savings_dfl)
+        else:
+            total_table = self._get_total_of_tables(pp_table, savings_table)
         return FuturePlotGUI.ClipTable(total_table, self._report_start_date)
 
+    def _get_total_of_tables(self, *tables):
+        """@brief Get the total of tables that have already been amalgamated. This gives the same
+                  result as amalgamating all of their accounts together as each table already holds
+                  the total at every date that one of its accounts changed.
+           @param tables The amalgamated (date, total) tables.
+           @return The amalgamated (date, total) table of the sum of the tables."""
+        import pandas as pd
+        dataframe_list = [pd.DataFrame(FuturePlotGUI.Table2Dict(table)) for table in tables if table]
+        return self._get_amalgamated_table(dataframe_list)
+
+    def _get_account_tables(self):
+        """@brief Get the personal pension, savings and total tables reading each account once.
+           @return A tuple of the tables returned by _get_personal_pension_table(),
+                   _get_savings_table() and _get_total_table()."""
+        pp_table = self._get_amalgamated_table(self._get_personal_pension_pd_dfl())
+        savings_table = self._get_amalgamated_table(self._get_savings_pd_dfl())
+        return (self._get_personal_pension_table(pp_table),
+                self._get_savings_table(savings_table),
+                self._get_total_table(pp_table, savings_table))
+
     def _get_amalgamated_table(self, dataframe_list, return_total_table=True):
         """@brief Get an amalgamated table such that the total value of all input tables
                   can be seen over time. This was originally aimed at combining multiple
@@ -4650,6 +4803,7 @@ class FuturePlotGUI(GUIBase):
                                      If False then the table returned has the same Date
                                      column but has separate columns for the total of
                                      each of the input tables."""
+        import pandas as pd
         table_index = 0
         for df in dataframe_list:
             # Convert 'Date' column to datetime
@@ -4666,7 +4820,10 @@ class FuturePlotGUI(GUIBase):
             # Merge all tables in the list
             merged_table = dataframe_list[0]
             for table in dataframe_list[1:]:
-                merged_table = merged_table.merge(table, on='Date', how='outer').sort_values(by="Date")
+                merged_table = merged_table.merge(table, on='Date', how='outer')
+            # Sort once all the tables are merged rather than after each merge.
+            if len(dataframe_list) > 1:
+                merged_table = merged_table.sort_values(by="Date")
             # Fill NaN values with previous row value if NaN
             # merged_table.fillna(method='ffill', inplace=True)
             merged_table.ffill(inplace=True)
@@ -4677,7 +4834,8 @@ class FuturePlotGUI(GUIBase):
             # Sum all the columns so that we know the total value each time it changes
             merged_table['Total'] = merged_table.drop(columns=['Date']).sum(axis=1)
 
-            merged_table['Date'] = merged_table['Date'].apply(lambda x: x.to_pydatetime())
+            # The Date column is left as datetime64. Converting each value to a python datetime here
+            # is wasted as pandas infers the column back to datetime64 and the rows hold Timestamps.
 
             if return_total_table:
                 # Reset the Date index column so it is appears as any other table column
@@ -4695,6 +4853,7 @@ class FuturePlotGUI(GUIBase):
             return []
 
     def _get_personal_pension_pd_dfl(self):
+        import pandas as pd
         # Build a list of pandas dataframes
         pd_dataframe_list = []
         pension_dict_list = self._config.get_pension_dict_list()
@@ -4707,6 +4866,7 @@ class FuturePlotGUI(GUIBase):
         return pd_dataframe_list
 
     def _get_savings_pd_dfl(self):
+        import pandas as pd
         # Build a list of pandas dataframes
         pd_dataframe_list = []
         bank_accounts_dict_list = self._config.get_bank_accounts_dict_list()
@@ -4761,21 +4921,26 @@ class FuturePlotGUI(GUIBase):
             date_value_table = self._convert_table(
                 pension_dict[PensionGUI.PENSION_TABLE])
             state_pension_start_date_str = pension_dict[PensionGUI.STATE_PENSION_START_DATE]
-            state_pension_start_date = datetime.strptime(
-                state_pension_start_date_str, '%d-%m-%Y')
+            state_pension_start_date = GUIBase.ParseDate(state_pension_start_date_str)
             last_datetime = datetime_list[0]
             # Get the initial state pension amount based on the start date for the calc
             state_pension_amount = self._get_initial_value(date_value_table, initial_date=report_start_date)
+            yearly_increase_list = self._get_param_value(FuturePlotGUI.STATE_PENSION_YEARLY_INCREASE_LIST)
+            # The owner is alive until they die and then not, so find how many months they are
+            # alive with a binary search rather than checking the alive state every month.
+            alive_month_count = bisect.bisect_left(datetime_list, True,
+                                                   key=lambda _datetime: not (self._is_pension_owner_alive(owner, _datetime) and
+                                                                              self._is_partner_alive(owner, _datetime)))
             year_index = 0
             receiving_state_pension = False
-            for this_datetime in datetime_list:
+            for index, this_datetime in enumerate(datetime_list):
                 # If the state pension changes, this occurs on 6 Apr for the new tax year.
                 # We approximate this to the 1 may as we won't get a full months pension until then.
                 # This means that the prediction will miss some of the first months state pension but
                 # we accept this for purposes of this report.
                 if this_datetime.month == 5 and year_index > 0:
                     state_pension_amount = self._calc_new_account_value(state_pension_amount,
-                                                                        self._get_param_value(FuturePlotGUI.STATE_PENSION_YEARLY_INCREASE_LIST),
+                                                                        yearly_increase_list,
                                                                         year_index)
 
                 # Determine if the state pension has started yet
@@ -4788,12 +4953,9 @@ class FuturePlotGUI(GUIBase):
                 # We assume that the partner receives none of the state pension. This may not be
                 # the case as pension rules prior to 2016 but for the purposes of this tool
                 # this is the assumption.
-                if not self._is_pension_owner_alive(owner, this_datetime):
-                    receiving_state_pension = False
-
                 # We assume that if your partner dies then their state pension stops. You may get some
                 # money from the DWP but for purposes of this prediction we assume worst case.
-                if not self._is_partner_alive(owner, this_datetime):
+                if index >= alive_month_count:
                     receiving_state_pension = False
 
                 if receiving_state_pension:
@@ -4846,19 +5008,18 @@ class FuturePlotGUI(GUIBase):
         return alive
 
     def _get_state_pension_this_month(self, at_date, state_pension_table):
+        """@brief Get the state pension received in a month.
+           @param at_date The date of interest.
+           @param state_pension_table The predicted state pension table (date, yearly amount rows) in date order.
+           @return The amount from the first row on or after at_date (or the last row) divided by 12."""
         if len(state_pension_table) == 0:
             return 0
 
         else:
-            amount = state_pension_table[0][1]
-            if len(state_pension_table) > 0:
-                amount = state_pension_table[0][1]
-                for row in state_pension_table:
-                    _date = row[0]
-                    amount = row[1]
-                    if at_date <= _date:
-                        break
-
+            # The table is in date order so find the row with a binary search rather than walking it every month.
+            index = bisect.bisect_left(state_pension_table, at_date, key=lambda row: row[0])
+            index = min(index, len(state_pension_table) - 1)
+            amount = state_pension_table[index][1]
             return amount/12
 
     def _get_initial_value(self, date_value_table, initial_date=None):
@@ -4918,13 +5079,14 @@ class FuturePlotGUI(GUIBase):
         future_table = []
         last_datetime = datetime_list[0]
         monthly_income = float(self._get_param_value(FuturePlotGUI.MONTHLY_INCOME))
+        yearly_increase_in_income = self._get_param_value(FuturePlotGUI.YEARLY_INCREASE_IN_INCOME)
         year_index = 0
         for this_datetime in datetime_list:
             if this_datetime.year == last_datetime.year:
                 future_table.append([this_datetime, monthly_income])
             # We check for year rolling over as this is when we expect an increase in our income against inflation.
             else:
-                monthly_income = self._calc_new_account_value(monthly_income, self._get_param_value(FuturePlotGUI.YEARLY_INCREASE_IN_INCOME), year_index)
+                monthly_income = self._calc_new_account_value(monthly_income, yearly_increase_in_income, year_index)
                 future_table.append([this_datetime, monthly_income])
                 last_datetime = this_datetime
                 year_index += 1
@@ -4949,7 +5111,7 @@ class FuturePlotGUI(GUIBase):
         if len(rate_list) < 1:
             raise Exception("Rate list error. The rate_list must have at least one element.")
         if isinstance(rate_list, str):
-            rate_list = rate_list.split(',')
+            rate_list = GUIBase.ParseRateList(rate_list)
         if year_index >= 0 and year_index < len(rate_list):
             selected_rate = rate_list[year_index]
         else:
@@ -5018,6 +5180,20 @@ class Report1GUI(GUIBase):
     RETIREMENT_PREDICTION_SETTINGS_NAME = "Retirement prediction settings name"
     DEFAULT = "Default"
 
+    # The values of any plot attribute keys that are missing.
+    DEFAULT_PLOT_ATTR_VALUES = {MY_DATE_OF_BIRTH: "",
+                                MY_MAX_AGE: DEFAULT_MALE_MAX_AGE,
+                                PARTNER_DATE_OF_BIRTH: "",
+                                PARTNER_MAX_AGE: DEFAULT_MALE_MAX_AGE + 4,
+                                REPORT_START_DATE: "",
+                                SAVINGS_INTEREST_RATE_LIST: DEFAULT_RATE_LIST,
+                                PENSION_GROWTH_RATE_LIST: DEFAULT_RATE_LIST,
+                                STATE_PENSION_YEARLY_INCREASE_LIST: ""}
+    # The plot attribute keys that hold a table. Each gets its own empty list if missing.
+    PLOT_ATTR_TABLE_KEYS = (SAVINGS_WITHDRAWAL_TABLE,
+                            PENSION_WITHDRAWAL_TABLE,
+                            OTHER_INCOME_TABLE)
+
     BY_MONTH = "By Month"
     BY_YEAR = "By Year"
 
@@ -5104,56 +5280,29 @@ class Report1GUI(GUIBase):
         if selected_name in multiple_report1_plot_attrs_dict:
             plot_attr_dict = multiple_report1_plot_attrs_dict[selected_name]
 
-        if Report1GUI.MY_DATE_OF_BIRTH not in plot_attr_dict:
-            plot_attr_dict[Report1GUI.MY_DATE_OF_BIRTH] = ""
-
-        if Report1GUI.MY_MAX_AGE not in plot_attr_dict:
-            plot_attr_dict[Report1GUI.MY_MAX_AGE] = Report1GUI.DEFAULT_MALE_MAX_AGE
-
-        if Report1GUI.PARTNER_DATE_OF_BIRTH not in plot_attr_dict:
-            plot_attr_dict[Report1GUI.PARTNER_DATE_OF_BIRTH] = ""
-
-        if Report1GUI.PARTNER_MAX_AGE not in plot_attr_dict:
-            plot_attr_dict[Report1GUI.PARTNER_MAX_AGE] = Report1GUI.DEFAULT_MALE_MAX_AGE + 4
-
-        if Report1GUI.REPORT_START_DATE not in plot_attr_dict:
-            plot_attr_dict[Report1GUI.REPORT_START_DATE] = ""
-
-        if Report1GUI.SAVINGS_INTEREST_RATE_LIST not in plot_attr_dict:
-            plot_attr_dict[Report1GUI.SAVINGS_INTEREST_RATE_LIST] = Report1GUI.DEFAULT_RATE_LIST
-
-        if Report1GUI.PENSION_GROWTH_RATE_LIST not in plot_attr_dict:
-            plot_attr_dict[Report1GUI.PENSION_GROWTH_RATE_LIST] = Report1GUI.DEFAULT_RATE_LIST
-
-        if Report1GUI.STATE_PENSION_YEARLY_INCREASE_LIST not in plot_attr_dict:
-            plot_attr_dict[Report1GUI.STATE_PENSION_YEARLY_INCREASE_LIST] = ""
-
-        if Report1GUI.SAVINGS_WITHDRAWAL_TABLE not in plot_attr_dict:
-            plot_attr_dict[Report1GUI.SAVINGS_WITHDRAWAL_TABLE] = []
-
-        if Report1GUI.PENSION_WITHDRAWAL_TABLE not in plot_attr_dict:
-            plot_attr_dict[Report1GUI.PENSION_WITHDRAWAL_TABLE] = []
-
-        if Report1GUI.OTHER_INCOME_TABLE not in plot_attr_dict:
-            plot_attr_dict[Report1GUI.OTHER_INCOME_TABLE] = []
+        for key, value in Report1GUI.DEFAULT_PLOT_ATTR_VALUES.items():
+            plot_attr_dict.setdefault(key, value)
+        for key in Report1GUI.PLOT_ATTR_TABLE_KEYS:
+            plot_attr_dict.setdefault(key, [])
 
         multiple_report1_plot_attrs_dict[Report1GUI.DEFAULT] = plot_attr_dict
         self._config.save_multiple_report1_plot_attrs()
         return plot_attr_dict
 
-    def _get_param_value(self, param_name):
+    def _get_plot_attr_dict(self):
+        """@brief Get the parameters dict of the selected settings name.
+           @return The dict holding the parameters of the selected settings."""
         selected_name = self._get_selected_retirement_predictions_settings_name()
-        multiple_report1_plot_attrs_dict = self._config.get_multiple_report1_plot_attrs_dict()
-        plot_attr_dict = multiple_report1_plot_attrs_dict[selected_name]
+        return self._config.get_multiple_report1_plot_attrs_dict()[selected_name]
+
+    def _get_param_value(self, param_name):
+        plot_attr_dict = self._get_plot_attr_dict()
         if param_name not in plot_attr_dict:
             raise Exception(f"{param_name} not found in plot_attr_dict={plot_attr_dict}")
         return plot_attr_dict[param_name]
 
     def _set_param_value(self, param_name, value):
-        selected_name = self._get_selected_retirement_predictions_settings_name()
-        multiple_report1_plot_attrs_dict = self._config.get_multiple_report1_plot_attrs_dict()
-        plot_attr_dict = multiple_report1_plot_attrs_dict[selected_name]
-        plot_attr_dict[param_name] = value
+        self._get_plot_attr_dict()[param_name] = value
 
     def init_page(self):
         env_args = Report1GUIEnvArgs().get()
@@ -5169,6 +5318,8 @@ class Report1GUI(GUIBase):
                               show_load_save_notifications=False)
         self._config.load_config(self._config_password)
         self._withdrawal_edit_table = None
+        # Set when a parameter field changes so that _update_dict_from_gui() knows to revalidate them.
+        self._gui_dirty = True
 
         self._ensure_keys_present()
 
@@ -5199,17 +5350,24 @@ class Report1GUI(GUIBase):
                 with ui.row():
                     self._savings_interest_rates_field = ui.input(label=Report1GUI.SAVINGS_INTEREST_RATE_LIST).style(
                         'width: 500px;').tooltip('This may be a single value or a comma separated list (one value for each year). The last value in the list will be used for subsequent years.')
-                    self._savings_interest_rates_field.value = self._get_param_value(Report1GUI.SAVINGS_INTEREST_RATE_LIST)
 
                 with ui.row():
                     self._pension_growth_rate_list_field = ui.input(label=Report1GUI.PENSION_GROWTH_RATE_LIST).style(
                         'width: 500px;').tooltip('This may be a single value or a comma separated list (one value for each year). The last value in the list will be used for subsequent years.')
-                    self._pension_growth_rate_list_field.value = self._get_param_value(Report1GUI.PENSION_GROWTH_RATE_LIST)
 
                 with ui.row():
                     self._state_pension_growth_rate_list_field = ui.input(label=Report1GUI.STATE_PENSION_YEARLY_INCREASE_LIST).style(
                         'width: 500px;').tooltip('This may be a single value or a comma separated list (one value for each year). The last value in the list will be used for subsequent years.')
-                    self._state_pension_growth_rate_list_field.value = self._get_param_value(Report1GUI.STATE_PENSION_YEARLY_INCREASE_LIST)
+
+        for field in (self._my_dob_field,
+                      self._my_max_age_field,
+                      self._partner_dob_field,
+                      self._partner_max_age_field,
+                      self._start_date_field,
+                      self._savings_interest_rates_field,
+                      self._pension_growth_rate_list_field,
+                      self._state_pension_growth_rate_list_field):
+            field.on_value_change(self._set_gui_dirty)
 
         with ui.row():
             savings_columns = [{'name': Report1GUI.DATE, 'label': Report1GUI.DATE, 'field': Report1GUI.DATE},
@@ -5279,8 +5437,6 @@ class Report1GUI(GUIBase):
                         ui.button('Edit', on_click=lambda: self._edit_savings_withdrawal()).tooltip(
                             'Edit a savings withdrawal in the table.')
 
-            self._update_gui_tables()
-
         with ui.row():
             with ui.card():
                 ui.label("Save/Load the above retirement prediction parameter set.")
@@ -5340,17 +5496,9 @@ class Report1GUI(GUIBase):
     def _del_other_income(self):
         """@brief Called when the delete a pension withdrawal button is selected."""
         selected_dict_list = self._other_income_table.selected
-        if selected_dict_list and len(selected_dict_list) > 0:
-            for selected_dict in selected_dict_list:
-                if Report1GUI.DATE in selected_dict:
-                    del_date = selected_dict[Report1GUI.DATE]
-                    table = self._get_param_value(Report1GUI.OTHER_INCOME_TABLE)
-                    new_table = []
-                    for row in table:
-                        date = row[0]
-                        if date != del_date:
-                            new_table.append(row)
-                    self._set_param_value(Report1GUI.OTHER_INCOME_TABLE, new_table)
+        if selected_dict_list:
+            table = self._get_param_value(Report1GUI.OTHER_INCOME_TABLE)
+            self._set_param_value(Report1GUI.OTHER_INCOME_TABLE, Report1GUI.RemoveSelectedRows(table, selected_dict_list))
         ui.notify(f"Deleted {len(selected_dict_list)} rows from the other income table.")
         self._update_gui_tables()
 
@@ -5408,8 +5556,8 @@ class Report1GUI(GUIBase):
                 raise Exception("{self._withdrawal_edit_table} is an unknown withdrawal table.")
 
             new_rows = []
+            date_entered = FuturePlotGUI.GetDate(self._edit_date_input_field.value)
             for row in table:
-                date_entered = FuturePlotGUI.GetDate(self._edit_date_input_field.value)
                 table_date_str = row[0]
                 table_date = FuturePlotGUI.GetDate(table_date_str)
                 if date_entered == table_date:
@@ -5483,11 +5631,13 @@ class Report1GUI(GUIBase):
         """@brief Show a table of the configured bank accounts.
            @param gui_table The GUI table element.
            @param table_data The table date. Each row has two elements (DATE and AMOUNT)."""
-        gui_table.rows.clear()
-        gui_table.update()
-        for row in table_data:
-            gui_table.add_row({Report1GUI.DATE: row[0], Report1GUI.AMOUNT: row[1], Report1GUI.INFO: row[2], Report1GUI.AMOUNT_TAXABLE: row[3]})
-        gui_table.run_method('scrollTo', len(gui_table.rows)-1)
+        rows = [{Report1GUI.DATE: row[0], Report1GUI.AMOUNT: row[1], Report1GUI.INFO: row[2], Report1GUI.AMOUNT_TAXABLE: row[3]} for row in table_data]
+        # All the tables are redrawn when any one of them changes. Only send the tables
+        # that have changed to the browser, assigning all the rows at once so that a
+        # single update is sent.
+        if rows != gui_table.rows:
+            gui_table.rows = rows
+            gui_table.run_method('scrollTo', len(rows)-1)
 
     def _edit_row_dialog_cancel_button_press(self):
         self._edit_row_dialog.close()
@@ -5522,17 +5672,9 @@ class Report1GUI(GUIBase):
     def _del_savings_withdrawal(self):
         """@brief Called when the delete a savings withdrawal button is selected."""
         selected_dict_list = self._savings_withdrawals_table.selected
-        if selected_dict_list and len(selected_dict_list) > 0:
-            for selected_dict in selected_dict_list:
-                if Report1GUI.DATE in selected_dict:
-                    del_date = selected_dict[Report1GUI.DATE]
-                    table = self._get_param_value(Report1GUI.SAVINGS_WITHDRAWAL_TABLE)
-                    new_table = []
-                    for row in table:
-                        date = row[0]
-                        if date != del_date:
-                            new_table.append(row)
-                    self._set_param_value(Report1GUI.SAVINGS_WITHDRAWAL_TABLE, new_table)
+        if selected_dict_list:
+            table = self._get_param_value(Report1GUI.SAVINGS_WITHDRAWAL_TABLE)
+            self._set_param_value(Report1GUI.SAVINGS_WITHDRAWAL_TABLE, Report1GUI.RemoveSelectedRows(table, selected_dict_list))
         ui.notify(f"Deleted {len(selected_dict_list)} rows from the savings withdrawal table.")
         self._update_gui_tables()
 
@@ -5609,17 +5751,9 @@ class Report1GUI(GUIBase):
     def _del_pension_withdrawal(self):
         """@brief Called when the delete a pension withdrawal button is selected."""
         selected_dict_list = self._pension_withdrawals_table.selected
-        if selected_dict_list and len(selected_dict_list) > 0:
-            for selected_dict in selected_dict_list:
-                if Report1GUI.DATE in selected_dict:
-                    del_date = selected_dict[Report1GUI.DATE]
-                    table = self._get_param_value(Report1GUI.PENSION_WITHDRAWAL_TABLE)
-                    new_table = []
-                    for row in table:
-                        date = row[0]
-                        if date != del_date:
-                            new_table.append(row)
-                    self._set_param_value(Report1GUI.PENSION_WITHDRAWAL_TABLE, new_table)
+        if selected_dict_list:
+            table = self._get_param_value(Report1GUI.PENSION_WITHDRAWAL_TABLE)
+            self._set_param_value(Report1GUI.PENSION_WITHDRAWAL_TABLE, Report1GUI.RemoveSelectedRows(table, selected_dict_list))
         ui.notify(f"Deleted {len(selected_dict_list)} rows from the pension withdrawal table.")
         self._update_gui_tables()
 
@@ -5636,9 +5770,7 @@ class Report1GUI(GUIBase):
     def _get_selected_retirement_predictions_settings_name(self):
         """@brief Get the name of the selected retirement predictions settings."""
         selected_retirement_parameters_name_dict = self._config.get_selected_report1_parameters_name_dict()
-        if Report1GUI.RETIREMENT_PREDICTION_SETTINGS_NAME not in selected_retirement_parameters_name_dict:
-            selected_retirement_parameters_name_dict[Report1GUI.RETIREMENT_PREDICTION_SETTINGS_NAME] = Report1GUI.DEFAULT
-        return selected_retirement_parameters_name_dict[Report1GUI.RETIREMENT_PREDICTION_SETTINGS_NAME]
+        return selected_retirement_parameters_name_dict.setdefault(Report1GUI.RETIREMENT_PREDICTION_SETTINGS_NAME, Report1GUI.DEFAULT)
 
     def _select_settings_name(self, value):
         # Clear the new name field
@@ -5672,8 +5804,7 @@ class Report1GUI(GUIBase):
     def _load_settings(self, selected_settings_name):
         """@brief Load the prediction parameters.
            @param selected_settings_name The name of the settings to load."""
-        name_list = self._get_settings_name_list()
-        if selected_settings_name in name_list:
+        if selected_settings_name in self._config.get_multiple_report1_plot_attrs_dict():
             # Load from the stored settings file
             self._update_gui_from_dict()
 
@@ -5681,14 +5812,15 @@ class Report1GUI(GUIBase):
         """@brief Load config from persistent storage and display in GUI."""
         retirement_predictions_settings_name = self._get_selected_retirement_predictions_settings_name()
         self._settings_name_select.value = retirement_predictions_settings_name
-        self._my_dob_field.value = self._get_param_value(Report1GUI.MY_DATE_OF_BIRTH)
-        self._my_max_age_field.value = self._get_param_value(Report1GUI.MY_MAX_AGE)
-        self._partner_dob_field.value = self._get_param_value(Report1GUI.PARTNER_DATE_OF_BIRTH)
-        self._partner_max_age_field.value = self._get_param_value(Report1GUI.PARTNER_MAX_AGE)
-        self._savings_interest_rates_field.value = self._get_param_value(Report1GUI.SAVINGS_INTEREST_RATE_LIST)
-        self._pension_growth_rate_list_field.value = self._get_param_value(Report1GUI.PENSION_GROWTH_RATE_LIST)
-        self._state_pension_growth_rate_list_field.value = self._get_param_value(Report1GUI.STATE_PENSION_YEARLY_INCREASE_LIST)
-        self._start_date_field.value = self._get_param_value(Report1GUI.REPORT_START_DATE)
+        plot_attr_dict = self._get_plot_attr_dict()
+        self._my_dob_field.value = plot_attr_dict[Report1GUI.MY_DATE_OF_BIRTH]
+        self._my_max_age_field.value = plot_attr_dict[Report1GUI.MY_MAX_AGE]
+        self._partner_dob_field.value = plot_attr_dict[Report1GUI.PARTNER_DATE_OF_BIRTH]
+        self._partner_max_age_field.value = plot_attr_dict[Report1GUI.PARTNER_MAX_AGE]
+        self._savings_interest_rates_field.value = plot_attr_dict[Report1GUI.SAVINGS_INTEREST_RATE_LIST]
+        self._pension_growth_rate_list_field.value = plot_attr_dict[Report1GUI.PENSION_GROWTH_RATE_LIST]
+        self._state_pension_growth_rate_list_field.value = plot_attr_dict[Report1GUI.STATE_PENSION_YEARLY_INCREASE_LIST]
+        self._start_date_field.value = plot_attr_dict[Report1GUI.REPORT_START_DATE]
         self._update_gui_tables()
 
     def _save(self):
@@ -5699,7 +5831,7 @@ class Report1GUI(GUIBase):
             if selected_name != new_name:
                 multiple_report1_plot_attrs_dict = self._config.get_multiple_report1_plot_attrs_dict()
                 plot_attr_dict = multiple_report1_plot_attrs_dict[selected_name]
-                multiple_report1_plot_attrs_dict[new_name] = copy.deepcopy(plot_attr_dict)
+                multiple_report1_plot_attrs_dict[new_name] = Report1GUI.CopyPlotAttrDict(plot_attr_dict)
             self._config.save_multiple_report1_plot_attrs()
             # Clear the new name field
             self._new_settings_name_input.value = ""
@@ -5729,6 +5861,7 @@ class Report1GUI(GUIBase):
                     "Cancel", on_click=self._add_row_dialog_cancel_button_press)
 
     def on_repeat_until_end_field_change(self, event):
+        from dateutil.relativedelta import relativedelta
         # If selected
         if self._repeat_until_end_field.value:
             # If user has not entered a date select the start of the next month and calc how many more monthly values are required.
@@ -5795,6 +5928,7 @@ class Report1GUI(GUIBase):
         return next_dt
 
     def _add_row_dialog_ok_button_press(self):
+        from dateutil.relativedelta import relativedelta
         # We no longer check for zero of greater on these fields.
         # self._amount_field
         # We no longer check for zero or greater values because the user may wish to
@@ -5818,101 +5952,57 @@ class Report1GUI(GUIBase):
             if self._repeat_field.value == Report1GUI.MONTHLY:
                 monthly = True
 
+            if self._button_selected == Report1GUI.ADD_SAVINGS_WITHDRAWAL_BUTTON:
+                rows = self._get_param_value(Report1GUI.SAVINGS_WITHDRAWAL_TABLE)
+
+            elif self._button_selected == Report1GUI.ADD_PENSION_WITHDRAWAL_BUTTON:
+                rows = self._get_param_value(Report1GUI.PENSION_WITHDRAWAL_TABLE)
+
+            elif self._button_selected == Report1GUI.ADD_OTHER_INCOME_BUTTON:
+                rows = self._get_param_value(Report1GUI.OTHER_INCOME_TABLE)
+
+            else:
+                raise Exception("BUG: Neither the add savings, add pensions or add other income button was selected ???")
+
             occurrence_count = self._repeat_count_field.value
-            date_obj = datetime.strptime(self._date_input_field.value, "%d-%m-%Y")
-            the_date = date_obj.strftime("%d-%m-%Y")
-            last_date = the_date
+            # Parse the start date once and step the datetime on rather than parsing and
+            # formatting a date string for every occurrence.
+            the_datetime = GUIBase.ParseDate(self._date_input_field.value)
+            last_datetime = the_datetime
             amount = self._amount_field.value
             amount_taxable = self._amount_taxable_field.value
             yearly_percentage_increase = self._yearly_percentage_increase_field.value
             info_str = self._info_field.value
+            # Collect the dates already in the table so each new date is checked with a set lookup.
+            table_dates = {row[0] for row in rows}
             for _ in range(0, int(occurrence_count)):
-                # If no change in the amount each year
-                if yearly_percentage_increase == 0:
-                    row = (the_date, amount, info_str, amount_taxable)
-                else:
-                    if self._has_year_rolled_over(the_date, last_date):
+                the_date = the_datetime.strftime("%d-%m-%Y")
+                # Increase the amount each time the year rolls over (if an increase was entered).
+                if yearly_percentage_increase != 0:
+                    if the_datetime.year != last_datetime.year:
                         amount = round(amount * (1+(yearly_percentage_increase/100)), 2)
-                        row = (the_date, amount, info_str, amount_taxable)
-                    else:
-                        row = (the_date, amount, info_str, amount_taxable)
-                    last_date = the_date
-
-                if self._button_selected == Report1GUI.ADD_SAVINGS_WITHDRAWAL_BUTTON:
-                    rows = self._get_param_value(Report1GUI.SAVINGS_WITHDRAWAL_TABLE)
-                    if self._check_date_in_table(the_date, rows):
-                        self._show_negative_notify_msg(f"{the_date} is already in the table.")
-                        break
-
-                    else:
-                        rows.append(row)
-                        # Sort table in ascending date order
-                        sorted_rows = sorted(rows, key=lambda row: datetime.strptime(row[0], "%d-%m-%Y"))
-                        self._set_param_value(Report1GUI.SAVINGS_WITHDRAWAL_TABLE, sorted_rows)
-
-                elif self._button_selected == Report1GUI.ADD_PENSION_WITHDRAWAL_BUTTON:
-                    rows = self._get_param_value(Report1GUI.PENSION_WITHDRAWAL_TABLE)
-                    if self._check_date_in_table(the_date, rows):
-                        self._show_negative_notify_msg(f"{the_date} is already in the table.")
-                        break
+                    last_datetime = the_datetime
 
-                    else:
-                        rows.append(row)
-                        # Sort table in ascending date order
-                        sorted_rows = sorted(rows, key=lambda row: datetime.strptime(row[0], "%d-%m-%Y"))
-                        self._set_param_value(Report1GUI.PENSION_WITHDRAWAL_TABLE, sorted_rows)
-
-                elif self._button_selected == Report1GUI.ADD_OTHER_INCOME_BUTTON:
-                    rows = self._get_param_value(Report1GUI.OTHER_INCOME_TABLE)
-                    if self._check_date_in_table(the_date, rows):
-                        self._show_negative_notify_msg(f"{the_date} is already in the table.")
-                        break
+                if the_date in table_dates:
+                    self._show_negative_notify_msg(f"{the_date} is already in the table.")
+                    break
 
-                    else:
-                        rows.append(row)
-                        # Sort table in ascending date order
-                        sorted_rows = sorted(rows, key=lambda row: datetime.strptime(row[0], "%d-%m-%Y"))
-                        self._set_param_value(Report1GUI.OTHER_INCOME_TABLE, sorted_rows)
-
-                else:
-                    raise Exception("BUG: Neither the add savings, add pensions or add other income button was selected ???")
+                rows.append((the_date, amount, info_str, amount_taxable))
+                table_dates.add(the_date)
 
                 if yearly:
-                    the_date = self._get_next_date_str(the_date, 12)
+                    the_datetime += relativedelta(months=+12)
 
                 if monthly:
-                    the_date = self._get_next_date_str(the_date, 1)
+                    the_datetime += relativedelta(months=+1)
 
+            # Sort table in ascending date order once all the rows have been added.
+            rows.sort(key=lambda row: datetime.strptime(row[0], "%d-%m-%Y"))
             self._update_gui_tables()
 
-    def _has_year_rolled_over(self, date_now_str, date_last_str):
-        """@brief Determine if the year has rolled over between the two dates.
-           @param date_now_str The current date string of the form dd-mm-yyyy.
-           @param date_last_str The current date string of the form dd-mm-yyyy."""
-        now_datetime = datetime.strptime(date_now_str, "%d-%m-%Y")
-        last_datetime = datetime.strptime(date_last_str, "%d-%m-%Y")
-        year_rolled_over = False
-        # If the year has rolled over
-        if now_datetime.year != last_datetime.year:
-            year_rolled_over = True
-        return year_rolled_over
-
     def _add_row_dialog_cancel_button_press(self):
         self._add_row_dialog.close()
 
-    def _check_date_in_table(self, _date, table):
-        """@brief Check if a date is in a table. Col 0 = date.
-           @return True if it is."""
-        return any(row[0] == _date for row in table)
-
-    def _get_next_date_str(self, start_date_str, months):
-        """@brief Get the start date + the number of months.
-           @param start_date_str The from date string as dd-mm-yyyy.
-           @param months The number of months to add to the start date."""
-        start_date = datetime.strptime(start_date_str, '%d-%m-%Y')
-        next_date = start_date + relativedelta(months=+months)
-        return next_date.strftime('%d-%m-%Y')
-
     def _init_ok_to_delete_dialog(self):
         """@brief Create a dialog presented to the user to check that they wish to delete a retirement prediction parameter set."""
         with ui.dialog() as self._del_ret_pred_param_dialog, ui.card().style('width: 400px;'):
@@ -5945,9 +6035,16 @@ class Report1GUI(GUIBase):
     def _cancel_del_ret_pred_param_dialog(self):
         self._del_ret_pred_param_dialog.close()
 
+    def _set_gui_dirty(self):
+        """@brief Called when a parameter field changes."""
+        self._gui_dirty = True
+
     def _update_dict_from_gui(self):
         """@brief update the dict from the details entered into the GUI.
            @return True if all entries are valid."""
+        # Nothing has changed since the fields were last validated and stored in the dict.
+        if not self._gui_dirty:
+            return True
         valid = False
         if FuturePlotGUI.CheckValidDateString(self._start_date_field.value,
                                               field_name=self._start_date_field.props['label']):
@@ -5962,16 +6059,18 @@ class Report1GUI(GUIBase):
                                               field_name=self._pension_growth_rate_list_field.props['label']) and \
                 BankAccountGUI.CheckRateField(self._state_pension_growth_rate_list_field.value,
                                               field_name=self._state_pension_growth_rate_list_field.props['label']):
-                self._set_param_value(Report1GUI.MY_DATE_OF_BIRTH, self._my_dob_field.value)
-                self._set_param_value(Report1GUI.MY_MAX_AGE, self._my_max_age_field.value)
-                self._set_param_value(Report1GUI.PARTNER_DATE_OF_BIRTH, self._partner_dob_field.value)
-                self._set_param_value(Report1GUI.PARTNER_MAX_AGE, self._partner_max_age_field.value)
-                self._set_param_value(Report1GUI.SAVINGS_INTEREST_RATE_LIST, self._savings_interest_rates_field.value)
-                self._set_param_value(Report1GUI.PENSION_GROWTH_RATE_LIST, self._pension_growth_rate_list_field.value)
-                self._set_param_value(Report1GUI.STATE_PENSION_YEARLY_INCREASE_LIST, self._state_pension_growth_rate_list_field.value)
-                self._set_param_value(Report1GUI.REPORT_START_DATE, self._start_date_field.value)
+                plot_attr_dict = self._get_plot_attr_dict()
+                plot_attr_dict[Report1GUI.MY_DATE_OF_BIRTH] = self._my_dob_field.value
+                plot_attr_dict[Report1GUI.MY_MAX_AGE] = self._my_max_age_field.value
+                plot_attr_dict[Report1GUI.PARTNER_DATE_OF_BIRTH] = self._partner_dob_field.value
+                plot_attr_dict[Report1GUI.PARTNER_MAX_AGE] = self._partner_max_age_field.value
+                plot_attr_dict[Report1GUI.SAVINGS_INTEREST_RATE_LIST] = self._savings_interest_rates_field.value
+                plot_attr_dict[Report1GUI.PENSION_GROWTH_RATE_LIST] = self._pension_growth_rate_list_field.value
+                plot_attr_dict[Report1GUI.STATE_PENSION_YEARLY_INCREASE_LIST] = self._state_pension_growth_rate_list_field.value
+                plot_attr_dict[Report1GUI.REPORT_START_DATE] = self._start_date_field.value
                 # The savings, pension and other income tables update the dict when the add,del, edit dialogs ok buttons are selected.
                 valid = True
+                self._gui_dirty = False
 
         return valid
 
@@ -6018,6 +6117,7 @@ class Report1GUI(GUIBase):
 
     def _add_plot_pane_1_data(self, result_dict, monthly_datetime_list, report_start_date):
         """@brief Add the data needed for the traces in plot pane 1 (the top plot pane)."""
+        import pandas as pd
         pension_prediction_table_df = self._get_predicted_personal_pension(monthly_datetime_list, report_start_date, self._pension_withdrawals_table.rows)
         savings_prediction_table_df = self._get_predicted_savings(monthly_datetime_list, report_start_date, self._savings_withdrawals_table.rows)
         # Rename the columns
@@ -6031,18 +6131,18 @@ class Report1GUI(GUIBase):
 
         start_report_date = self._get_report_start_date()
 
+        # Build the actual personal pension, savings and total tables from one read of the accounts.
+        actual_personal_pension_table, actual_savings_table, actual_total_table = self._get_account_tables()
+
         # This is the actual value of the personal pension over time
-        actual_personal_pension_table = self._get_personal_pension_table()
         actual_personal_pension_table_df = pd.DataFrame(actual_personal_pension_table, columns=[Report1GUI.DATE, 'Actual Personal Pension'])
         # Remove any data before the report start date
         actual_personal_pension_table_df = actual_personal_pension_table_df[actual_personal_pension_table_df['Date'] >= start_report_date]
 
-        actual_savings_table = self._get_savings_table()
         actual_savings_table_df = pd.DataFrame(actual_savings_table, columns=[Report1GUI.DATE, 'Actual Savings'])
         # Remove any data before the report start date
         actual_savings_table_df = actual_savings_table_df[actual_savings_table_df['Date'] >= start_report_date]
 
-        actual_total_table = self._get_total_table()
         actual_total_table_df = pd.DataFrame(actual_total_table, columns=[Report1GUI.DATE, 'Actual Total'])
         # Remove any data before the report start date
         actual_total_table_df = actual_total_table_df[actual_total_table_df['Date'] >= start_report_date]
@@ -6072,6 +6172,7 @@ class Report1GUI(GUIBase):
                                                     savings_table_df]
 
     def _get_income(self, table_df_list):
+        import pandas as pd
         taxable_df_list = []
         non_taxable_df_list = []
         for table_df in table_df_list:
@@ -6120,6 +6221,7 @@ class Report1GUI(GUIBase):
                   This assumes that the state pension is the only partners income. If not then
                   they should be treated separatley as it would get to complicated to create a
                   tool to mix two peoples finances including tax."""
+        import pandas as pd
         # Convert my pension to the same format as the other tables
         partner_state_pension_df = pd.DataFrame(self._get_predicted_state_pension(monthly_datetime_list, report_start_date, False), columns=['Date', 'Amount'])
         # Convert Date str instance to datetime instance
@@ -6144,6 +6246,7 @@ class Report1GUI(GUIBase):
         return partner_state_pension_df
 
     def _get_my_df_list(self, monthly_datetime_list, report_start_date):
+        import pandas as pd
         my_personal_pension_drawdown_df = pd.DataFrame(self._pension_withdrawals_table.rows)
         if len(my_personal_pension_drawdown_df) == 0:
             raise Exception("The Pension withdrawals table must have at least one entry. This can be of any, amount including 0.")
@@ -6195,6 +6298,7 @@ class Report1GUI(GUIBase):
 
     def _add_plot_pane_2_data(self, result_dict, monthly_datetime_list, report_start_date):
         """@brief Add the data needed for the traces in plot pane 2 (second one down from the top)."""
+        import pandas as pd
 
         partner_state_pension_df = self._get_partner_state_pension_df(monthly_datetime_list, report_start_date)
 
@@ -6257,6 +6361,7 @@ class Report1GUI(GUIBase):
 
     def _add_plot_pane_3_data(self, result_dict, monthly_datetime_list, report_start_date):
         """@brief Add the data needed for the traces in plot pane 3 (second one down from the top)."""
+        import pandas as pd
         savings_prediction_table_df = self._get_predicted_savings(monthly_datetime_list, report_start_date, self._savings_withdrawals_table.rows)
         savings_prediction_table_df['Yearly Savings Growth'] = savings_prediction_table_df['Yearly Growth']
         # Extract the year
@@ -6279,6 +6384,7 @@ class Report1GUI(GUIBase):
 
     def _add_plot_pane_4_data(self, result_dict):
         """@brief Add the data needed for the traces in plot pane 4 (second one down from the top)."""
+        import pandas as pd
         savings_withdrawal_table_df = pd.DataFrame(self._savings_withdrawals_table.rows, columns=[Report1GUI.DATE, 'Amount'])
         savings_withdrawal_table_df[Report1GUI.DATE] = pd.to_datetime(savings_withdrawal_table_df[Report1GUI.DATE], format='%d-%m-%Y')
         savings_withdrawal_table_df['Savings Withdrawals'] = savings_withdrawal_table_df['Amount']
@@ -6339,6 +6445,7 @@ class Report1GUI(GUIBase):
                     0 = A datetime instance of the start of the tax year.
                     1 = A datetime instance of the end of the tax year.
                     2 = A String detailing the tax year (E.G 2024-2025)."""
+        import pandas as pd
         year = _date.year
         # If before April 6, belongs to previous tax year
         if _date < pd.Timestamp(year=year, month=4, day=6):
@@ -6361,22 +6468,49 @@ class Report1GUI(GUIBase):
         self._add_plot_pane_4_data(result_dict)
         return result_dict
 
-    def _get_total_table(self):
-        """@return A table that contains the total amounts in our personal
+    def _get_total_table(self, pp_table=None, savings_table=None):
+        """@param pp_table The amalgamated table of all personal pensions if already built.
+           @param savings_table The amalgamated table of all savings accounts if already built.
+                                If either table is None the total is built from all the accounts.
+           @return A table that contains the total amounts in our personal
                    pension and savings over time. This is not predicted but
                    comprises the total of all personal pension and savings accounts."""
         start_report_date = self._get_report_start_date()
-        pp_dfl = self._get_personal_pension_pd_dfl()
-        savings_dfl = self._get_savings_pd_dfl()
-        total_table = self._get_amalgamated_table(pp_dfl+savings_dfl)
+        if pp_table is None or savings_table is None:
+            pp_dfl = self._get_personal_pension_pd_dfl()
+            savings_dfl = self._get_savings_pd_dfl()
+            total_table = self._get_amalgamated_table(pp_dfl+savings_dfl)
+        else:
+            total_table = self._get_total_of_tables(pp_table, savings_table)
         return FuturePlotGUI.ClipTable(total_table, start_report_date)
 
+    def _get_total_of_tables(self, *tables):
+        """@brief Get the total of tables that have already been amalgamated. This gives the same
+                  result as amalgamating all of their accounts together as each table already holds
+                  the total at every date that one of its accounts changed.
+           @param tables The amalgamated (date, total) tables.
+           @return The amalgamated (date, total) table of the sum of the tables."""
+        import pandas as pd
+        dataframe_list = [pd.DataFrame(FuturePlotGUI.Table2Dict(table)) for table in tables if table]
+        return self._get_amalgamated_table(dataframe_list)
+
+    def _get_account_tables(self):
+        """@brief Get the personal pension, savings and total tables reading each account once.
+           @return A tuple of the tables returned by _get_personal_pension_table(),
+                   _get_savings_table() and _get_total_table()."""
+        pp_table = self._get_amalgamated_table(self._get_personal_pension_pd_dfl())
+        savings_table = self._get_amalgamated_table(self._get_savings_pd_dfl())
+        return (self._get_personal_pension_table(pp_table),
+                self._get_savings_table(savings_table=savings_table),
+                self._get_total_table(pp_table, savings_table))
+
     def _get_actual_monthly_spending_table(self, report_start_date):
         """@brief Get a table containing the monthly spending.
            @return A pandas dataframe, each row containing
                    Date: A datetime instance
                    Amount: A float value
                    Yearly Average: The average monthly spending for the year"""
+        import pandas as pd
         monthly_spending_dict = self._config.get_monthly_spending_dict()
         monthly_spending_table = monthly_spending_dict[Finances.MONTHLY_SPENDING_TABLE]
         # Create DataFrame
@@ -6390,7 +6524,7 @@ class Report1GUI(GUIBase):
         # Ensure the monthly spending table does not include dates before the report start date.
         output_table = []
         for row in monthly_spending_table:
-            row_date = datetime.strptime(row[0], '%d-%m-%Y')
+            row_date = GUIBase.ParseDate(row[0])
             if row_date >= report_start_date:
                 spending_this_month = row[1]
                 avg_spending_this_year = avg_per_year.loc[avg_per_year['Year'] == row_date.year, 'Amount'].iloc[0]
@@ -6411,6 +6545,7 @@ class Report1GUI(GUIBase):
            @return A pandas dataframe, each row containing
                    Date: A datetime instance
                    Amount: A float value"""
+        import pandas as pd
         savings_table = self._get_savings_table(start_date_limited=False)
         initial_savings_value = self._get_initial_value(savings_table, report_start_date)
         savings_value = initial_savings_value
@@ -6455,19 +6590,23 @@ class Report1GUI(GUIBase):
         monthly_increase = savings_amount * ((1 + annual_rate) ** (1 / 12) - 1)
         return monthly_increase
 
-    def _get_savings_table(self, start_date_limited=True):
-        """@param start_date The start date. Dates before this are ignored.
+    def _get_savings_table(self, start_date_limited=True, savings_table=None):
+        """@param start_date_limited If True dates before the report start date are removed.
+           @param savings_table The amalgamated table of all savings accounts if already built.
+                                If None it is built from the savings accounts.
            @return A table that contains the total amounts in all our savings accounts
                    over time. This is not predicted but comprises the total of all
                    savings accounts."""
         start_report_date = self._get_report_start_date()
-        savings_dfl = self._get_savings_pd_dfl()
-        savings_table = self._get_amalgamated_table(savings_dfl)
+        if savings_table is None:
+            savings_dfl = self._get_savings_pd_dfl()
+            savings_table = self._get_amalgamated_table(savings_dfl)
         if start_date_limited:
             return FuturePlotGUI.ClipTable(savings_table, start_report_date)
         return savings_table
 
     def _get_savings_pd_dfl(self):
+        import pandas as pd
         # Build a list of pandas dataframes
         pd_dataframe_list = []
         bank_accounts_dict_list = self._config.get_bank_accounts_dict_list()
@@ -6490,6 +6629,7 @@ class Report1GUI(GUIBase):
            @return A pandas dataframe, each row containing
                    Date: A datetime instance
                    Amount: A float value"""
+        import pandas as pd
         pp_table = self._get_personal_pension_table()
         initial_personal_pension_value = self._get_initial_value(pp_table, report_start_date)
         personal_pension_value = initial_personal_pension_value
@@ -6530,18 +6670,22 @@ class Report1GUI(GUIBase):
         total = 0.0
         for row in table:
             # Parse the date string (assumed to be in DD-MM-YYYY format)
-            date = datetime.strptime(row[Report1GUI.DATE], '%d-%m-%Y')
+            date = GUIBase.ParseDate(row[Report1GUI.DATE])
             if date.month == month and date.year == year:
                 total += row['Amount']
         return total
 
-    def _get_personal_pension_table(self):
-        """@return A table that contains the total amounts in all our personal pension
+    def _get_personal_pension_table(self, pp_table=None):
+        """@param pp_table The amalgamated table of all personal pensions if already built.
+                           If None it is built from the pension accounts.
+           @return A table that contains the total amounts in all our personal pension
                    accounts over time. This is not predicted but comprises the total of all
                    pensions."""
+        import pandas as pd
         start_report_date = self._get_report_start_date()
-        pp_dfl = self._get_personal_pension_pd_dfl()
-        pp_table = self._get_amalgamated_table(pp_dfl)
+        if pp_table is None:
+            pp_dfl = self._get_personal_pension_pd_dfl()
+            pp_table = self._get_amalgamated_table(pp_dfl)
         pp_table = FuturePlotGUI.ClipTable(pp_table, start_report_date)
         # The pp_table holds the data for all personal pensions. The first date
         # may not be the report start date but as far as we're aware first amount is the
@@ -6557,6 +6701,7 @@ class Report1GUI(GUIBase):
         return pp_table
 
     def _get_personal_pension_pd_dfl(self):
+        import pandas as pd
         # Build a list of pandas dataframes
         pd_dataframe_list = []
         pension_dict_list = self._config.get_pension_dict_list()
@@ -6581,6 +6726,7 @@ class Report1GUI(GUIBase):
                                      If False then the table returned has the same Date
                                      column but has separate columns for the total of
                                      each of the input tables."""
+        import pandas as pd
         table_index = 0
         for df in dataframe_list:
             # Convert Report1GUI.DATE column to datetime
@@ -6597,7 +6743,10 @@ class Report1GUI(GUIBase):
             # Merge all tables in the list
             merged_table = dataframe_list[0]
             for table in dataframe_list[1:]:
-                merged_table = merged_table.merge(table, on=Report1GUI.DATE, how='outer').sort_values(by="Date")
+                merged_table = merged_table.merge(table, on=Report1GUI.DATE, how='outer')
+            # Sort once all the tables are merged rather than after each merge.
+            if len(dataframe_list) > 1:
+                merged_table = merged_table.sort_values(by="Date")
             # Fill NaN values with previous row value if NaN
             # merged_table.fillna(method='ffill', inplace=True)
             merged_table.ffill(inplace=True)
@@ -6608,7 +6757,8 @@ class Report1GUI(GUIBase):
             # Sum all the columns so that we know the total value each time it changes
             merged_table['Total'] = merged_table.drop(columns=[Report1GUI.DATE]).sum(axis=1)
 
-            merged_table[Report1GUI.DATE] = merged_table[Report1GUI.DATE].apply(lambda x: x.to_pydatetime())
+            # The Date column is left as datetime64. Converting each value to a python datetime here
+            # is wasted as pandas infers the column back to datetime64 and the rows hold Timestamps.
 
             if return_total_table:
                 # Reset the Date index column so it is appears as any other table column
@@ -6633,6 +6783,7 @@ class Report1GUI(GUIBase):
            Net Income
 
            columns"""
+        import pandas as pd
         # Aggregate by date
         totals = defaultdict(float)
         for row in all_income_rows:
@@ -6742,7 +6893,7 @@ class Report1GUI(GUIBase):
             future_table = []
             date_value_table = self._convert_table(pension_dict[PensionGUI.PENSION_TABLE])
             state_pension_start_date_str = pension_dict[PensionGUI.STATE_PENSION_START_DATE]
-            state_pension_start_date = datetime.strptime(state_pension_start_date_str, '%d-%m-%Y')
+            state_pension_start_date = GUIBase.ParseDate(state_pension_start_date_str)
             last_datetime = datetime_list[0]
             # Get the initial state pension. We want the value as close (before) to the state pension state
             # date as possible. The user may enter values after this date for their state pension as time passes
@@ -6750,15 +6901,20 @@ class Report1GUI(GUIBase):
             # If the user enters values after the pension start date these are ignored for predictive
             # purposes.
             state_pension_amount = self._get_initial_value(date_value_table, initial_date=state_pension_start_date)
+            yearly_increase_list = self._get_param_value(FuturePlotGUI.STATE_PENSION_YEARLY_INCREASE_LIST)
+            # The owner is alive until they die and then not, so find how many months they are
+            # alive with a binary search rather than checking the alive state every month.
+            alive_month_count = bisect.bisect_left(datetime_list, True,
+                                                   key=lambda _datetime: not (self._is_pension_owner_alive(owner, _datetime) and
+                                                                              self._is_partner_alive(owner, _datetime)))
             year_index = 0
             receiving_state_pension = False
-            for this_datetime in datetime_list:
+            for index, this_datetime in enumerate(datetime_list):
                 # If the state pension changes, this occurs on 6 Apr for the new tax year.
                 # We approximate this to the 1 may as we won't get a full months pension until then.
                 # This means that the prediction will miss some of the first months state pension but
                 # we accept this for purposes of this report.
                 if this_datetime.month == 5 and year_index > 0:
-                    yearly_increase_list = self._get_param_value(FuturePlotGUI.STATE_PENSION_YEARLY_INCREASE_LIST)
                     state_pension_amount = self._calc_new_account_value(state_pension_amount,
                                                                         yearly_increase_list,
                                                                         year_index)
@@ -6773,12 +6929,9 @@ class Report1GUI(GUIBase):
                 # We assume that the partner receives none of the state pension. This may not be
                 # the case as pension rules prior to 2016 but for the purposes of this tool
                 # this is the assumption.
-                if not self._is_pension_owner_alive(owner, this_datetime):
-                    receiving_state_pension = False
-
                 # We assume that if your partner dies then their state pension stops. You may get some
                 # money from the DWP but for purposes of this prediction we assume worst case.
-                if not self._is_partner_alive(owner, this_datetime):
+                if index >= alive_month_count:
                     receiving_state_pension = False
 
                 if receiving_state_pension:
@@ -6797,19 +6950,10 @@ class Report1GUI(GUIBase):
         """@brief Convert a table of rows = <date str>,<value str> to a table of rows = <datetime>,<float>
             @param date_value_table A list of tuples where each tuple contains a date string and a value string.
             @return A list of tuples where each tuple contains a datetime object and a float value."""
-        converted_table = []
-        # date_value_table may have two columns or three (added a notes field)
-        # but we're only interested in the first two here.
-        for row in date_value_table:
-            date_str = row[0]
-            value_str = row[1]
-            info_str = ""
-            if len(row) > 2:
-                info_str = row[2]
-            date_obj = datetime.strptime(date_str, '%d-%m-%Y')
-            value_float = float(value_str)
-            converted_table.append((date_obj, value_float, info_str))
-        return converted_table
+        # date_value_table may have two columns or three (added a notes field).
+        # The same table dates are converted on every calculation so use the cached parser.
+        return [(GUIBase.ParseDate(row[0]), float(row[1]), row[2] if len(row) > 2 else "")
+                for row in date_value_table]
 
     def _get_initial_value(self, date_value_table, initial_date=None):
         """@brief Get the first value to be used from the table (date,value rows)
@@ -6889,7 +7033,7 @@ class Report1GUI(GUIBase):
         if len(rate_list) < 1:
             raise Exception("Rate list error. The rate_list must have at least one element.")
         if isinstance(rate_list, str):
-            rate_list = rate_list.split(',')
+            rate_list = GUIBase.ParseRateList(rate_list)
         if year_index >= 0 and year_index < len(rate_list):
             selected_rate = rate_list[year_index]
         else:
@@ -6947,7 +7091,7 @@ class Report1GUI(GUIBase):
         results = []
         for row in table:
             row['TABLE_TYPE'] = table_type
-            dt = datetime.strptime(row[Report1GUI.DATE], '%d-%m-%Y')
+            dt = GUIBase.ParseDate(row[Report1GUI.DATE])
             if dt.year == year:
                 results.append(row)
         return results
@@ -6956,15 +7100,16 @@ class Report1GUI(GUIBase):
         """@return The rows in the table that match the month and year."""
         results = []
         for row in table:
-            dt = datetime.strptime(row[Report1GUI.DATE], '%d-%m-%Y')
+            dt = GUIBase.ParseDate(row[Report1GUI.DATE])
             if dt.month == month and dt.year == year:
                 results.append(row)
         return results
 
     def _get_my_max_date(self):
         """@return The maximum date I (for trhe purposes of this report) hope to be alive."""
+        from dateutil.relativedelta import relativedelta
         my_dob_str = self._get_param_value(Report1GUI.MY_DATE_OF_BIRTH)
-        my_dob = datetime.strptime(my_dob_str, '%d-%m-%Y')
+        my_dob = GUIBase.ParseDate(my_dob_str)
         my_max_age = int(self._get_param_value(Report1GUI.MY_MAX_AGE))
         my_max_date = my_dob + relativedelta(years=my_max_age)
         return my_max_date
@@ -6972,10 +7117,11 @@ class Report1GUI(GUIBase):
     def _get_partner_max_date(self):
         """@return The maximum date my partner (for the purposes of this report) hopes to be alive or None
                    if no partner details entered into the retirement prediction form."""
+        from dateutil.relativedelta import relativedelta
         partner_max_date = None
         partner_dob_str = self._get_param_value(Report1GUI.PARTNER_DATE_OF_BIRTH)
         if partner_dob_str and len(partner_dob_str) > 0:
-            partner_dob = datetime.strptime(partner_dob_str, '%d-%m-%Y')
+            partner_dob = GUIBase.ParseDate(partner_dob_str)
             partner_max_age = int(self._get_param_value(Report1GUI.PARTNER_MAX_AGE))
             partner_max_date = partner_dob + relativedelta(years=partner_max_age)
         return partner_max_date
@@ -6983,19 +7129,19 @@ class Report1GUI(GUIBase):
     def _get_max_date(self):
         """@brief Get the maximum date we need to plan for.
            @return a datetime instance of the max year."""
+        # This only revalidates the fields if they have changed since they were last stored.
         self._update_dict_from_gui()
-        my_max_date = self._get_my_max_date()
-        max_date = my_max_date
-
+        max_date = self._get_my_max_date()
+        # The partner max date is None if no partner details were entered.
         partner_max_date = self._get_partner_max_date()
-        if partner_max_date is not None and partner_max_date > my_max_date:
-            max_date = partner_max_date
+        if partner_max_date is not None:
+            max_date = max(max_date, partner_max_date)
 
         return max_date
 
     def _get_report_start_date(self):
         """@return The date entered as the report start date."""
-        return datetime.strptime(self._get_param_value(Report1GUI.REPORT_START_DATE), '%d-%m-%Y')
+        return GUIBase.ParseDate(self._get_param_value(Report1GUI.REPORT_START_DATE))
 
     def _get_final_year(self):
         """@brief Get the final year of the prediction.
@@ -7035,6 +7181,7 @@ class Report1GUI(GUIBase):
            @param last_value_of_year If the user wishes to show the results by year and last_value_of_year == True
                   then the last value of the year is stored as the value for the year.
                   If last_value_of_year == False then the value for the year is the sum of all the values on each month."""
+        import pandas as pd
         if self._plot_by_year():
             # convert to a table that has one row for each year and the other monthly columns hold the last value that year
             # Group by year, take the last row in each year
@@ -7161,6 +7308,7 @@ class Report1GUI(GUIBase):
                         bar_chart=False,
                         plot_by_year=False):
         # If the user wishes to limit the max year, then delete all rows after this year
+        import plotly.graph_objects as go
         fig = go.Figure()
         plot_dict = {}
         dataframe_index = 0
@@ -7353,6 +7501,7 @@ class MonteCarloPlotGUI(GUIBase):
 
     def init_page(self):
         """@brief Render the Monte Carlo plot page."""
+        import plotly.graph_objects as go
         obj_list = MonteCarloPickler().get()
         if obj_list is None:
             return
@@ -7504,6 +7653,7 @@ class Plot1GUI(GUIBase):
         """@brief group the values in the plot_table by year and return the resultant table.
            @param plot_table A 2D table (list of rows) containing the predictions.
            @return plot_table The resultant plot table."""
+        import pandas as pd
         # First we convert the plot_table to sum the columns excluding the date, total, pension total and savings total columns.
         # The last value for each year is returned in the total, pension total and savings total columns.
 
@@ -7562,6 +7712,7 @@ class Plot1GUI(GUIBase):
             2 = total table
             3 = monthly spending table
             """
+        import pandas as pd
         table = reality_tables[3]
 
         # Load into a DataFrame
@@ -7642,20 +7793,17 @@ class Plot1GUI(GUIBase):
             # A plot of energy costs is added to this container when the users requests it
             plot_panel_4 = ui.element('div').style('width: 100%;')
 
-        plot_names = ['Total', 'Personal Pension', 'Savings']
-        plot_dict = {plot_names[0]: [],
-                     plot_names[1]: [],
-                     plot_names[2]: []}
+        # Transpose the rows of the plot table into columns once so that each plot trace
+        # is built from a single column rather than walking every row for each plot.
+        columns = list(zip(*self._plot_table))
+        if not columns:
+            columns = [()] * 10
+        dates = columns[0]
 
-        for row in self._plot_table:
-            _date = row[0]
-            total = row[1]
-            personal_pension = row[2]
-            savings = row[3]
-
-            plot_dict[plot_names[0]].append((_date, total))
-            plot_dict[plot_names[1]].append((_date, personal_pension))
-            plot_dict[plot_names[2]].append((_date, savings))
+        plot_names = ['Total', 'Personal Pension', 'Savings']
+        plot_dict = {plot_names[0]: list(zip(dates, columns[1])),
+                     plot_names[1]: list(zip(dates, columns[2])),
+                     plot_names[2]: list(zip(dates, columns[3]))}
 
         reality_tables = None
         if self._reality_tables and len(self._reality_tables) == 4:
@@ -7672,19 +7820,9 @@ class Plot1GUI(GUIBase):
                       final_year=self._final_year)
 
         plot_names = ['Monthly budget/income', 'Total state pension', 'Predicted Spending']
-        plot_dict = {plot_names[0]: [],
-                     plot_names[1]: [],
-                     plot_names[2]: []}
-
-        for row in self._plot_table:
-            _date = row[0]
-            monthly_income = row[4]
-            monthly_state_pension = row[5]
-            monthly_spending = row[9]
-
-            plot_dict[plot_names[0]].append((_date, monthly_income))
-            plot_dict[plot_names[1]].append((_date, monthly_state_pension))
-            plot_dict[plot_names[2]].append((_date, monthly_spending))
+        plot_dict = {plot_names[0]: list(zip(dates, columns[4])),
+                     plot_names[1]: list(zip(dates, columns[5])),
+                     plot_names[2]: list(zip(dates, columns[9]))}
 
         monthly_spending_table = None
         if self._reality_tables and len(self._reality_tables) == 4:
@@ -7697,13 +7835,7 @@ class Plot1GUI(GUIBase):
                       monthly_spending_table=monthly_spending_table)
 
         plot_names = ['Savings Interest']
-        plot_dict = {plot_names[0]: []}
-
-        for row in self._plot_table:
-            _date = row[0]
-            savings_interest = row[6]
-
-            plot_dict[plot_names[0]].append((_date, savings_interest))
+        plot_dict = {plot_names[0]: list(zip(dates, columns[6]))}
 
         self._do_plot(plot_panel_3,
                       plot_dict,
@@ -7711,16 +7843,8 @@ class Plot1GUI(GUIBase):
                       final_year=self._final_year)
 
         plot_names = ['Pension withdrawal', 'Savings withdrawal']
-        plot_dict = {plot_names[0]: [],
-                     plot_names[1]: []}
-
-        for row in self._plot_table:
-            _date = row[0]
-            savings_withdrawal = row[7]
-            pensions_withdrawal = row[8]
-
-            plot_dict[plot_names[0]].append((_date, pensions_withdrawal))
-            plot_dict[plot_names[1]].append((_date, savings_withdrawal))
+        plot_dict = {plot_names[0]: list(zip(dates, columns[8])),
+                     plot_names[1]: list(zip(dates, columns[7]))}
 
         self._do_plot(plot_panel_4,
                       plot_dict,
@@ -7780,6 +7904,7 @@ class Plot1GUI(GUIBase):
                              This allows the caller to limit the length of the plot prediction.
                              If -1 entered then no limit is placed on the plot.
            @param monthly_spending_table The monthly spending table."""
+        import plotly.graph_objects as go
         fig = go.Figure()
 
         if reality_tables:
@@ -7821,7 +7946,7 @@ class Plot1GUI(GUIBase):
             x, y = zip(*monthly_spending_table)
             try:
                 # Convert date string list to datetime instances
-                datetimes = [datetime.strptime(date, "%d-%m-%Y") for date in x]
+                datetimes = [GUIBase.ParseDate(date) for date in x]
             except TypeError:
                 years = [int(s) for s in x]
                 datetimes = years
@@ -7856,7 +7981,7 @@ class Plot1GUI(GUIBase):
                 yearly_average_dict = self._get_yearly_average_dict(monthly_spending_table)
                 y_values = []
                 for _date_str in x:
-                    _date = datetime.strptime(_date_str, '%d-%m-%Y')
+                    _date = GUIBase.ParseDate(_date_str)
                     if _date.year in yearly_average_dict:
                         y_values.append(yearly_average_dict[_date.year])
                     else: